@@ -0,0 +1,123 @@
+import contextlib
+import fcntl
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from spotipy.cache_handler import CacheFileHandler
+from spotipy.oauth2 import SpotifyOAuth
+
+# Below this many seconds of validity a caller waits for a fresh token
+MIN_TOKEN_VALIDITY = 60
+
+
+class LockedCacheFileHandler(CacheFileHandler):
+    """spotipy token cache file guarded by an flock on "<cache>.lock".
+
+    Concurrent sak processes read and write the token under the lock, so none
+    of them sees a half-written file. The lock is re-entrant within a thread,
+    which lets a refresh hold it across the read and the write-back.
+    """
+
+    def __init__(self, cache_path: Path):
+        # Absolute, so a daemon that changes directory per command keeps one token
+        path = Path(cache_path).resolve()
+        super().__init__(cache_path=str(path))
+        self.lock_path = path.with_name(path.name + ".lock")
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd: Optional[int] = None
+
+    @contextlib.contextmanager
+    def lock(self) -> Iterator[None]:
+        with self._thread_lock:
+            if self._depth == 0:
+                self._fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    os.close(self._fd)  # Closing the descriptor drops the flock
+                    self._fd = None
+
+    def get_cached_token(self):
+        with self.lock():
+            return super().get_cached_token()
+
+    def save_token_to_cache(self, token_info) -> None:
+        with self.lock():
+            super().save_token_to_cache(token_info)
+
+
+class TokenManager:
+    """spotipy auth manager that serves the access token from memory.
+
+    Within refresh_ahead seconds of expiry one background thread refreshes the
+    token while requests keep using the current one; callers only block when it
+    has less than MIN_TOKEN_VALIDITY left, and then share a single refresh.
+    Refreshes run under the cache file lock and first re-read the file, so a
+    token another process has just refreshed is reused rather than refreshed again.
+    """
+
+    def __init__(
+        self,
+        oauth: SpotifyOAuth,
+        refresh_ahead: float,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.oauth = oauth
+        self.refresh_ahead = refresh_ahead
+        self.refreshes = 0
+        self._clock = clock
+        self._token_info: Optional[dict] = None
+        self._lock = threading.Lock()
+        self._background: Optional[threading.Thread] = None
+        self._background_lock = threading.Lock()
+
+    def get_access_token(self, as_dict: bool = False):
+        info = self._token_info
+        remaining = self._remaining(info)
+        if remaining <= MIN_TOKEN_VALIDITY:
+            info = self._refresh(info, MIN_TOKEN_VALIDITY)
+        elif remaining <= self.refresh_ahead:
+            self._refresh_in_background(info)
+        return info if as_dict else info["access_token"]
+
+    def _remaining(self, info: Optional[dict]) -> float:
+        return info["expires_at"] - self._clock() if info else float("-inf")
+
+    def _refresh(self, stale: Optional[dict], min_validity: float) -> dict:
+        with self._lock:
+            info = self._token_info
+            if info is not stale and self._remaining(info) > min_validity:
+                return info  # Another thread refreshed while this one waited
+            handler = self.oauth.cache_handler
+            with handler.lock():
+                info = handler.get_cached_token()
+                if self._remaining(info) <= min_validity:
+                    info = info or stale
+                    if info is None:
+                        raise RuntimeError("No cached Spotify token; run `sak status` to log in.")
+                    info = self.oauth.refresh_access_token(info["refresh_token"])
+                    self.refreshes += 1
+            self._token_info = info
+            return info
+
+    def _refresh_in_background(self, stale: dict) -> None:
+        with self._background_lock:
+            if self._background is not None and self._background.is_alive():
+                return
+            self._background = threading.Thread(
+                target=self._refresh_quietly, args=(stale,), daemon=True
+            )
+            self._background.start()
+
+    def _refresh_quietly(self, stale: dict) -> None:
+        # On failure, the caller that finds the token nearly expired retries in the foreground
+        with contextlib.suppress(Exception):
+            self._refresh(stale, self.refresh_ahead)
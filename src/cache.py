@@ -0,0 +1,267 @@
+import json
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .config import settings
+from .stats import get_run_stats
+from .track import SavedTrack, Track, saved_track
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS playlist_tracks (
+    playlist_id TEXT PRIMARY KEY,
+    snapshot_id TEXT NOT NULL,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS user_playlist_names (
+    owner TEXT NOT NULL,
+    name TEXT NOT NULL,
+    playlist_id TEXT NOT NULL,
+    PRIMARY KEY (owner, name)
+);
+CREATE TABLE IF NOT EXISTS user_liked_tracks (
+    owner TEXT PRIMARY KEY,
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cache_meta (
+    key TEXT PRIMARY KEY,
+    value REAL NOT NULL
+);
+"""
+
+_SEARCH_SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_results (
+    query TEXT PRIMARY KEY,
+    data TEXT,
+    expires_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    size INTEGER NOT NULL
+)
+"""
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class PlaylistCache:
+    """SQLite cache of playlist track lists, keyed by playlist ID and snapshot_id.
+
+    Only one snapshot per playlist is kept. When the total stored size exceeds
+    max_bytes, the least recently used playlists are evicted first.
+    Also persists each account's playlist name → ID index and last synced copy
+    of Liked Songs, keyed by an owner string naming the API and user they came from.
+    """
+
+    def __init__(self, path: Path, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=10)
+
+    def get(self, playlist_id: str, snapshot_id: str) -> Optional[List[Track]]:
+        """Return the cached tracks for this snapshot, or None on a miss."""
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT data FROM playlist_tracks WHERE playlist_id = ? AND snapshot_id = ?",
+                (playlist_id, snapshot_id),
+            ).fetchone()
+            get_run_stats().count("playlist_cache.misses" if row is None else "playlist_cache.hits")
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE playlist_tracks SET last_used = ? WHERE playlist_id = ?",
+                (time.time(), playlist_id),
+            )
+        return [Track.from_row(r) for r in json.loads(zlib.decompress(row[0]))]
+
+    def put(self, playlist_id: str, snapshot_id: str, tracks: List[Track]) -> None:
+        """Store tracks for a snapshot, replacing any older snapshot of the playlist."""
+        rows = [t.to_row() for t in tracks]
+        data = zlib.compress(json.dumps(rows, separators=(",", ":")).encode())
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO playlist_tracks VALUES (?, ?, ?, ?, ?)",
+                (playlist_id, snapshot_id, data, len(data), time.time()),
+            )
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM playlist_tracks").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = conn.execute(
+            "SELECT playlist_id, size FROM playlist_tracks ORDER BY last_used"
+        ).fetchall()
+        for playlist_id, size in rows:
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM playlist_tracks WHERE playlist_id = ?", (playlist_id,))
+            total -= size
+
+    def get_liked(self, owner: str) -> Optional[List[SavedTrack]]:
+        """Return the stored saved-track items (newest first), or None if never synced."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT data FROM user_liked_tracks WHERE owner = ?", (owner,)
+            ).fetchone()
+        get_run_stats().count("liked_cache.misses" if row is None else "liked_cache.hits")
+        if row is None:
+            return None
+        return [saved_track(item) for item in json.loads(zlib.decompress(row[0]))]
+
+    def put_liked(self, owner: str, items: List[SavedTrack]) -> None:
+        """Replace the stored Liked Songs items."""
+        rows = [[track and track.to_row(), added_at] for track, added_at in items]
+        data = zlib.compress(json.dumps(rows, separators=(",", ":")).encode())
+        with closing(self._connect()) as conn, conn:
+            conn.execute("INSERT OR REPLACE INTO user_liked_tracks VALUES (?, ?)", (owner, data))
+
+    def get_names(self, owner: str) -> Optional[Tuple[float, Dict[str, str]]]:
+        """Return (fetched_at, name → ID) for owner's stored index, or None if never saved."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT value FROM cache_meta WHERE key = ?", (f"names_fetched_at:{owner}",)
+            ).fetchone()
+            if row is None:
+                return None
+            names = dict(conn.execute(
+                "SELECT name, playlist_id FROM user_playlist_names WHERE owner = ?", (owner,)
+            ))
+        return row[0], names
+
+    def put_names(self, owner: str, names: Dict[str, str], fetched_at: float) -> None:
+        """Replace owner's stored name index."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM user_playlist_names WHERE owner = ?", (owner,))
+            conn.executemany(
+                "INSERT INTO user_playlist_names VALUES (?, ?, ?)",
+                ((owner, name, playlist_id) for name, playlist_id in names.items()),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_meta VALUES (?, ?)",
+                (f"names_fetched_at:{owner}", fetched_at),
+            )
+
+    def add_name(self, owner: str, name: str, playlist_id: str) -> None:
+        """Record a single playlist in owner's stored name index."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO user_playlist_names VALUES (?, ?, ?)",
+                (owner, name, playlist_id),
+            )
+
+
+def normalize_search_query(artist: str, title: str) -> str:
+    """Build the artist:/track: search query used as the search cache key."""
+    artist = _WHITESPACE_RE.sub(" ", artist).strip().casefold()
+    title = _WHITESPACE_RE.sub(" ", title).strip().casefold()
+    return f"artist:{artist} track:{title}"
+
+
+class SearchCache:
+    """SQLite cache of global search results, keyed by normalized query.
+
+    Found tracks live for ttl seconds and "Not found" results for negative_ttl.
+    Least recently used entries are evicted once the stored size exceeds max_bytes.
+    Safe to share between search worker threads; hits and misses are counted.
+    """
+
+    EVICT_EVERY = 256  # Puts between size checks
+
+    def __init__(self, path: Path, ttl: float, negative_ttl: float, max_bytes: int):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._puts = 0
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute(_SEARCH_SCHEMA)
+
+    def get(self, query: str) -> Tuple[bool, Optional[Track]]:
+        """Return (hit, track); a hit with track None is a cached "Not found"."""
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT data FROM search_results WHERE query = ? AND expires_at > ?",
+                (query, now),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                get_run_stats().count("search_cache.misses")
+                return False, None
+            self.hits += 1
+            get_run_stats().count("search_cache.hits")
+            self._conn.execute(
+                "UPDATE search_results SET last_used = ? WHERE query = ?", (now, query)
+            )
+        return True, None if row[0] is None else Track.from_row(json.loads(row[0]))
+
+    def put(self, query: str, track: Optional[Track]) -> None:
+        """Store a search result; track None records a "Not found"."""
+        now = time.time()
+        data = None if track is None else json.dumps(track.to_row(), separators=(",", ":"))
+        ttl = self.negative_ttl if track is None else self.ttl
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_results VALUES (?, ?, ?, ?, ?)",
+                (query, data, now + ttl, now, len(query) + len(data or "")),
+            )
+            self._puts += 1
+            if self._puts % self.EVICT_EVERY == 0:
+                self._evict()
+
+    def _evict(self) -> None:
+        self._conn.execute("DELETE FROM search_results WHERE expires_at <= ?", (time.time(),))
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM search_results"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT query, size FROM search_results ORDER BY last_used")
+        stale = []
+        for query, size in rows:
+            if total <= self.max_bytes:
+                break
+            stale.append((query,))
+            total -= size
+        self._conn.executemany("DELETE FROM search_results WHERE query = ?", stale)
+
+    def close(self) -> None:
+        with self._lock:
+            self._evict()
+            self._conn.commit()
+            self._conn.close()
+
+
+def get_search_cache() -> SearchCache:
+    """Open the search result cache configured in settings."""
+    return SearchCache(
+        settings.SAK_CACHE_DIR / "search.sqlite3",
+        ttl=settings.SAK_SEARCH_CACHE_TTL,
+        negative_ttl=settings.SAK_SEARCH_CACHE_NEGATIVE_TTL,
+        max_bytes=settings.SAK_SEARCH_CACHE_MAX_MB * 1024 * 1024,
+    )
+
+
+def get_playlist_cache() -> PlaylistCache:
+    """Open the playlist cache configured in settings."""
+    return PlaylistCache(
+        settings.SAK_CACHE_DIR / "playlists.sqlite3",
+        settings.SAK_CACHE_MAX_MB * 1024 * 1024,
+    )
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import argparse
+import shlex
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional
+
+from ..track import Track
+from ..utils import LazyConsole, format_track
+from .playlist import (
+    add_track_stream,
+    get_playlist_track_uris,
+    iter_source_tracks,
+    move_track_stream,
+    resolve_or_create_playlist_id,
+    resolve_playlist_id,
+    search_tracks,
+)
+
+if TYPE_CHECKING:
+    import spotipy
+
+console = LazyConsole()
+
+SOURCE_STAGES = ("list", "search")
+SINK_STAGES = ("add", "move", "print")
+
+
+class _StageParser(argparse.ArgumentParser):
+    """argparse parser that raises ValueError instead of exiting."""
+
+    def __init__(self, prog: str):
+        super().__init__(prog=prog, add_help=False)
+
+    def error(self, message: str):
+        raise ValueError(f"{self.prog}: {message}")
+
+
+def _parsers() -> Dict[str, _StageParser]:
+    parsers = {name: _StageParser(name) for name in ("list", "search", "filter") + SINK_STAGES}
+
+    parsers["list"].add_argument("playlist")
+    parsers["list"].add_argument("--no-cache", action="store_true")
+
+    parsers["search"].add_argument("--in-playlist")
+    parsers["search"].add_argument("--no-cache", action="store_true")
+
+    parsers["filter"].add_argument("--artist")
+    parsers["filter"].add_argument("--title")
+    parsers["filter"].add_argument("--not-in")
+    parsers["filter"].add_argument("--unique", action="store_true")
+
+    parsers["add"].add_argument("playlist")
+    parsers["add"].add_argument("--create", action="store_true")
+
+    parsers["move"].add_argument("dest")
+    parsers["move"].add_argument("--from", dest="source")
+    parsers["move"].add_argument("--create", action="store_true")
+
+    parsers["print"].add_argument("--output", "-o", default="uri")
+    return parsers
+
+
+@dataclass
+class StageSpec:
+    name: str
+    args: argparse.Namespace
+
+
+@dataclass
+class _PipeState:
+    """What earlier stages learned that later ones need (the listed playlist for move)."""
+
+    stdin: Iterable[str]
+    source_id: Optional[str] = None
+
+
+def parse_stages(stages: List[str]) -> List[StageSpec]:
+    """Parse stage strings such as "list Inbox" or "filter --unique" into specs.
+
+    The first stage must produce tracks (list, search) and only the last may
+    write them (add, move, print); a missing sink defaults to print.
+    Raises ValueError for an invalid chain.
+    """
+    if not stages:
+        raise ValueError("No stages given")
+    parsers = _parsers()
+    specs = []
+    for stage in stages:
+        name, *argv = shlex.split(stage) or [""]
+        if name not in parsers:
+            raise ValueError(f"Unknown stage: {name!r}")
+        specs.append(StageSpec(name, parsers[name].parse_args(argv)))
+
+    if specs[0].name not in SOURCE_STAGES:
+        raise ValueError(f"First stage must be one of: {', '.join(SOURCE_STAGES)}")
+    if any(spec.name == "list" for spec in specs[1:]):
+        raise ValueError("list can only be the first stage")
+    for spec in specs[:-1]:
+        if spec.name in SINK_STAGES:
+            raise ValueError(f"{spec.name} can only be the last stage")
+    if specs[-1].name not in SINK_STAGES:
+        specs.append(StageSpec("print", parsers["print"].parse_args([])))
+    return specs
+
+
+def run_pipeline(sp: spotipy.Spotify, specs: List[StageSpec], stdin: Iterable[str]) -> int:
+    """Run parsed stages in this process, streaming track objects from stage to stage.
+
+    Stages are chained generators, so each one only pulls what the next asks
+    for; searches and writes keep their own bounded windows. Returns the number
+    of tracks that reached the final stage.
+    """
+    state = _PipeState(stdin=stdin)
+    tracks: Optional[Iterator[Track]] = None  # The first stage has no upstream
+    for spec in specs[:-1]:
+        tracks = _STAGES[spec.name](sp, spec.args, tracks, state)
+    sink = specs[-1]
+    return _SINKS[sink.name](sp, sink.args, tracks, state)
+
+
+def _list_stage(
+    sp: spotipy.Spotify, args: argparse.Namespace, tracks: None, state: _PipeState
+) -> Iterator[Track]:
+    state.source_id = resolve_playlist_id(sp, args.playlist)
+    # Read the whole playlist first so a later move from it cannot shift pages still unread
+    return iter(list(iter_source_tracks(sp, state.source_id, use_cache=not args.no_cache)))
+
+
+def _search_stage(
+    sp: spotipy.Spotify,
+    args: argparse.Namespace,
+    tracks: Optional[Iterator[Track]],
+    state: _PipeState,
+) -> Iterator[Track]:
+    playlist_id = resolve_playlist_id(sp, args.in_playlist) if args.in_playlist else None
+    if tracks is None:
+        lines: Iterable[str] = state.stdin
+    elif playlist_id is None:
+        # Tracks from earlier stages already carry URIs; nothing to search for
+        return tracks
+    else:
+        lines = (t.line for t in tracks)
+    found = search_tracks(sp, lines, playlist_id=playlist_id, use_cache=not args.no_cache)
+    return (t for t in found if t)
+
+
+def _filter_stage(
+    sp: spotipy.Spotify, args: argparse.Namespace, tracks: Iterator[Track], state: _PipeState
+) -> Iterator[Track]:
+    excluded = set()
+    if args.not_in:
+        excluded = get_playlist_track_uris(sp, resolve_playlist_id(sp, args.not_in))
+    artist = args.artist.casefold() if args.artist else None
+    title = args.title.casefold() if args.title else None
+    seen = set()
+    for track in tracks:
+        uri = track.uri
+        if uri in excluded or (args.unique and uri in seen):
+            continue
+        if artist and not any(artist in a.casefold() for a in track.artists):
+            continue
+        if title and title not in track.name.casefold():
+            continue
+        seen.add(uri)
+        yield track
+
+
+def _add_sink(
+    sp: spotipy.Spotify, args: argparse.Namespace, tracks: Iterator[Track], state: _PipeState
+) -> int:
+    if args.create:
+        playlist_id, _ = resolve_or_create_playlist_id(sp, args.playlist)
+    else:
+        playlist_id = resolve_playlist_id(sp, args.playlist)
+    added = add_track_stream(sp, (t.uri for t in tracks), playlist_id)
+    console.print(f"[green]Successfully added {added} tracks.[/]")
+    return added
+
+
+def _move_sink(
+    sp: spotipy.Spotify, args: argparse.Namespace, tracks: Iterator[Track], state: _PipeState
+) -> int:
+    if args.source:
+        source_id = resolve_playlist_id(sp, args.source)
+    elif state.source_id is not None:
+        source_id = state.source_id
+    else:
+        raise ValueError("move: --from is required when the pipe does not start with list")
+    if args.create:
+        dest_id, _ = resolve_or_create_playlist_id(sp, args.dest)
+    else:
+        dest_id = resolve_playlist_id(sp, args.dest)
+    moved = move_track_stream(sp, (t.uri for t in tracks), source_id, dest_id)
+    console.print(f"[green]Successfully moved {moved} tracks.[/]")
+    return moved
+
+
+def _print_sink(
+    sp: spotipy.Spotify, args: argparse.Namespace, tracks: Iterator[Track], state: _PipeState
+) -> int:
+    count = 0
+    for track in tracks:
+        print(format_track(track, args.output), flush=True)
+        count += 1
+    return count
+
+
+_STAGES: Dict[str, Callable[..., Iterator[Track]]] = {
+    "list": _list_stage,
+    "search": _search_stage,
+    "filter": _filter_stage,
+}
+_SINKS: Dict[str, Callable[..., int]] = {
+    "add": _add_sink,
+    "move": _move_sink,
+    "print": _print_sink,
+}
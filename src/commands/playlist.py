@@ -1,34 +1,329 @@
+from __future__ import annotations
+
 import concurrent.futures
+import itertools
+import os
 import re
-from typing import Generator, List, Optional, Set, Tuple
+import sqlite3
+import time
+import weakref
+from collections import OrderedDict, deque
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from ..cache import (
+    PlaylistCache,
+    SearchCache,
+    get_playlist_cache,
+    get_search_cache,
+    normalize_search_query,
+)
+from ..config import settings
+from ..journal import WriteJournal, get_write_journal, write_job_id
+from ..trace import span
+from ..track import TRACK_FIELDS, SavedTrack, Track, saved_track
+from ..track_index import TrackTokenIndex
+from ..utils import LazyConsole
 
-import spotipy
-from rapidfuzz import fuzz, process
-from rich.console import Console
+if TYPE_CHECKING:
+    import spotipy
 
-console = Console()
-err_console = Console(stderr=True)
+# spotipy, rapidfuzz and numpy are imported where used to keep CLI startup fast
+console = LazyConsole()
+err_console = LazyConsole(stderr=True)
 
 BATCH_SIZE = 100           # Spotify API per-call item limit
 LIKED_BATCH_SIZE = 50      # Spotify's limit for saved-tracks delete
-MAX_SEARCH_WORKERS = 10    # ThreadPoolExecutor concurrency for global search
+LIKED_PAGE_SIZE = 50       # Spotify's page limit for saved tracks
+LIKED_CONTAINS_SIZE = 50   # Spotify's ID limit for saved-tracks contains
+PLAYLISTS_PAGE_SIZE = 50   # Spotify's page limit for current-user playlists
+SEARCH_DEDUP_SIZE = 4096   # Recent distinct queries whose results are shared by repeats
+MAX_REMOVE_WORKERS = 4     # Source removals in flight while move_tracks adds later batches
+STREAM_CHUNK_SIZE = BATCH_SIZE * MAX_REMOVE_WORKERS  # Tracks buffered by streaming writers
 FUZZY_MATCH_THRESHOLD = 60  # WRatio score minimum for playlist-restricted search (0–100)
+FUZZY_MATCH_MAX_CELLS = 2_000_000  # Score-matrix cells per process.cdist call (~16 MB)
+FUZZY_BATCH_MIN_CPUS = 3   # Below this, cdist's full scoring loses to the extractOne loop
+TOKEN_INDEX_MIN_TRACKS = 10_000  # Playlists this large prune candidates via TrackTokenIndex
+TOKEN_INDEX_CACHE_SIZE = 4  # Token indexes kept in memory, keyed by (playlist, snapshot)
+
+# `fields` projections for playlist item pages: the paging keys iter_paged_items
+# needs, plus only the track data the caller uses (saved tracks have no filter)
+_PAGE_FIELDS = "total,limit,offset,next"
+PLAYLIST_TRACK_FIELDS = f"{_PAGE_FIELDS},items(track({TRACK_FIELDS}))"
+PLAYLIST_URI_FIELDS = f"{_PAGE_FIELDS},items(track(uri))"
 
 LIKED_SENTINEL = "liked"
 _SPOTIFY_ID_RE = re.compile(r"[A-Za-z0-9]{22}")
 
+_token_indexes: Dict[Tuple[str, str], TrackTokenIndex] = {}
+
+# Per-client account key for per-user cache rows: sp -> "<API base URL><user ID>"
+_cache_owners: weakref.WeakKeyDictionary[spotipy.Spotify, str] = weakref.WeakKeyDictionary()
+
+# Per-client in-memory playlist name index: sp -> (fetched_at, {name: playlist_id})
+_name_indexes: weakref.WeakKeyDictionary[spotipy.Spotify, Tuple[float, Dict[str, str]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _api_workers() -> int:
+    """Threads for a pool of API calls (search, page fan-out, contains lookups).
+
+    Sized from SAK_MAX_CONCURRENCY, so the rate governor's adaptive limit, not
+    the pool, decides how many requests are actually in flight.
+    """
+    return settings.SAK_MAX_CONCURRENCY
+
+
+def iter_paged_items(
+    sp: spotipy.Spotify,
+    fetch: Callable[..., dict],
+    *args,
+    limit: int,
+    reverse: bool = False,
+    first: Optional[dict] = None,
+    **kwargs,
+) -> Iterator[dict]:
+    """Yield every item of a paginated endpoint, in order (last to first when reverse).
+
+    The first page is fetched normally (or passed in as first, when the caller
+    already has it) and its `total` decides the remaining
+    offsets, which are fetched concurrently (at most _api_workers() in flight)
+    and yielded in offset order. Pages without a `total` fall back to following
+    `next` links one at a time. Reversed reads fetch the highest offsets first,
+    so removing already-yielded items never shifts a page still to be read.
+    """
+    def fetch_page(offset: int, page_limit: int) -> dict:
+        with span("page", "pagination", offset=offset):
+            return fetch(*args, limit=page_limit, offset=offset, **kwargs)
+
+    if first is None:
+        first = fetch_page(0, limit)
+    if not reverse:
+        yield from first['items']
+
+    total = first.get('total')
+    if not first.get('next'):
+        if reverse:
+            yield from reversed(first['items'])
+        return
+    if total is None:
+        if reverse:
+            raise ValueError("Reversed pagination needs a page `total`")
+        results = first
+        while results.get('next'):
+            offset = results.get('offset', 0) + len(results['items'])
+            with span("page", "pagination", offset=offset):
+                results = sp.next(results)
+            yield from results['items']
+        return
+
+    page_size = first.get('limit') or limit
+    offsets = range(page_size, total, page_size)
+    offsets = iter(reversed(offsets) if reverse else offsets)
+    workers = _api_workers()
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+    try:
+        pending: deque = deque()
+        for offset in offsets:
+            pending.append(executor.submit(fetch_page, offset, page_size))
+            if len(pending) >= workers * 2:
+                break
+        while pending:
+            page = pending.popleft().result()
+            next_offset = next(offsets, None)
+            if next_offset is not None:
+                pending.append(executor.submit(fetch_page, next_offset, page_size))
+            yield from reversed(page['items']) if reverse else page['items']
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    if reverse:
+        yield from reversed(first['items'])
+
+
+def write_playlist_batches(
+    sp: spotipy.Spotify,
+    playlist_id: str,
+    track_uris: List[str],
+    on_batch: Optional[Callable[[int, List[str]], None]] = None,
+) -> None:
+    """Append track_uris to a playlist in BATCH_SIZE batches, in order.
+
+    Batches are sent one at a time: each is appended after the one before it is
+    confirmed, so the playlist only ever grows by a prefix of track_uris. Ordered
+    adds to one playlist cannot overlap; callers get their concurrency from
+    on_batch, which is called with each batch and its number once its add is
+    confirmed (move_tracks starts that batch's removal there). The first failure
+    stops the remaining batches and is raised.
+    """
+    for i in range(0, len(track_uris), BATCH_SIZE):
+        batch = track_uris[i:i + BATCH_SIZE]
+        with span("add batch", "write", batch=i // BATCH_SIZE, tracks=len(batch)):
+            sp.playlist_add_items(playlist_id, batch)
+        if on_batch is not None:
+            on_batch(i // BATCH_SIZE, batch)
+
+
+def iter_source_tracks(
+    sp: spotipy.Spotify, playlist_id: str, use_cache: bool = True
+) -> Iterator[Track]:
+    """Yield the tracks of a playlist (or Liked Songs), skipping unavailable ones.
+
+    Playlists are served from the on-disk cache when their snapshot_id is unchanged;
+    Liked Songs are synced incrementally against the cached copy.
+    """
+    if use_cache:
+        yield from _load_source_tracks(sp, playlist_id, use_cache)[0]
+        return
+    yield from _fetch_source_tracks(sp, playlist_id)
+
+
+def _load_source_tracks(
+    sp: spotipy.Spotify, playlist_id: str, use_cache: bool
+) -> Tuple[List[Track], Optional[str]]:
+    """Return (tracks, snapshot_id); snapshot_id is None for Liked Songs or without cache."""
+    if not use_cache:
+        return list(_fetch_source_tracks(sp, playlist_id)), None
+    if playlist_id == LIKED_SENTINEL:
+        return [track for track, _ in _cached_liked_items(sp) if track], None
+    return _cached_playlist_tracks(sp, playlist_id)
+
+
+def _read_liked_cache(
+    sp: spotipy.Spotify,
+) -> Tuple[Optional[PlaylistCache], Optional[List[SavedTrack]]]:
+    """Return (cache, cached Liked Songs); the cache is None when it can't be opened."""
+    try:
+        cache = get_playlist_cache()
+        return cache, cache.get_liked(_cache_owner(sp))
+    except (sqlite3.Error, OSError) as e:
+        err_console.print(f"[yellow]Playlist cache unavailable:[/] {str(e)}")
+        return None, None
+
+
+def _cached_liked_items(
+    sp: spotipy.Spotify,
+    first: Optional[dict] = None,
+    read: Optional[Tuple[Optional[PlaylistCache], Optional[List[SavedTrack]]]] = None,
+) -> List[SavedTrack]:
+    """Return saved-track items newest first, only paging down to the cached watermark.
+
+    first is the top page when the caller has already fetched it, and read a
+    _read_liked_cache result it already holds.
+    """
+    cache, cached = read or _read_liked_cache(sp)
+    items = _liked_items_since(sp, cached, first) if cached else None
+    if items is None:
+        items = _fetch_liked_items(sp, first)
+    if cache is not None:
+        try:
+            cache.put_liked(_cache_owner(sp), items)
+        except sqlite3.Error as e:
+            err_console.print(f"[yellow]Could not update playlist cache:[/] {str(e)}")
+    return items
+
+
+def _fetch_liked_items(sp: spotipy.Spotify, first: Optional[dict] = None) -> List[SavedTrack]:
+    items = iter_paged_items(
+        sp, sp.current_user_saved_tracks, limit=LIKED_PAGE_SIZE, first=first
+    )
+    return [saved_track(item) for item in items]
+
+
+def _liked_items_since(
+    sp: spotipy.Spotify, cached: List[SavedTrack], first: Optional[dict] = None
+) -> Optional[List[SavedTrack]]:
+    """Merge newly saved tracks into a cached Liked Songs list, or None to force a resync.
+
+    The newest cached item (track URI + added_at) is the watermark: pages are read
+    from the top until it is reached. If the library total then disagrees with
+    the merged list, tracks were removed and the caller refetches everything.
+    Reading past where the watermark must sit (total - len(cached) new items)
+    means the same, so the serial read stops there instead of paging on.
+    """
+    watermark = _saved_item_key(cached[0])
+    new: List[SavedTrack] = []
+    offset = 0
+    while True:
+        if offset == 0 and first is not None:
+            page = first
+        else:
+            with span("page", "pagination", offset=offset):
+                page = sp.current_user_saved_tracks(limit=LIKED_PAGE_SIZE, offset=offset)
+        for item in map(saved_track, page['items']):
+            if _saved_item_key(item) == watermark:
+                merged = new + cached
+                return merged if len(merged) == page['total'] else None
+            new.append(item)
+            if len(new) > page['total'] - len(cached):
+                return None
+        if not page.get('next') or not page['items']:
+            return None
+        offset += len(page['items'])
+
 
-def get_playlist_track_uris(sp: spotipy.Spotify, playlist_id: str) -> Set[str]:
-    """Fetch all track URIs from a playlist, handling pagination."""
-    track_uris = set()
-    results = sp.playlist_tracks(playlist_id)
-    while results:
-        for item in results['items']:
-            track = item['track']
-            if track and track.get('uri'):
-                track_uris.add(track['uri'])
-        results = sp.next(results) if results.get('next') else None
-    return track_uris
+def _saved_item_key(item: SavedTrack) -> Tuple[Optional[str], Optional[str]]:
+    track, added_at = item
+    return (track.uri if track else None), added_at
+
+
+def _cached_playlist_tracks(
+    sp: spotipy.Spotify, playlist_id: str
+) -> Tuple[List[Track], Optional[str]]:
+    snapshot_id = sp.playlist(playlist_id, fields="snapshot_id")["snapshot_id"]
+    try:
+        cache = get_playlist_cache()
+        tracks = cache.get(playlist_id, snapshot_id)
+    except (sqlite3.Error, OSError) as e:
+        err_console.print(f"[yellow]Playlist cache unavailable:[/] {str(e)}")
+        return list(_fetch_source_tracks(sp, playlist_id)), snapshot_id
+    if tracks is not None:
+        return tracks, snapshot_id
+
+    tracks = list(_fetch_source_tracks(sp, playlist_id))
+    try:
+        cache.put(playlist_id, snapshot_id, tracks)
+    except sqlite3.Error as e:
+        err_console.print(f"[yellow]Could not update playlist cache:[/] {str(e)}")
+    return tracks, snapshot_id
+
+
+def _fetch_source_tracks(
+    sp: spotipy.Spotify, playlist_id: str, fields: str = PLAYLIST_TRACK_FIELDS
+) -> Iterator[Track]:
+    """Yield a playlist's tracks, requesting only fields (a playlist items filter)."""
+    if playlist_id == LIKED_SENTINEL:
+        items = iter_paged_items(sp, sp.current_user_saved_tracks, limit=LIKED_PAGE_SIZE)
+    else:
+        items = iter_paged_items(
+            sp, sp.playlist_tracks, playlist_id, limit=BATCH_SIZE, fields=fields
+        )
+    for item in items:
+        track = item.get('track')
+        if track:  # Can be None for local/unavailable tracks
+            yield Track.from_api(track)
+
+
+def get_playlist_track_uris(
+    sp: spotipy.Spotify, playlist_id: str, use_cache: bool = True
+) -> Set[str]:
+    """Fetch all track URIs from a playlist, handling pagination.
+
+    Cached reads store full Track records; uncached ones request only the URIs.
+    """
+    if use_cache:
+        return {track.uri for track in iter_source_tracks(sp, playlist_id)}
+    return {track.uri for track in _fetch_source_tracks(sp, playlist_id, PLAYLIST_URI_FIELDS)}
 
 def resolve_playlist_id(sp: spotipy.Spotify, value: str) -> str:
     """Resolve a playlist name or raw ID to a playlist ID.
@@ -36,10 +331,14 @@ def resolve_playlist_id(sp: spotipy.Spotify, value: str) -> str:
     Passes 'liked' and 22-char base62 IDs through unchanged.
     For anything else, looks up by name; falls back to raw value if not found.
     """
-    if value == LIKED_SENTINEL or _SPOTIFY_ID_RE.fullmatch(value):
-        return value
-    found = find_playlist(sp, value)
-    return found if found is not None else value
+    return resolve_playlist_ids(sp, [value])[0]
+
+
+def resolve_playlist_ids(sp: spotipy.Spotify, values: List[str]) -> List[str]:
+    """Resolve several playlist names or raw IDs with a single name-index lookup."""
+    names = [v for v in values if v != LIKED_SENTINEL and not _SPOTIFY_ID_RE.fullmatch(v)]
+    found = find_playlists(sp, names) if names else {}
+    return [found.get(v) or v for v in values]
 
 
 def resolve_or_create_playlist_id(sp: spotipy.Spotify, value: str) -> Tuple[str, bool]:
@@ -57,17 +356,9 @@ def resolve_or_create_playlist_id(sp: spotipy.Spotify, value: str) -> Tuple[str,
     return uri.split(":")[-1], True
 
 
-def get_liked_track_uris(sp: spotipy.Spotify) -> Set[str]:
+def get_liked_track_uris(sp: spotipy.Spotify, use_cache: bool = True) -> Set[str]:
     """Fetch all liked/saved track URIs, handling pagination."""
-    uris = set()
-    results = sp.current_user_saved_tracks()
-    while results:
-        for item in results['items']:
-            track = item.get('track')
-            if track and track.get('uri'):
-                uris.add(track['uri'])
-        results = sp.next(results) if results.get('next') else None
-    return uris
+    return get_playlist_track_uris(sp, LIKED_SENTINEL, use_cache=use_cache)
 
 
 def remove_liked_tracks(sp: spotipy.Spotify, track_uris: List[str]):
@@ -89,94 +380,445 @@ def move_tracks(
     source_id: str,
     dest_id: str,
     strict: bool = False,
+    use_cache: bool = True,
+    resume: bool = False,
 ):
     """Move tracks from source to destination. Batches API calls (100 per call).
 
     If strict is True, only moves tracks that actually exist in the source playlist.
+    Confirmed batches are journaled; with resume, a previously interrupted move of
+    the same tracks skips the batches it already applied (and the strict refetch).
     """
     if not track_uris:
         return
 
-    tracks_to_move = track_uris
-    if strict:
-        source_uris = (
-            get_liked_track_uris(sp) if source_id == LIKED_SENTINEL
-            else get_playlist_track_uris(sp, source_id)
+    journal = _open_write_journal()
+    job_id = write_job_id("move", source_id, dest_id, strict, tracks=track_uris)
+    try:
+        state = _load_write_job(journal, job_id) if resume else None
+        if state is not None:
+            tracks_to_move, done = state
+            console.print(
+                f"[cyan]Resuming move: {len(done.get('remove', ()))} of "
+                f"{-(-len(tracks_to_move) // BATCH_SIZE)} batches already done.[/]"
+            )
+        else:
+            tracks_to_move = track_uris
+            if strict:
+                tracks_to_move = _filter_to_source(sp, track_uris, source_id, use_cache)
+            if not tracks_to_move:
+                console.print("[yellow]No tracks to move after filtering.[/]")
+                return
+            done = {}
+            _begin_write_job(journal, job_id, tracks_to_move)
+
+        started = time.perf_counter()
+        _pipelined_move(
+            sp, tracks_to_move, source_id, dest_id, done, _write_job_recorder(journal, job_id)
         )
+        elapsed = time.perf_counter() - started
+        _finish_write_job(journal, job_id)
+    finally:
+        if journal is not None:
+            journal.close()
+    console.print(
+        f"[green]Successfully moved {len(tracks_to_move)} tracks[/] "
+        f"in {elapsed:.1f}s ({len(tracks_to_move) / max(elapsed, 1e-3):.0f} tracks/s)."
+    )
 
-        # Filter tracks: normalize both for comparison
-        filtered_tracks = []
-        skipped_count = 0
-        for track in track_uris:
-            if normalize_track_uri(track) in source_uris:
-                filtered_tracks.append(track)
-            else:
-                skipped_count += 1
 
-        if skipped_count > 0:
-            console.print(
-                f"[yellow]Strict Mode: Skipped {skipped_count} tracks not in source playlist.[/]"
-            )
+def move_liked_tracks(sp: spotipy.Spotify, dest_id: str) -> int:
+    """Move every Liked Song to dest while later pages are still loading.
 
-        tracks_to_move = filtered_tracks
+    Liked Songs are read oldest first, so deleting moved tracks never shifts an
+    offset still to be read. Each batch is inserted at the position the move
+    started at, which restores the newest-first (added_at) order in dest. A batch
+    is deleted from Liked Songs only once its add is confirmed, with at most
+    MAX_REMOVE_WORKERS deletes in flight. Returns the number of tracks moved.
+    """
+    items = iter_paged_items(sp, sp.current_user_saved_tracks, limit=LIKED_PAGE_SIZE, reverse=True)
+    uris = (item['track']['uri'] for item in items if item.get('track'))
+    started = time.perf_counter()
+    position: Optional[int] = None
+    moved = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_REMOVE_WORKERS) as executor:
+        removals: deque = deque()
+        while batch := list(itertools.islice(uris, BATCH_SIZE)):
+            if position is None:
+                position = sp.playlist(dest_id, fields="tracks.total")["tracks"]["total"]
+            batch.reverse()
+            sp.playlist_add_items(dest_id, batch, position=position)
+            moved += len(batch)
+            removals.append(executor.submit(_remove_from_source, sp, LIKED_SENTINEL, batch))
+            while removals and (removals[0].done() or len(removals) > MAX_REMOVE_WORKERS):
+                removals.popleft().result()
+        for future in removals:
+            future.result()
 
-    if not tracks_to_move:
-        console.print("[yellow]No tracks to move after filtering.[/]")
-        return
+    if moved:
+        elapsed = time.perf_counter() - started
+        console.print(
+            f"[green]Successfully moved {moved} tracks[/] "
+            f"in {elapsed:.1f}s ({moved / max(elapsed, 1e-3):.0f} tracks/s)."
+        )
+    return moved
+
+
+def _filter_to_source(
+    sp: spotipy.Spotify, track_uris: List[str], source_id: str, use_cache: bool
+) -> List[str]:
+    source_uris = _source_membership(sp, track_uris, source_id, use_cache)
+
+    # Filter tracks: normalize both for comparison
+    filtered_tracks = []
+    skipped_count = 0
+    for track in track_uris:
+        if normalize_track_uri(track) in source_uris:
+            filtered_tracks.append(track)
+        else:
+            skipped_count += 1
+
+    if skipped_count > 0:
+        console.print(
+            f"[yellow]Strict Mode: Skipped {skipped_count} tracks not in source playlist.[/]"
+        )
+    return filtered_tracks
+
+
+def _source_membership(
+    sp: spotipy.Spotify, track_uris: List[str], source_id: str, use_cache: bool
+) -> Set[str]:
+    """Return URIs in the source, using whichever plan costs fewer API calls.
+
+    Liked Songs can be probed LIKED_CONTAINS_SIZE tracks per call; that plan is
+    chosen when it needs fewer calls than scanning the library. The library's top
+    page is read first, both for its total and as the scan's first page; with a
+    cached copy the scan only reads the tracks saved since (often none).
+    Playlists have no contains endpoint and are always scanned (from cache when
+    the snapshot is unchanged). The result may hold only the probed tracks.
+    """
+    if source_id != LIKED_SENTINEL:
+        console.print("[cyan]Strict Mode: scanning source playlist.[/]")
+        return get_playlist_track_uris(sp, source_id, use_cache=use_cache)
+
+    uris = list(dict.fromkeys(normalize_track_uri(t) for t in track_uris))
+    with span("page", "pagination", offset=0):
+        first = sp.current_user_saved_tracks(limit=LIKED_PAGE_SIZE)
+    read = _read_liked_cache(sp) if use_cache else (None, None)
+    lookups = -(-len(uris) // LIKED_CONTAINS_SIZE)
+    pages = _liked_scan_pages(first, read[1])
+    if lookups >= pages:
+        source = "cached " if read[1] else ""
+        console.print(
+            f"[cyan]Strict Mode: scanning {first['total']} {source}Liked Songs "
+            f"({pages} more pages).[/]"
+        )
+        if use_cache:
+            items = _cached_liked_items(sp, first, read)
+        else:
+            items = _fetch_liked_items(sp, first)
+        return {track.uri for track, _ in items if track}
+
+    console.print(
+        f"[cyan]Strict Mode: looking up {len(uris)} tracks in Liked Songs "
+        f"({lookups} calls instead of {pages} pages).[/]"
+    )
+    batches = [
+        uris[i:i + LIKED_CONTAINS_SIZE] for i in range(0, len(uris), LIKED_CONTAINS_SIZE)
+    ]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_api_workers()) as executor:
+        flags = executor.map(sp.current_user_saved_tracks_contains, batches)
+        return {
+            uri
+            for batch, saved in zip(batches, flags)
+            for uri, is_saved in zip(batch, saved)
+            if is_saved
+        }
+
+
+def _liked_scan_pages(first: dict, cached: Optional[List[SavedTrack]]) -> int:
+    """Pages a Liked Songs scan still has to read once its top page (first) is in hand.
+
+    Without a cache that is the rest of the library; with one, only the tracks
+    saved since the cached watermark plus the watermark itself. A library that
+    also lost tracks costs a full resync on top, which this does not predict.
+    """
+    unread = first['total'] - len(cached) + 1 if cached else first['total']
+    return max(0, -(-unread // LIKED_PAGE_SIZE) - 1)
+
+
+def _pipelined_move(
+    sp: spotipy.Spotify,
+    track_uris: List[str],
+    source_id: str,
+    dest_id: str,
+    done: Optional[Dict[str, Set[int]]] = None,
+    record: Optional[Callable[[str, int], None]] = None,
+) -> None:
+    """Write batches to dest with write_playlist_batches, removing each from source once added.
+
+    A batch is only submitted for removal once its add is confirmed, and at most
+    MAX_REMOVE_WORKERS removals run at once, overlapping the adds that follow. A
+    failed add stops further batches and is raised once in-flight removals have
+    finished. done holds the batch numbers a resumed job has already confirmed
+    per stage; record is told about each newly confirmed one.
+    """
+    done = done or {}
+    record = record or (lambda stage, batch: None)
+    batches = [track_uris[i:i + BATCH_SIZE] for i in range(0, len(track_uris), BATCH_SIZE)]
+    added_through = _resume_batch(done)
+    removals: List[concurrent.futures.Future] = []
 
-    for i in range(0, len(tracks_to_move), BATCH_SIZE):
-        batch = tracks_to_move[i:i + BATCH_SIZE]
-        
-        # 1. Add to destination
-        sp.playlist_add_items(dest_id, batch)
-        
-        # 2. Remove from source
+    def remove(n: int) -> None:
+        _remove_from_source(sp, source_id, batches[n])
+        record("remove", n)
+
+    def on_added(i: int, batch: List[str]) -> None:
+        record("add", added_through + i)
+        removals.append(executor.submit(remove, added_through + i))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_REMOVE_WORKERS) as executor:
+        for n in range(added_through):
+            if n not in done.get("remove", ()):
+                removals.append(executor.submit(remove, n))
+        write_playlist_batches(
+            sp, dest_id, track_uris[added_through * BATCH_SIZE:], on_batch=on_added
+        )
+    for future in removals:
+        future.result()
+
+
+def _remove_from_source(sp: spotipy.Spotify, source_id: str, batch: List[str]) -> None:
+    with span("remove batch", "write", tracks=len(batch)):
         if source_id == LIKED_SENTINEL:
-            sp.current_user_saved_tracks_delete(batch)
+            for i in range(0, len(batch), LIKED_BATCH_SIZE):
+                sp.current_user_saved_tracks_delete(batch[i:i + LIKED_BATCH_SIZE])
         else:
             sp.playlist_remove_all_occurrences_of_items(source_id, batch)
-        
-    console.print(f"[green]Successfully moved {len(tracks_to_move)} tracks.[/]")
 
-def add_tracks(sp: spotipy.Spotify, track_uris: List[str], playlist_id: str):
+def add_tracks(
+    sp: spotipy.Spotify, track_uris: List[str], playlist_id: str, resume: bool = False
+):
     """
     Add tracks to a playlist.
-    Uses batching to minimize API calls (Spotify limit: 100 per call).
+    Batches are appended one after another, so order is kept
+    (Spotify limit: 100 per call). Confirmed batches are journaled; with resume,
+    a previously interrupted add of the same tracks skips what it already added.
     """
     if not track_uris:
         return
 
-    for i in range(0, len(track_uris), BATCH_SIZE):
-        batch = track_uris[i:i + BATCH_SIZE]
-        sp.playlist_add_items(playlist_id, batch)
-        
+    journal = _open_write_journal()
+    job_id = write_job_id("add", playlist_id, tracks=track_uris)
+    try:
+        state = _load_write_job(journal, job_id) if resume else None
+        if state is not None:
+            done = state[1]
+            console.print(
+                f"[cyan]Resuming add: {len(done.get('add', ()))} of "
+                f"{-(-len(track_uris) // BATCH_SIZE)} batches already done.[/]"
+            )
+        else:
+            done = {}
+            _begin_write_job(journal, job_id, track_uris)
+
+        start = _resume_batch(done)
+        record = _write_job_recorder(journal, job_id)
+        write_playlist_batches(
+            sp,
+            playlist_id,
+            track_uris[start * BATCH_SIZE:],
+            on_batch=lambda i, batch: record("add", start + i),
+        )
+        _finish_write_job(journal, job_id)
+    finally:
+        if journal is not None:
+            journal.close()
+
     console.print(f"[green]Successfully added {len(track_uris)} tracks.[/]")
 
+
+def add_track_stream(sp: spotipy.Spotify, track_uris: Iterable[str], playlist_id: str) -> int:
+    """Add URIs from a stream in order, buffering at most STREAM_CHUNK_SIZE; returns the count."""
+    uris = iter(track_uris)
+    added = 0
+    while chunk := list(itertools.islice(uris, STREAM_CHUNK_SIZE)):
+        write_playlist_batches(sp, playlist_id, chunk)
+        added += len(chunk)
+    return added
+
+
+def move_track_stream(
+    sp: spotipy.Spotify, track_uris: Iterable[str], source_id: str, dest_id: str
+) -> int:
+    """Move URIs from a stream, buffering at most STREAM_CHUNK_SIZE; returns the count."""
+    uris = iter(track_uris)
+    moved = 0
+    while chunk := list(itertools.islice(uris, STREAM_CHUNK_SIZE)):
+        _pipelined_move(sp, chunk, source_id, dest_id)
+        moved += len(chunk)
+    return moved
+
+
+def _resume_batch(done: Dict[str, Set[int]]) -> int:
+    """First batch a resumed job still has to add.
+
+    Batches are appended in order, so every batch up to the highest confirmed
+    add is already in the destination.
+    """
+    added = done.get("add")
+    return max(added) + 1 if added else 0
+
+
+def _open_write_journal() -> Optional[WriteJournal]:
+    try:
+        return get_write_journal()
+    except (sqlite3.Error, OSError) as e:
+        err_console.print(f"[yellow]Write journal unavailable:[/] {str(e)}")
+        return None
+
+
+def _load_write_job(
+    journal: Optional[WriteJournal], job_id: str
+) -> Optional[Tuple[List[str], Dict[str, Set[int]]]]:
+    if journal is None:
+        return None
+    try:
+        return journal.load(job_id)
+    except sqlite3.Error as e:
+        err_console.print(f"[yellow]Could not read write journal:[/] {str(e)}")
+        return None
+
+
+def _begin_write_job(journal: Optional[WriteJournal], job_id: str, tracks: List[str]) -> None:
+    if journal is None:
+        return
+    try:
+        journal.begin(job_id, tracks)
+    except sqlite3.Error as e:
+        err_console.print(f"[yellow]Could not update write journal:[/] {str(e)}")
+
+
+def _finish_write_job(journal: Optional[WriteJournal], job_id: str) -> None:
+    if journal is None:
+        return
+    try:
+        journal.finish(job_id)
+    except sqlite3.Error as e:
+        err_console.print(f"[yellow]Could not update write journal:[/] {str(e)}")
+
+
+def _write_job_recorder(
+    journal: Optional[WriteJournal], job_id: str
+) -> Callable[[str, int], None]:
+    """Return a record(stage, batch) callback for a job; journal errors only warn."""
+    def record(stage: str, batch: int) -> None:
+        if journal is None:
+            return
+        try:
+            journal.record(job_id, stage, batch)
+        except sqlite3.Error as e:
+            err_console.print(f"[yellow]Could not update write journal:[/] {str(e)}")
+
+    return record
+
 def create_playlist(sp: spotipy.Spotify, name: str) -> str:
     """
     Create a new playlist for the current user and return its URI.
     """
     user = sp.current_user()
     playlist = sp.user_playlist_create(user['id'], name)
+    _remember_playlist_name(sp, name, playlist['id'])
     return playlist['uri']
 
 def find_playlist(sp: spotipy.Spotify, name: str) -> Optional[str]:
     """
     Find a playlist ID by its name.
     """
-    results = sp.current_user_playlists()
-    while results:
-        for item in results['items']:
-            if item['name'] == name:
-                return item['id']
-        if results.get('next'):
-            results = sp.next(results)
-        else:
-            results = None
-    return None
+    return find_playlists(sp, [name])[name]
+
+
+def find_playlists(sp: spotipy.Spotify, names: List[str]) -> Dict[str, Optional[str]]:
+    """Find playlist IDs for several names in one pass over the name index.
+
+    The index is served from memory or disk while younger than
+    SAK_PLAYLIST_INDEX_TTL; any name missing from a cached index forces a refetch.
+    """
+    started = time.time()
+    fetched_at, index = _playlist_name_index(sp)
+    if fetched_at < started and any(name not in index for name in names):
+        _, index = _playlist_name_index(sp, refresh=True)
+    return {name: index.get(name) for name in names}
+
+
+def find_playlist_fuzzy(sp: spotipy.Spotify, name: str) -> Optional[str]:
+    """Find a playlist ID by exact name, falling back to the closest fuzzy match."""
+    from rapidfuzz import fuzz, process
+
+    found = find_playlist(sp, name)
+    if found is not None:
+        return found
+    _, index = _playlist_name_index(sp)
+    match = process.extractOne(
+        name, list(index), scorer=fuzz.WRatio, score_cutoff=FUZZY_MATCH_THRESHOLD
+    )
+    return index[match[0]] if match else None
 
 
-def _search_worker(sp: spotipy.Spotify, line: str) -> Optional[dict]:
+def _playlist_name_index(
+    sp: spotipy.Spotify, refresh: bool = False
+) -> Tuple[float, Dict[str, str]]:
+    """Return (fetched_at, name → ID), loading from memory, disk, or the API in that order."""
+    now = time.time()
+    ttl = settings.SAK_PLAYLIST_INDEX_TTL
+    if not refresh:
+        entry = _name_indexes.get(sp)
+        if entry is None:
+            try:
+                entry = get_playlist_cache().get_names(_cache_owner(sp))
+            except (sqlite3.Error, OSError):
+                entry = None
+        if entry is not None and now - entry[0] < ttl:
+            _name_indexes[sp] = entry
+            return entry
+
+    index: Dict[str, str] = {}
+    for item in iter_paged_items(sp, sp.current_user_playlists, limit=PLAYLISTS_PAGE_SIZE):
+        index.setdefault(item['name'], item['id'])
+    entry = (now, index)
+    _name_indexes[sp] = entry
+    try:
+        get_playlist_cache().put_names(_cache_owner(sp), index, now)
+    except (sqlite3.Error, OSError) as e:
+        err_console.print(f"[yellow]Could not save playlist index:[/] {str(e)}")
+    return entry
+
+
+def _cache_owner(sp: spotipy.Spotify) -> str:
+    """Key the per-user cache rows by API and account, so they never cross accounts.
+
+    The OAuth token lives in the working directory, so another directory (or
+    SAK_API_URL) can mean another account against the same global cache.
+    """
+    owner = _cache_owners.get(sp)
+    if owner is None:
+        owner = _cache_owners[sp] = f"{sp.prefix}{sp.current_user()['id']}"
+    return owner
+
+
+def _remember_playlist_name(sp: spotipy.Spotify, name: str, playlist_id: str) -> None:
+    entry = _name_indexes.get(sp)
+    if entry is not None:
+        entry[1][name] = playlist_id
+    try:
+        get_playlist_cache().add_name(_cache_owner(sp), name, playlist_id)
+    except (sqlite3.Error, OSError):
+        pass
+
+
+def _search_worker(
+    sp: spotipy.Spotify, line: str, cache: Optional[SearchCache] = None
+) -> Optional[Track]:
     line = line.strip()
     if not line:
         return None
@@ -187,38 +829,123 @@ def _search_worker(sp: spotipy.Spotify, line: str) -> Optional[dict]:
         return None
 
     artist, title = line.split(" - ", 1)
+    cache_key = normalize_search_query(artist, title)
+    if cache is not None:
+        hit, track = cache.get(cache_key)
+        if hit:
+            if track is None:
+                err_console.print(f"[red]Not found:[/] {artist} - {title}")
+            return track
+
     try:
         result = sp.search(q=f'artist:{artist} track:{title}', type='track', limit=1)
 
-        if result['tracks']['items']:
-            return result['tracks']['items'][0]
-        else:
+        items = result['tracks']['items']
+        track = Track.from_api(items[0]) if items else None
+        if cache is not None:
+            cache.put(cache_key, track)
+        if track is None:
             err_console.print(f"[red]Not found:[/] {artist} - {title}")
-            return None
+        return track
     except Exception as e:
         err_console.print(f"[red]Error searching for:[/] {line} - {str(e)}")
         return None
 
+def _get_token_index(
+    playlist_id: str, snapshot_id: Optional[str], choices: List[str]
+) -> TrackTokenIndex:
+    """Build the token index for a playlist, reusing it while the snapshot is unchanged."""
+    if snapshot_id is None:
+        return TrackTokenIndex(choices)
+    key = (playlist_id, snapshot_id)
+    index = _token_indexes.get(key)
+    if index is None:
+        index = _token_indexes[key] = TrackTokenIndex(choices)
+        while len(_token_indexes) > TOKEN_INDEX_CACHE_SIZE:
+            del _token_indexes[next(iter(_token_indexes))]
+    return index
+
+
+def _match_queries(
+    queries: List[str], choices: List[str], token_index: Optional[TrackTokenIndex]
+) -> List[Optional[int]]:
+    """Match queries against choices, scoring only token-index candidates when possible.
+
+    Queries without usable candidates fall back to a full scan.
+    """
+    from rapidfuzz import fuzz, process
+
+    if token_index is None:
+        return _best_fuzzy_matches(queries, choices)
+
+    with span("candidates", "fuzzy"):
+        candidates = [token_index.candidates(q) for q in queries]
+    unindexed = [q for q, c in zip(queries, candidates) if c is None]
+    with span("full scan", "fuzzy", queries=len(unindexed)):
+        full_scan = iter(_best_fuzzy_matches(unindexed, choices))
+    matches: List[Optional[int]] = []
+    with span("candidate scoring", "fuzzy", queries=len(queries) - len(unindexed)):
+        for query, positions in zip(queries, candidates):
+            if positions is None:
+                matches.append(next(full_scan))
+                continue
+            # positions are ascending, so ties still go to the earliest choice
+            match = process.extractOne(query, [choices[i] for i in positions], scorer=fuzz.WRatio)
+            matches.append(
+                positions[match[2]] if match and match[1] > FUZZY_MATCH_THRESHOLD else None
+            )
+    return matches
+
+
+def _best_fuzzy_matches(queries: List[str], choices: List[str]) -> List[Optional[int]]:
+    """Return, per query, the index of its best WRatio choice above the threshold.
+
+    With enough cores the whole batch is scored by one multi-threaded
+    process.cdist call; ties go to the earliest choice, as with process.extractOne.
+    On fewer cores the per-query extractOne loop is faster (it raises its cutoff
+    as it goes), so it is used instead. Both paths return identical results.
+    """
+    import numpy as np
+    from rapidfuzz import fuzz, process
+
+    if not queries:
+        return []
+    if (os.cpu_count() or 1) < FUZZY_BATCH_MIN_CPUS:
+        matches = [process.extractOne(q, choices, scorer=fuzz.WRatio) for q in queries]
+        return [m[2] if m and m[1] > FUZZY_MATCH_THRESHOLD else None for m in matches]
+
+    scores = process.cdist(
+        queries,
+        choices,
+        scorer=fuzz.WRatio,
+        score_cutoff=FUZZY_MATCH_THRESHOLD,
+        dtype=np.float64,
+        workers=-1,
+    )
+    best = scores.argmax(axis=1)
+    return [
+        int(col) if scores[row, col] > FUZZY_MATCH_THRESHOLD else None
+        for row, col in enumerate(best)
+    ]
+
 def search_tracks(
     sp: spotipy.Spotify,
-    lines: List[str],
+    lines: Iterable[str],
     playlist_id: Optional[str] = None,
-) -> Generator[Optional[dict], None, None]:
+    use_cache: bool = True,
+    unordered: bool = False,
+) -> Generator[Optional[Track], None, None]:
     """
     Search for tracks based on "Artist - Title" lines.
     If playlist_id is provided, restricts search to that playlist using fuzzy matching.
-    Otherwise, uses global Spotify search with ThreadPoolExecutor.
+    Otherwise, uses global Spotify search with ThreadPoolExecutor, streaming lines
+    through a bounded window; unordered yields global results as they complete.
+    use_cache covers both the playlist cache and the search result cache.
     """
     if playlist_id:
         # Fetch all tracks from playlist
-        playlist_tracks = []
         try:
-            results = sp.playlist_tracks(playlist_id)
-            while results:
-                for item in results['items']:
-                    if item.get('track'):
-                        playlist_tracks.append(item['track'])
-                results = sp.next(results) if results.get('next') else None
+            playlist_tracks, snapshot_id = _load_source_tracks(sp, playlist_id, use_cache)
         except Exception as e:
             err_console.print(f"[bold red]Error fetching playlist:[/] {str(e)}")
             for _ in lines:
@@ -236,31 +963,103 @@ def search_tracks(
         track_map = {}
         search_choices = []
         for track in playlist_tracks:
-            artists = ', '.join([a['name'] for a in track['artists']])
-            search_str = f"{artists} - {track['name']}"
+            search_str = track.line
             search_choices.append(search_str)
             # Handle duplicates by keeping the first one or similar?
             # For now, just map search_str to track
             if search_str not in track_map:
                 track_map[search_str] = track
 
-        for line in lines:
-            line = line.strip()
-            if not line:
-                yield None
-                continue
+        token_index = None
+        if len(search_choices) >= TOKEN_INDEX_MIN_TRACKS:
+            with span("token index", "fuzzy", choices=len(search_choices)):
+                token_index = _get_token_index(playlist_id, snapshot_id, search_choices)
 
-            # Use fuzzy matching
-            match = process.extractOne(line, search_choices, scorer=fuzz.WRatio)
-            if match and match[1] > FUZZY_MATCH_THRESHOLD:
-                yield track_map[match[0]]
-            else:
-                err_console.print(f"[red]Not found in playlist:[/] {line}")
-                yield None
+        # Score lines in chunks so the score matrix stays bounded for large playlists
+        chunk_size = max(1, FUZZY_MATCH_MAX_CELLS // len(search_choices))
+        line_iter = iter(lines)
+        while chunk := [line.strip() for line in itertools.islice(line_iter, chunk_size)]:
+            queries = [line for line in chunk if line]
+            with span("match chunk", "fuzzy", queries=len(queries)):
+                matches = iter(_match_queries(queries, search_choices, token_index))
+            for line in chunk:
+                if not line:
+                    yield None
+                    continue
+
+                match = next(matches)
+                if match is not None:
+                    yield track_map[search_choices[match]]
+                else:
+                    err_console.print(f"[red]Not found in playlist:[/] {line}")
+                    yield None
     else:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_SEARCH_WORKERS) as executor:
-            # Submit all tasks and preserve order
-            futures = [executor.submit(_search_worker, sp, line) for line in lines]
+        cache = _open_search_cache() if use_cache else None
+        try:
+            yield from _stream_global_search(sp, lines, unordered, cache)
+        finally:
+            if cache is not None:
+                cache.close()
+
+
+def _open_search_cache() -> Optional[SearchCache]:
+    try:
+        return get_search_cache()
+    except (sqlite3.Error, OSError) as e:
+        err_console.print(f"[yellow]Search cache unavailable:[/] {str(e)}")
+        return None
+
 
-            for future in futures:
+def _stream_global_search(
+    sp: spotipy.Spotify,
+    lines: Iterable[str],
+    unordered: bool,
+    cache: Optional[SearchCache] = None,
+) -> Iterator[Optional[Track]]:
+    """Run _search_worker over lines lazily, keeping at most two per worker in flight.
+
+    Lines with the same normalized query share one search (single-flight); the
+    result is fanned back out to every position. Results are yielded in input
+    order, or as soon as each completes when unordered.
+    """
+    line_iter = iter(lines)
+    recent: OrderedDict[str, concurrent.futures.Future] = OrderedDict()
+
+    def submit(line: str) -> concurrent.futures.Future:
+        key = _search_key(line)
+        if key is None:
+            return executor.submit(_search_worker, sp, line, cache)
+        future = recent.get(key)
+        if future is None:
+            future = recent[key] = executor.submit(_search_worker, sp, line, cache)
+            if len(recent) > SEARCH_DEDUP_SIZE:
+                recent.popitem(last=False)
+        else:
+            recent.move_to_end(key)
+        return future
+
+    workers = _api_workers()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        in_flight = deque(submit(line) for line in itertools.islice(line_iter, workers * 2))
+        while in_flight:
+            if unordered:
+                finished, _ = concurrent.futures.wait(
+                    in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                done = [f for f in in_flight if f in finished]
+                in_flight = deque(f for f in in_flight if f not in finished)
+            else:
+                done = [in_flight.popleft()]
+
+            for line in itertools.islice(line_iter, len(done)):
+                in_flight.append(submit(line))
+            for future in done:
                 yield future.result()
+
+
+def _search_key(line: str) -> Optional[str]:
+    """Normalized query for a valid 'Artist - Title' line, or None."""
+    line = line.strip()
+    if " - " not in line:
+        return None
+    return normalize_search_query(*line.split(" - ", 1))
@@ -1,23 +1,95 @@
 import os
+from functools import cache
+from pathlib import Path
+from typing import Optional
 
-from dotenv import load_dotenv
 
-# Load .env file
-load_dotenv()
+@cache
+def _load_env() -> None:
+    """Load the .env file once, on first use rather than at import."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+def _getenv(name: str, default: Optional[str] = None) -> Optional[str]:
+    _load_env()
+    return os.getenv(name, default)
+
 
 class Settings:
     @property
     def SPOTIPY_CLIENT_ID(self):
-        return os.getenv("SPOTIPY_CLIENT_ID")
+        return _getenv("SPOTIPY_CLIENT_ID")
 
     @property
     def SPOTIPY_CLIENT_SECRET(self):
-        return os.getenv("SPOTIPY_CLIENT_SECRET")
+        return _getenv("SPOTIPY_CLIENT_SECRET")
 
     @property
     def SPOTIPY_REDIRECT_URI(self):
-        return os.getenv("SPOTIPY_REDIRECT_URI", "http://localhost:8888/callback")
+        return _getenv("SPOTIPY_REDIRECT_URI", "http://localhost:8888/callback")
     
+    @property
+    def SAK_API_URL(self) -> Optional[str]:
+        """Base URL of a local stand-in for the Web API (tests/spotify_server.py)."""
+        return _getenv("SAK_API_URL")
+
+    @property
+    def SAK_CACHE_DIR(self) -> Path:
+        default = Path(_getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "sak"
+        return Path(_getenv("SAK_CACHE_DIR") or default)
+
+    @property
+    def SAK_CACHE_MAX_MB(self) -> int:
+        return int(_getenv("SAK_CACHE_MAX_MB", "256"))
+
+    @property
+    def SAK_PLAYLIST_INDEX_TTL(self) -> int:
+        return int(_getenv("SAK_PLAYLIST_INDEX_TTL", "3600"))
+
+    @property
+    def SAK_SEARCH_CACHE_TTL(self) -> int:
+        return int(_getenv("SAK_SEARCH_CACHE_TTL", str(30 * 24 * 3600)))
+
+    @property
+    def SAK_SEARCH_CACHE_NEGATIVE_TTL(self) -> int:
+        return int(_getenv("SAK_SEARCH_CACHE_NEGATIVE_TTL", str(24 * 3600)))
+
+    @property
+    def SAK_SEARCH_CACHE_MAX_MB(self) -> int:
+        return int(_getenv("SAK_SEARCH_CACHE_MAX_MB", "64"))
+
+    @property
+    def SAK_JOURNAL_MAX_AGE(self) -> int:
+        return int(_getenv("SAK_JOURNAL_MAX_AGE", str(7 * 24 * 3600)))
+
+    @property
+    def SAK_TOKEN_REFRESH_AHEAD(self) -> int:
+        return int(_getenv("SAK_TOKEN_REFRESH_AHEAD", "300"))
+
+    @property
+    def SAK_RATE_LIMIT(self) -> float:
+        """Requests per second; 0 (the default) leaves pacing to AIMD and Retry-After."""
+        return float(_getenv("SAK_RATE_LIMIT", "0"))
+
+    @property
+    def SAK_RATE_BURST(self) -> int:
+        return int(_getenv("SAK_RATE_BURST", "20"))
+
+    @property
+    def SAK_MAX_CONCURRENCY(self) -> int:
+        """Ceiling for the adaptive concurrency limit, and the size of the request pools."""
+        return int(_getenv("SAK_MAX_CONCURRENCY", "16"))
+
+    @property
+    def SAK_MAX_RETRIES(self) -> int:
+        return int(_getenv("SAK_MAX_RETRIES", "5"))
+
+    @property
+    def SAK_RETRY_JITTER(self) -> float:
+        return float(_getenv("SAK_RETRY_JITTER", "1.0"))
+
     @property
     def is_spotify_configured(self) -> bool:
         return all([self.SPOTIPY_CLIENT_ID, self.SPOTIPY_CLIENT_SECRET])
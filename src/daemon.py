@@ -0,0 +1,258 @@
+import contextlib
+import hashlib
+import io
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+import threading
+import traceback
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+from .config import settings
+
+# Wire format: the client sends one JSON header line ({"argv", "cwd", "stdin_tty", "env",
+# "account"}). The daemon answers with JSON lines: {"stream": "stdout"|"stderr", "data": ...}
+# while the command runs, then {"exit": code}, or {"refused": reason} for another account.
+# Stdin is pulled: when the command reads it, the daemon sends {"read": n} and the client
+# replies with a "<length>\n" line and up to n bytes of its stdin (length 0 at EOF).
+
+
+def socket_path() -> Path:
+    return settings.SAK_CACHE_DIR / "sak.sock"
+
+
+def _sak_env() -> Dict[str, str]:
+    """SAK_* settings (SAK_STATS, SAK_TRACE, SAK_CACHE_DIR...) a forwarded command runs with."""
+    return {k: v for k, v in os.environ.items() if k.startswith("SAK_") and k != "SAK_NO_DAEMON"}
+
+
+def account_key() -> str:
+    """Fingerprint of the account this process acts as, from the current directory.
+
+    Covers the OAuth token file (.cache, resolved against the working directory;
+    unused with SAK_API_URL), the app credentials from .env and SAK_API_URL.
+    Hashed, so the secret never crosses the socket.
+    """
+    identity = [
+        None if settings.SAK_API_URL else str(Path(".cache").resolve()),
+        settings.SPOTIPY_CLIENT_ID,
+        settings.SPOTIPY_CLIENT_SECRET,
+        settings.SAK_API_URL,
+    ]
+    return hashlib.sha256(json.dumps(identity).encode()).hexdigest()
+
+
+def _is_stream(stdin) -> bool:
+    """Whether stdin is a pipe or socket, which may be fed by another sak command."""
+    try:
+        mode = os.fstat(stdin.fileno()).st_mode
+    except (OSError, ValueError, io.UnsupportedOperation):
+        return False
+    return stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode)
+
+
+def forward(argv: List[str], path: Optional[Path] = None) -> Optional[int]:
+    """Run a CLI invocation on a running `sak serve` daemon and return its exit code.
+
+    Returns None, so the caller runs the command itself, when no daemon is
+    listening, when forwarding is disabled with SAK_NO_DAEMON, for `serve`, when
+    stdin is a pipe, or when the daemon acts as another account. Forwarded
+    commands run one at a time, so one reading a pipe could wait forever on a
+    forwarded command queued behind it; pipeline stages after the first run here.
+    """
+    if not argv or argv[0] == "serve" or os.getenv("SAK_NO_DAEMON"):
+        return None
+    stdin = sys.stdin
+    if stdin is not None and _is_stream(stdin):
+        return None
+    path = path or socket_path()
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+
+    streams = {"stdout": sys.stdout, "stderr": sys.stderr}
+    with sock, sock.makefile("rb") as replies:
+        header = {
+            "argv": argv,
+            "cwd": os.getcwd(),
+            "stdin_tty": stdin is None or stdin.isatty(),
+            "env": _sak_env(),
+            "account": account_key(),
+        }
+        sock.sendall(json.dumps(header).encode() + b"\n")
+
+        for line in replies:
+            frame = json.loads(line)
+            if "exit" in frame:
+                return frame["exit"]
+            if "refused" in frame:
+                return None
+            if "read" in frame:
+                data = stdin.buffer.read1(frame["read"]) if stdin is not None else b""
+                sock.sendall(b"%d\n" % len(data) + data)
+                continue
+            out = streams[frame["stream"]]
+            out.write(frame["data"])
+            out.flush()
+    sys.stderr.write("sak: daemon closed the connection without an exit code\n")
+    return 1
+
+
+def is_running(path: Optional[Path] = None) -> bool:
+    """Whether a daemon is accepting connections on the socket."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(path or socket_path()))
+        except OSError:
+            return False
+    return True
+
+
+class _FrameWriter(io.TextIOBase):
+    """Text stream that relays every write to the client as a JSON frame."""
+
+    def __init__(self, wfile, stream: str, lock: threading.Lock):
+        self._wfile = wfile
+        self._stream = stream
+        self._lock = lock
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return False
+
+    def write(self, data: str) -> int:
+        if data:
+            frame = json.dumps({"stream": self._stream, "data": data}).encode() + b"\n"
+            with self._lock:
+                self._wfile.write(frame)
+                self._wfile.flush()
+        return len(data)
+
+
+class _StdinReader(io.RawIOBase):
+    """Raw reader that asks the client for its stdin only as the command reads it."""
+
+    def __init__(self, rfile, wfile, lock: threading.Lock):
+        self._rfile = rfile
+        self._wfile = wfile
+        self._lock = lock
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._eof:
+            return 0
+        with self._lock:
+            self._wfile.write(json.dumps({"read": len(buffer)}).encode() + b"\n")
+            self._wfile.flush()
+        size = int(self._rfile.readline() or 0)
+        data = self._rfile.read(size) if size else b""
+        self._eof = not data
+        buffer[:len(data)] = data
+        return len(data)
+
+
+class _ForwardedStdin(io.TextIOWrapper):
+    """Client stdin read on demand over the socket, reporting the client's isatty()."""
+
+    def __init__(self, reader: _StdinReader, tty: bool):
+        super().__init__(io.BufferedReader(reader), encoding="utf-8")
+        self._tty = tty
+
+    def isatty(self) -> bool:
+        return self._tty
+
+
+@contextlib.contextmanager
+def _client_env(env: Dict[str, str]) -> Iterator[None]:
+    """Run with the client's SAK_* variables in place of the daemon's, restoring them after.
+
+    Settings are read from the environment on each use, so options like SAK_STATS
+    and SAK_CACHE_DIR follow the client. The rate governor is built once, so the
+    rate limit settings stay the daemon's.
+    """
+    saved = _sak_env()
+    for name in saved.keys() - env.keys():
+        del os.environ[name]
+    os.environ.update(env)
+    try:
+        yield
+    finally:
+        for name in _sak_env().keys() - saved.keys():
+            del os.environ[name]
+        os.environ.update(saved)
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix-socket server that runs forwarded CLI invocations in this process.
+
+    Commands share the process-wide stdio, working directory and environment,
+    so they run one at a time; clients queue on the lock. Only clients whose
+    account_key() matches the one taken when the server starts are served.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: Path, run: Callable[[List[str]], None]):
+        self.run_command = run
+        self.command_lock = threading.Lock()
+        self.account = account_key()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists():
+            path.unlink()  # Stale socket from a daemon that did not shut down cleanly
+        super().__init__(str(path), _Handler)
+        os.chmod(path, 0o600)  # The socket acts with the owner's Spotify token
+
+    def server_close(self) -> None:
+        super().server_close()
+        Path(self.server_address).unlink(missing_ok=True)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: DaemonServer
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return  # is_running() probing the socket
+        header = json.loads(line)
+        if header.get("account") != self.server.account:
+            self.wfile.write(json.dumps({"refused": "another account"}).encode() + b"\n")
+            return
+        frame_lock = threading.Lock()
+        stdin = _ForwardedStdin(
+            _StdinReader(self.rfile, self.wfile, frame_lock), header["stdin_tty"]
+        )
+        stdout = _FrameWriter(self.wfile, "stdout", frame_lock)
+        stderr = _FrameWriter(self.wfile, "stderr", frame_lock)
+
+        with self.server.command_lock:
+            saved = sys.stdin, sys.stdout, sys.stderr, os.getcwd()
+            sys.stdin, sys.stdout, sys.stderr = stdin, stdout, stderr
+            try:
+                os.chdir(header["cwd"])
+                with _client_env(header.get("env", {})):
+                    self.server.run_command(header["argv"])
+                code = 0
+            except SystemExit as e:
+                code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            except Exception:
+                traceback.print_exc()
+                code = 1
+            finally:
+                sys.stdin, sys.stdout, sys.stderr = saved[:3]
+                os.chdir(saved[3])
+        with frame_lock:
+            self.wfile.write(json.dumps({"exit": code}).encode() + b"\n")
+            self.wfile.flush()
@@ -0,0 +1,107 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from .config import settings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    tracks TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS batches (
+    job_id TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    batch INTEGER NOT NULL,
+    PRIMARY KEY (job_id, stage, batch)
+);
+"""
+
+
+def write_job_id(kind: str, *targets: object, tracks: List[str]) -> str:
+    """Identify a bulk write job by its kind, target playlists/options and input tracks."""
+    payload = json.dumps([kind, targets, tracks], separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class WriteJournal:
+    """SQLite write-ahead journal of the batches each bulk write job has confirmed.
+
+    A job stores the track list it writes, so a resumed job replays exactly the
+    same batches, and records every batch number once a stage ("add", "remove")
+    has been confirmed for it. Finished jobs are deleted; jobs untouched for
+    max_age seconds are pruned on open. Safe to share between writer threads.
+    """
+
+    def __init__(self, path: Path, max_age: float):
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            stale = self._conn.execute(
+                "SELECT job_id FROM jobs WHERE updated_at < ?", (time.time() - max_age,)
+            ).fetchall()
+            for (job_id,) in stale:
+                self._delete(job_id)
+
+    def load(self, job_id: str) -> Optional[Tuple[List[str], Dict[str, Set[int]]]]:
+        """Return (tracks, stage → confirmed batch numbers) for an unfinished job, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT tracks FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            done: Dict[str, Set[int]] = {}
+            for stage, batch in self._conn.execute(
+                "SELECT stage, batch FROM batches WHERE job_id = ?", (job_id,)
+            ):
+                done.setdefault(stage, set()).add(batch)
+        return json.loads(row[0]), done
+
+    def begin(self, job_id: str, tracks: List[str]) -> None:
+        """Start a job from scratch, forgetting any batches recorded by an earlier run."""
+        with self._lock, self._conn:
+            self._delete(job_id)
+            self._conn.execute(
+                "INSERT INTO jobs VALUES (?, ?, ?)",
+                (job_id, json.dumps(tracks, separators=(",", ":")), time.time()),
+            )
+
+    def record(self, job_id: str, stage: str, batch: int) -> None:
+        """Durably note that a stage of a batch has been confirmed by the API."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO batches VALUES (?, ?, ?)", (job_id, stage, batch)
+            )
+            self._conn.execute(
+                "UPDATE jobs SET updated_at = ? WHERE job_id = ?", (time.time(), job_id)
+            )
+
+    def finish(self, job_id: str) -> None:
+        """Drop a completed job."""
+        with self._lock, self._conn:
+            self._delete(job_id)
+
+    def _delete(self, job_id: str) -> None:
+        self._conn.execute("DELETE FROM batches WHERE job_id = ?", (job_id,))
+        self._conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def get_write_journal() -> WriteJournal:
+    """Open the write journal configured in settings."""
+    return WriteJournal(
+        settings.SAK_CACHE_DIR / "journal.sqlite3",
+        max_age=settings.SAK_JOURNAL_MAX_AGE,
+    )
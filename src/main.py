@@ -3,7 +3,6 @@ from pathlib import Path
 from typing import List, Optional
 
 import typer
-from rich.console import Console
 
 from .commands.playlist import LIKED_SENTINEL
 from .commands.playlist import (
@@ -16,7 +15,13 @@ from .commands.playlist import (
     find_playlist as do_find_playlist,
 )
 from .commands.playlist import (
-    get_liked_track_uris as do_get_liked_track_uris,
+    find_playlist_fuzzy as do_find_playlist_fuzzy,
+)
+from .commands.playlist import (
+    iter_source_tracks as do_iter_source_tracks,
+)
+from .commands.playlist import (
+    move_liked_tracks as do_move_liked_tracks,
 )
 from .commands.playlist import (
     move_tracks as do_move_tracks,
@@ -27,18 +32,33 @@ from .commands.playlist import (
 from .commands.playlist import (
     resolve_playlist_id as do_resolve_playlist_id,
 )
+from .commands.playlist import (
+    resolve_playlist_ids as do_resolve_playlist_ids,
+)
 from .commands.playlist import (
     search_tracks as do_search_tracks,
 )
-from .spotify_client import get_spotify
-from .utils import format_track, parse_playlist_id
+from .utils import LazyConsole, format_track, parse_playlist_id
 
 app = typer.Typer(help="Swedish Army Knife for Spotify actions.")
 playlist_app = typer.Typer(help="Playlist management commands.")
 app.add_typer(playlist_app, name="playlist")
 
-console = Console()
-err_console = Console(stderr=True)
+console = LazyConsole()
+err_console = LazyConsole(stderr=True)
+
+
+# Set while `sak serve` runs, so forwarded commands share one authenticated client
+_warm_client = None
+
+
+def get_spotify():
+    """Return an authenticated client; spotipy is only imported once a command needs it."""
+    if _warm_client is not None:
+        return _warm_client
+    from .spotify_client import get_spotify as connect
+
+    return connect()
 
 
 def is_interactive() -> bool:
@@ -62,6 +82,67 @@ def _read_tracks(tracks_file: Optional[Path]) -> List[str]:
         return [line.strip() for line in sys.stdin if line.strip()]
 
 
+def _report_stats(show: bool, json_path: Optional[Path]) -> None:
+    """Print the run's API call summary to stderr and/or write it as JSON."""
+    import json
+
+    from .stats import get_run_stats
+
+    snapshot = get_run_stats().snapshot()
+    if json_path:
+        json_path.write_text(json.dumps(snapshot, indent=2) + "\n")
+    if not show:
+        return
+
+    from rich.table import Table
+
+    table = Table(title=f"API calls ({snapshot['wall_seconds']:.2f}s wall)")
+    for column in ("Endpoint", "Calls", "Requests", "Retries", "429s", "Pages", "KiB"):
+        if column == "Endpoint":
+            table.add_column(column, no_wrap=True)
+        else:
+            table.add_column(column, justify="right")
+    table.add_column("Avg ms", justify="right")
+    table.add_column("Max ms", justify="right")
+    for name, s in snapshot["endpoints"].items():
+        avg = s["seconds"] / s["requests"] * 1000 if s["requests"] else 0
+        table.add_row(
+            name, str(s["calls"]), str(s["requests"]), str(s["retries"]), str(s["throttled"]),
+            str(s["pages"]), f"{s['bytes'] / 1024:.1f}", f"{avg:.0f}",
+            f"{s['max_seconds'] * 1000:.0f}",
+        )
+    err_console.print(table)
+    for name, value in snapshot["counters"].items():
+        err_console.print(f"[dim]{name}:[/] {value}")
+
+
+@app.callback()
+def main(
+    ctx: typer.Context,
+    stats: bool = typer.Option(
+        False, "--stats", envvar="SAK_STATS", help="Print API call statistics to stderr."
+    ),
+    stats_json: Optional[Path] = typer.Option(
+        None, "--stats-json", envvar="SAK_STATS_JSON", help="Write API call statistics as JSON."
+    ),
+    trace: Optional[Path] = typer.Option(
+        None, "--trace", envvar="SAK_TRACE",
+        help="Write a Chrome trace (open in ui.perfetto.dev) of API calls, pages and batches.",
+    ),
+):
+    """Swedish Army Knife for Spotify actions."""
+    if stats or stats_json:
+        from .stats import get_run_stats
+
+        get_run_stats().reset()  # A `sak serve` process keeps counting across commands
+        ctx.call_on_close(lambda: _report_stats(stats, stats_json))
+    if trace:
+        from .trace import start_tracing, stop_tracing
+
+        start_tracing()
+        ctx.call_on_close(lambda: stop_tracing().write(trace))
+
+
 @app.command()
 def status():
     """Check Spotify connection status."""
@@ -75,6 +156,72 @@ def status():
         raise typer.Exit(1)
 
 
+@app.command()
+def pipe(
+    stages: List[str] = typer.Argument(
+        ..., help='Quoted stages, e.g. "list Inbox" "filter --unique" "add Archive".'
+    ),
+):
+    """Run list/search/filter/add/move stages in one process, streaming tracks between them.
+
+    Stages: list PLAYLIST [--no-cache] | search [--in-playlist P] [--no-cache]
+    | filter [--artist S] [--title S] [--not-in P] [--unique]
+    | add PLAYLIST [--create] | move DEST [--from SRC] [--create] | print [--output FMT].
+    A pipe starting with search reads 'Artist - Title' lines from stdin; without a
+    final add/move/print stage, tracks are printed as URIs.
+    """
+    from .commands.pipe import parse_stages, run_pipeline
+
+    try:
+        specs = parse_stages(stages)
+    except ValueError as e:
+        err_console.print(f"[bold red]Error:[/] {str(e)}")
+        raise typer.Exit(1)
+    if specs[0].name == "search" and is_interactive():
+        err_console.print(
+            "[bold red]Error:[/] No input provided. Pipe 'Artist - Title' lines via stdin."
+        )
+        raise typer.Exit(1)
+
+    try:
+        sp = get_spotify()
+        run_pipeline(sp, specs, sys.stdin)
+    except Exception as e:
+        err_console.print(f"[bold red]Pipe Failed:[/] {str(e)}")
+        raise typer.Exit(1)
+
+
+@app.command()
+def serve():
+    """Run a local daemon that keeps the Spotify client, connections and caches warm.
+
+    While it runs, other sak commands forward to it over a Unix socket in the
+    cache directory. Set SAK_NO_DAEMON=1 to run a command in its own process.
+    """
+    global _warm_client
+    from .daemon import DaemonServer, is_running, socket_path
+
+    path = socket_path()
+    if is_running(path):
+        err_console.print(f"[bold red]Error:[/] A daemon is already serving on {path}.")
+        raise typer.Exit(1)
+    try:
+        _warm_client = get_spotify()
+    except Exception as e:
+        err_console.print(f"[bold red]Connection Failed:[/] {str(e)}")
+        raise typer.Exit(1)
+
+    server = DaemonServer(path, run=lambda argv: app(args=argv, prog_name="sak"))
+    err_console.print(f"[green]Serving on[/] {path} [dim](Ctrl-C to stop)[/]")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        _warm_client = None
+
+
 @playlist_app.command(name="create")
 def create(name: str = typer.Option(..., "--name", "-n", help="Name of the new playlist.")):
     """Create a new playlist."""
@@ -102,12 +249,19 @@ def move(
     create: bool = typer.Option(
         False, "--create", help="Treat --to as a name: find or create the playlist."
     ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Always refetch the source playlist for --strict."
+    ),
+    resume: bool = typer.Option(
+        False, "--resume", help="Skip batches an interrupted run of this move already applied."
+    ),
 ):
     """Move tracks from one playlist to another. Reads track URIs from file or stdin.
 
-    If --from liked and no file/stdin, all Liked Songs are fetched automatically.
+    If --from liked and no file/stdin, all Liked Songs are moved, page by page, as they load.
     If --strict is used, it verifies tracks exist in the source playlist before moving.
     If --create is used, --to is treated as a playlist name and created if it doesn't exist.
+    If --resume is used, an interrupted move of the same tracks picks up where it stopped.
     """
     liked_auto = source == LIKED_SENTINEL and tracks_file is None and is_interactive()
 
@@ -120,21 +274,24 @@ def move(
     try:
         sp = get_spotify()
 
-        if liked_auto:
-            tracks = list(do_get_liked_track_uris(sp))
-            if not tracks:
-                console.print("[yellow]No liked tracks found.[/]")
-                return
-
-        source_id = do_resolve_playlist_id(sp, source)
+        if liked_auto and sp.current_user_saved_tracks(limit=1)["total"] == 0:
+            console.print("[yellow]No liked tracks found.[/]")
+            return
 
         if create:
+            source_id = do_resolve_playlist_id(sp, source)
             dest_id, was_created = do_resolve_or_create(sp, dest)
             if was_created:
                 console.print(f"[green]Created playlist:[/] {dest} ({dest_id})")
         else:
-            dest_id = do_resolve_playlist_id(sp, dest)
-        do_move_tracks(sp, tracks, source_id, dest_id, strict=strict)
+            source_id, dest_id = do_resolve_playlist_ids(sp, [source, dest])
+        if liked_auto:
+            # Stream pages straight into the move instead of collecting them first
+            do_move_liked_tracks(sp, dest_id)
+            return
+        do_move_tracks(
+            sp, tracks, source_id, dest_id, strict=strict, use_cache=not no_cache, resume=resume
+        )
     except Exception as e:
         err_console.print(f"[bold red]Move Failed:[/] {str(e)}")
         raise typer.Exit(1)
@@ -147,13 +304,21 @@ def search(
     in_playlist: Optional[str] = typer.Option(
         None, "--in-playlist", help="Restrict search to a specific playlist ID."
     ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Bypass the search result and playlist caches."
+    ),
+    unordered: bool = typer.Option(
+        False, "--unordered", help="Print global search results as they complete."
+    ),
 ):
     """Search for tracks and output URIs. Reads 'Artist - Title' lines from stdin."""
     if format_opt:
         output = format_opt
 
     if is_interactive():
-        err_console.print("[bold red]Error:[/] No input provided. Pipe 'Artist - Title' lines via stdin.")  # noqa: E501
+        err_console.print(
+            "[bold red]Error:[/] No input provided. Pipe 'Artist - Title' lines via stdin."
+        )
         raise typer.Exit(1)
 
     try:
@@ -162,14 +327,16 @@ def search(
         err_console.print(f"[bold red]Connection Failed:[/] {str(e)}")
         raise typer.Exit(1)
 
-    lines = sys.stdin.readlines()
-
     if in_playlist:
         in_playlist = do_resolve_playlist_id(sp, in_playlist)
 
-    for track in do_search_tracks(sp, lines, playlist_id=in_playlist):
+    # Stream stdin so results are written while later lines are still being read
+    results = do_search_tracks(
+        sp, sys.stdin, playlist_id=in_playlist, use_cache=not no_cache, unordered=unordered
+    )
+    for track in results:
         if track:
-            print(format_track(track, output))
+            print(format_track(track, output), flush=True)
 
 
 @playlist_app.command(name="list")
@@ -179,6 +346,7 @@ def list_tracks(
         None, "--id", "-i", help="Spotify playlist ID, or 'liked' for Liked Songs"
     ),
     output: str = typer.Option("text", "--output", "-o", help="Output: text, uri, id"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Always refetch the playlist."),
 ):
     """List tracks from a playlist. Default output is 'Artist - Title'.
 
@@ -197,16 +365,8 @@ def list_tracks(
     try:
         sp = get_spotify()
         playlist_id = do_resolve_playlist_id(sp, playlist_id)
-        if playlist_id == LIKED_SENTINEL:
-            results = sp.current_user_saved_tracks()
-        else:
-            results = sp.playlist_tracks(playlist_id)
-        while results:
-            for item in results["items"]:
-                track = item["track"]
-                if track:  # Can be None for local/unavailable tracks
-                    print(format_track(track, output))
-            results = sp.next(results) if results.get("next") else None
+        for track in do_iter_source_tracks(sp, playlist_id, use_cache=not no_cache):
+            print(format_track(track, output))
     except Exception as e:
         err_console.print(f"[bold red]Error:[/] {str(e)}")
         raise typer.Exit(1)
@@ -224,10 +384,14 @@ def add_tracks_to_playlist(
     create: bool = typer.Option(
         False, "--create", help="Create playlist by name if it doesn't exist."
     ),
+    resume: bool = typer.Option(
+        False, "--resume", help="Skip batches an interrupted run of this add already applied."
+    ),
 ):
     """Add tracks to a playlist. Reads track URIs from file or stdin.
 
     If --create is used, --id is treated as a name and created if it doesn't exist.
+    If --resume is used, an interrupted add of the same tracks picks up where it stopped.
     """
     if url:
         playlist_id = parse_playlist_id(url)
@@ -253,18 +417,26 @@ def add_tracks_to_playlist(
                 console.print(f"[green]Created playlist:[/] {playlist_id}")
         else:
             playlist_id = do_resolve_playlist_id(sp, playlist_id)
-        do_add_tracks(sp, tracks, playlist_id)
+        do_add_tracks(sp, tracks, playlist_id, resume=resume)
     except Exception as e:
         err_console.print(f"[bold red]Add Failed:[/] {str(e)}")
         raise typer.Exit(1)
 
 
 @playlist_app.command(name="find")
-def find_playlist(name: str = typer.Argument(..., help="The name of the playlist to find.")):
+def find_playlist(
+    name: str = typer.Argument(..., help="The name of the playlist to find."),
+    fuzzy: bool = typer.Option(
+        False, "--fuzzy", help="Fall back to the closest matching name."
+    ),
+):
     """Find a playlist ID by its name."""
     try:
         sp = get_spotify()
-        playlist_id = do_find_playlist(sp, name)
+        if fuzzy:
+            playlist_id = do_find_playlist_fuzzy(sp, name)
+        else:
+            playlist_id = do_find_playlist(sp, name)
         if playlist_id:
             console.print(playlist_id)
         else:
@@ -277,5 +449,16 @@ def find_playlist(name: str = typer.Argument(..., help="The name of the playlist
         raise typer.Exit(1)
 
 
+def run() -> None:
+    """Console entry point: hand the invocation to a running `sak serve`, else run it here."""
+    from .daemon import forward
+
+    code = forward(sys.argv[1:])
+    if code is None:
+        app()
+    else:
+        sys.exit(code)
+
+
 if __name__ == "__main__":
-    app()
+    run()
@@ -0,0 +1,156 @@
+import logging
+import random
+import threading
+import time
+from typing import Callable, Optional, TypeVar
+
+import spotipy
+from requests.adapters import HTTPAdapter
+from spotipy.exceptions import SpotifyException
+
+from .config import settings
+
+T = TypeVar("T")
+
+# spotipy retries these itself; 429 is left to the governor so it can back off globally
+SPOTIPY_RETRY_CODES = (500, 502, 503, 504)
+
+
+def _is_not_throttle(record: logging.LogRecord) -> bool:
+    # spotipy logs every HTTP error; 429s are expected and retried by the governor
+    return " returned 429 " not in record.getMessage()
+
+
+class RateGovernor:
+    """Rate control shared by every API call in the process.
+
+    An AIMD limit caps concurrency: each success widens it by ~1 per window, each
+    429 halves it. A 429 also pauses all callers for its Retry-After (plus jitter)
+    before the call is retried. An optional token bucket (rate > 0) caps the
+    request rate as well; with rate 0 the 429s alone find the allowed rate.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        max_concurrency: int,
+        min_concurrency: int = 1,
+        max_retries: int = 5,
+        jitter: float = 1.0,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_retries = max_retries
+        self.jitter = jitter
+        self.limit = float(max_concurrency)
+        self.in_flight = 0
+        self.throttled = 0
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+
+    def call(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        """Run fn under the governor, retrying it after 429 responses."""
+        attempt = 0
+        while True:
+            self._acquire()
+            try:
+                result = fn(*args, **kwargs)
+            except SpotifyException as e:
+                self._release(success=False)
+                if e.http_status != 429 or attempt >= self.max_retries:
+                    raise
+                self._throttle(_retry_after(e, attempt))
+                attempt += 1
+                continue
+            except BaseException:
+                self._release(success=False)
+                raise
+            self._release(success=True)
+            return result
+
+    def _acquire(self) -> None:
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._refilled_at) * self.rate
+                )
+                self._refilled_at = now
+                wait = self._paused_until - now
+                if wait <= 0 and self.rate > 0 and self._tokens < 1:
+                    wait = (1 - self._tokens) / self.rate
+                if wait <= 0 and self.in_flight < int(self.limit):
+                    self._tokens -= 1
+                    self.in_flight += 1
+                    return
+                self._cond.wait(wait if wait > 0 else None)
+
+    def _release(self, success: bool) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            if success:
+                self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+    def _throttle(self, retry_after: float) -> None:
+        with self._cond:
+            self.throttled += 1
+            self.limit = max(self.min_concurrency, self.limit / 2)
+            resume = time.monotonic() + retry_after + random.uniform(0, self.jitter)
+            self._paused_until = max(self._paused_until, resume)
+            self._cond.notify_all()
+
+
+def _retry_after(error: SpotifyException, attempt: int) -> float:
+    """Seconds to wait after a 429: the Retry-After header, else exponential backoff."""
+    value = (error.headers or {}).get("Retry-After")
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float(2 ** attempt)
+
+
+_governor: Optional[RateGovernor] = None
+_governor_lock = threading.Lock()
+
+
+def get_governor() -> RateGovernor:
+    """Return the process-wide governor, configured from settings on first use."""
+    global _governor
+    with _governor_lock:
+        if _governor is None:
+            _governor = RateGovernor(
+                rate=settings.SAK_RATE_LIMIT,
+                burst=settings.SAK_RATE_BURST,
+                max_concurrency=settings.SAK_MAX_CONCURRENCY,
+                max_retries=settings.SAK_MAX_RETRIES,
+                jitter=settings.SAK_RETRY_JITTER,
+            )
+        return _governor
+
+
+def govern(sp: spotipy.Spotify, governor: RateGovernor) -> spotipy.Spotify:
+    """Route every HTTP call made by sp through governor, which alone handles 429s.
+
+    Leaving 429 out of status_forcelist is not enough: urllib3 still replays any
+    429 that carries Retry-After (Spotify always sends one), sleeping inside the
+    call while it holds a governor slot. sp's adapters are remounted with that off.
+    """
+    retry = sp._session.get_adapter("https://").max_retries.new(respect_retry_after_header=False)
+    adapter = HTTPAdapter(max_retries=retry)
+    sp._session.mount("http://", adapter)
+    sp._session.mount("https://", adapter)
+    logging.getLogger("spotipy.client").addFilter(_is_not_throttle)
+
+    internal_call = sp._internal_call
+
+    def governed_call(*args, **kwargs):
+        return governor.call(internal_call, *args, **kwargs)
+
+    sp._internal_call = governed_call
+    return sp
@@ -4,7 +4,10 @@ import spotipy
 from rich.console import Console
 from spotipy.oauth2 import SpotifyOAuth
 
+from .auth import LockedCacheFileHandler, TokenManager
 from .config import settings
+from .rate_limit import SPOTIPY_RETRY_CODES, get_governor, govern
+from .stats import get_run_stats, instrument
 
 console = Console()
 err_console = Console(stderr=True)
@@ -16,6 +19,9 @@ class SpotifyClient:
     )
 
     def __init__(self, scope: str = _DEFAULT_SCOPE):
+        self.api_url = settings.SAK_API_URL
+        if self.api_url:
+            return  # A local stand-in API takes any token, so no OAuth is set up
         if not settings.is_spotify_configured:
             err_console.print("[bold red]Error:[/] Spotify credentials not found in .env file.")
             err_console.print("Set SPOTIPY_CLIENT_ID and SPOTIPY_CLIENT_SECRET in .env.")
@@ -26,10 +32,16 @@ class SpotifyClient:
             client_secret=settings.SPOTIPY_CLIENT_SECRET,
             redirect_uri=settings.SPOTIPY_REDIRECT_URI,
             scope=scope,
-            cache_path=".cache"
+            cache_handler=LockedCacheFileHandler(".cache"),
         )
-        
+        self.tokens = TokenManager(self.sp_oauth, refresh_ahead=settings.SAK_TOKEN_REFRESH_AHEAD)
+
     def get_client(self) -> spotipy.Spotify:
+        if self.api_url:
+            sp = spotipy.Spotify(auth="local", status_forcelist=SPOTIPY_RETRY_CODES)
+            sp.prefix = self.api_url.rstrip("/") + "/"
+            return instrument(govern(sp, get_governor()), get_run_stats())
+
         token_info = self.sp_oauth.get_cached_token()
 
         if not token_info:
@@ -42,7 +54,9 @@ class SpotifyClient:
             code = self.sp_oauth.parse_response_code(redirect_url)
             self.sp_oauth.get_access_token(code, as_dict=False, check_cache=False)
 
-        return spotipy.Spotify(auth_manager=self.sp_oauth)
+        # Requests take the token from memory instead of re-reading the cache file each time
+        sp = spotipy.Spotify(auth_manager=self.tokens, status_forcelist=SPOTIPY_RETRY_CODES)
+        return instrument(govern(sp, get_governor()), get_run_stats())
 
 # Shared instance helper
 def get_spotify() -> spotipy.Spotify:
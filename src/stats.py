@@ -0,0 +1,162 @@
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .trace import span
+
+# Upper bounds (ms) of the per-endpoint HTTP latency histogram; the last bucket is open
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000)
+
+_API_PREFIX = re.compile(r"^https?://[^/]+/v1/")
+_ID_SEGMENT = re.compile(r"^[0-9A-Za-z]{22}$")
+
+
+def endpoint_name(method: str, url: str) -> str:
+    """Group a request URL by endpoint: "GET playlists/{id}/tracks"."""
+    path = _API_PREFIX.sub("", url).split("?", 1)[0].strip("/")
+    segments = path.split("/")
+    for i, segment in enumerate(segments):
+        if _ID_SEGMENT.match(segment) or (i and segments[i - 1] == "users"):
+            segments[i] = "{id}"
+    return f"{method} {'/'.join(segments)}"
+
+
+@dataclass
+class EndpointStats:
+    calls: int = 0  # Client calls, each covering any retries it needed
+    requests: int = 0  # HTTP requests actually sent
+    retries: int = 0
+    throttled: int = 0  # 429 responses
+    errors: int = 0  # Calls that raised
+    pages: int = 0
+    bytes: int = 0
+    seconds: float = 0.0  # Summed HTTP latency
+    max_seconds: float = 0.0
+    histogram: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+
+
+class RunStats:
+    """API call and cache counters for one run, shared by every thread.
+
+    Client calls and the HTTP requests under them are recorded separately, so
+    retries (429s replayed by the governor, 5xx retried by urllib3) show up as
+    requests - calls.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.started = time.perf_counter()
+            self.endpoints: Dict[str, EndpointStats] = {}
+            self.counters: Counter = Counter()
+
+    def _endpoint(self, name: str) -> EndpointStats:
+        stats = self.endpoints.get(name)
+        if stats is None:
+            stats = self.endpoints[name] = EndpointStats()
+        return stats
+
+    def record_call(self, endpoint: str, page: bool, failed: bool) -> None:
+        with self._lock:
+            stats = self._endpoint(endpoint)
+            stats.calls += 1
+            stats.pages += page
+            stats.errors += failed
+
+    def record_request(
+        self, endpoint: str, status: Optional[int], nbytes: int, seconds: float, retries: int = 0
+    ) -> None:
+        """Record one HTTP request; retries counts attempts urllib3 made inside it."""
+        bucket = next(
+            (i for i, bound in enumerate(LATENCY_BUCKETS_MS) if seconds * 1000 <= bound),
+            len(LATENCY_BUCKETS_MS),
+        )
+        with self._lock:
+            stats = self._endpoint(endpoint)
+            stats.requests += 1
+            stats.retries += retries + (status == 429)
+            stats.throttled += status == 429
+            stats.bytes += nbytes
+            stats.seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.histogram[bucket] += 1
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Bump a named counter, e.g. "playlist_cache.hits"."""
+        with self._lock:
+            self.counters[name] += n
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-ready summary of the run so far."""
+        with self._lock:
+            return {
+                "wall_seconds": round(time.perf_counter() - self.started, 3),
+                "latency_buckets_ms": list(LATENCY_BUCKETS_MS),
+                "endpoints": {name: asdict(s) for name, s in sorted(self.endpoints.items())},
+                "counters": dict(sorted(self.counters.items())),
+            }
+
+
+def instrument(sp, stats: RunStats):
+    """Record every call sp makes, and every HTTP request under it, in stats.
+
+    Apply after govern(), so a call's time includes waiting on the governor.
+    HTTP requests are also recorded as "http" spans while tracing is on.
+    """
+    internal_call = sp._internal_call
+
+    def recorded_call(method, url, *args, **kwargs):
+        result, failed = None, True
+        try:
+            result = internal_call(method, url, *args, **kwargs)
+            failed = False
+            return result
+        finally:
+            page = isinstance(result, dict) and "items" in result
+            stats.record_call(endpoint_name(method, url), page=page, failed=failed)
+
+    session = sp._session
+    request = session.request
+
+    def recorded_request(method, url, *args, **kwargs):
+        endpoint = endpoint_name(method, url)
+        start = time.perf_counter()
+        response = None
+        with span(endpoint, "http") as trace_args:
+            try:
+                response = request(method, url, *args, **kwargs)
+                return response
+            finally:
+                status = getattr(response, "status_code", None)
+                trace_args["status"] = status
+                retry = getattr(getattr(response, "raw", None), "retries", None)
+                stats.record_request(
+                    endpoint,
+                    status=status,
+                    nbytes=len(response.content) if response is not None else 0,
+                    seconds=time.perf_counter() - start,
+                    retries=len(getattr(retry, "history", ())),
+                )
+
+    sp._internal_call = recorded_call
+    session.request = recorded_request
+    return sp
+
+
+_run_stats: Optional[RunStats] = None
+_run_stats_lock = threading.Lock()
+
+
+def get_run_stats() -> RunStats:
+    """Return the process-wide run stats."""
+    global _run_stats
+    with _run_stats_lock:
+        if _run_stats is None:
+            _run_stats = RunStats()
+        return _run_stats
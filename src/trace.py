@@ -0,0 +1,83 @@
+import contextlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class Tracer:
+    """Collects spans as Chrome trace events, viewable in Perfetto or chrome://tracing.
+
+    Each span becomes a complete ("X") event on the thread that ran it, so
+    concurrent page fetches, searches and write batches show up side by side.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._events: List[Dict[str, Any]] = []
+        self._threads: Dict[int, str] = {}
+
+    @contextlib.contextmanager
+    def span(self, name: str, cat: str, **args: Any) -> Iterator[Dict[str, Any]]:
+        """Time the block; the yielded dict becomes the event's args and may be added to."""
+        start = time.perf_counter()
+        try:
+            yield args
+        finally:
+            end = time.perf_counter()
+            thread = threading.current_thread()
+            event = {
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": (start - self._origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": self._pid,
+                "tid": thread.native_id,
+                "args": args,
+            }
+            with self._lock:
+                self._events.append(event)
+                self._threads.setdefault(thread.native_id, thread.name)
+
+    def write(self, path: Path) -> None:
+        with self._lock:
+            names = [
+                {"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid,
+                 "args": {"name": name}}
+                for tid, name in self._threads.items()
+            ]
+            events = names + sorted(self._events, key=lambda e: e["ts"])
+        path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}))
+
+
+_tracer: Optional[Tracer] = None
+
+
+def start_tracing() -> Tracer:
+    """Start recording spans for this process."""
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
+
+
+def stop_tracing() -> Optional[Tracer]:
+    """Stop recording and return the tracer that was active, if any."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+@contextlib.contextmanager
+def span(name: str, cat: str, **args: Any) -> Iterator[Dict[str, Any]]:
+    """Record the block as a span when tracing is on; otherwise just run it."""
+    tracer = _tracer
+    if tracer is None:
+        yield args
+        return
+    with tracer.span(name, cat, **args) as event_args:
+        yield event_args
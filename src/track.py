@@ -0,0 +1,65 @@
+import sys
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+
+# Web API `fields` filter selecting what Track.from_api reads from a track object
+TRACK_FIELDS = "uri,name,artists(name),album(release_date)"
+
+
+@dataclass(frozen=True, slots=True)
+class Track:
+    """The few fields sak uses from a Spotify track object.
+
+    A full API track dict (album art, markets, external IDs...) takes several KB
+    in memory; a Track is a slotted record of four references. Artist names are
+    interned, so a library repeating the same artists stores each name once.
+    """
+
+    uri: str
+    name: str
+    artists: Tuple[str, ...]
+    release_date: Optional[str] = None
+
+    @property
+    def id(self) -> Optional[str]:
+        """Base-62 ID from the URI; None for local files, like the API's id field."""
+        parts = self.uri.split(":")
+        return parts[2] if len(parts) == 3 else None
+
+    @property
+    def line(self) -> str:
+        """The track as an "Artist, Artist - Title" line."""
+        return f"{', '.join(self.artists)} - {self.name}"
+
+    @classmethod
+    def from_api(cls, track: dict) -> "Track":
+        """Build a Track from an API track object, keeping only the used fields."""
+        return cls(
+            track['uri'],
+            track.get('name') or "",
+            tuple(sys.intern(a['name']) for a in track.get('artists') or () if a.get('name')),
+            (track.get('album') or {}).get('release_date'),
+        )
+
+    def to_row(self) -> List[Any]:
+        """Compact JSON-ready form for the caches; inverse of from_row."""
+        return [self.uri, self.name, list(self.artists), self.release_date]
+
+    @classmethod
+    def from_row(cls, row: Any) -> "Track":
+        """Rebuild a Track from to_row output."""
+        uri, name, artists, release_date = row
+        return cls(uri, name, tuple(sys.intern(a) for a in artists), release_date)
+
+
+# A Liked Songs entry: (track, added_at); track is None for unavailable items
+SavedTrack = Tuple[Optional[Track], Optional[str]]
+
+
+def saved_track(item: Any) -> SavedTrack:
+    """Build a SavedTrack from a saved-tracks API item or its cached row."""
+    if isinstance(item, dict):
+        track = item.get('track')
+        return (Track.from_api(track) if track else None), item.get('added_at')
+    row, added_at = item
+    return (Track.from_row(row) if row else None), added_at
@@ -0,0 +1,37 @@
+import re
+from typing import Dict, List, Optional
+
+_TOKEN_RE = re.compile(r"\w+")
+
+TOKEN_PREFIX_LEN = 4         # Tokens are keyed by prefix so "luck" still finds "lucky"
+MAX_POSTING_FRACTION = 0.05  # Keys in more than this share of tracks are too common to prune
+MAX_CANDIDATE_FRACTION = 0.2  # Above this share of tracks, a full scan is just as cheap
+
+
+def _keys(text: str) -> set:
+    return {token[:TOKEN_PREFIX_LEN] for token in _TOKEN_RE.findall(text.casefold())}
+
+
+class TrackTokenIndex:
+    """Inverted index from normalized artist/title tokens to positions in a choice list.
+
+    Used to narrow a fuzzy query to the tracks sharing at least one token with it.
+    """
+
+    def __init__(self, choices: List[str]):
+        self.size = len(choices)
+        postings: Dict[str, List[int]] = {}
+        for position, choice in enumerate(choices):
+            for key in _keys(choice):
+                postings.setdefault(key, []).append(position)
+        max_posting = max(50, int(self.size * MAX_POSTING_FRACTION))
+        self._postings = {k: v for k, v in postings.items() if len(v) <= max_posting}
+
+    def candidates(self, query: str) -> Optional[List[int]]:
+        """Return sorted candidate positions for query, or None when a full scan is needed."""
+        found: set = set()
+        for key in _keys(query):
+            found.update(self._postings.get(key, ()))
+        if not found or len(found) > self.size * MAX_CANDIDATE_FRACTION:
+            return None
+        return sorted(found)
@@ -1,6 +1,8 @@
 import json
 import re
-from typing import Optional
+from typing import Any, Optional, Union
+
+from .track import Track
 
 
 def parse_playlist_id(url: str) -> Optional[str]:
@@ -9,22 +11,40 @@ def parse_playlist_id(url: str) -> Optional[str]:
     return match.group(1) if match else None
 
 
-def format_track(track: dict, output: str) -> str:
-    """Format a track dict for CLI output. output: uri, id, text, or json."""
+def format_track(track: Union[Track, dict], output: str) -> str:
+    """Format a Track (or API track dict) for CLI output. output: uri, id, text, or json."""
+    if isinstance(track, dict):
+        track = Track.from_api(track)
     if output == "id":
-        return track['id']
+        return track.id
     elif output == "text":
-        artists = ', '.join(a['name'] for a in track['artists'])
-        return f"{artists} - {track['name']}"
+        return track.line
     elif output == "json":
-        artists = ', '.join(a['name'] for a in track['artists'])
         data = {
-            "uri": track['uri'],
-            "id": track['id'],
-            "name": track['name'],
-            "artists": artists,
-            "release_date": track.get('album', {}).get('release_date'),
+            "uri": track.uri,
+            "id": track.id,
+            "name": track.name,
+            "artists": ', '.join(track.artists),
+            "release_date": track.release_date,
         }
         return json.dumps(data)
     else:
-        return track['uri']
+        return track.uri
+
+
+class LazyConsole:
+    """A rich Console that is only imported and built on first use.
+
+    Keeps `rich` off the import path of commands that never print through it.
+    """
+
+    def __init__(self, **kwargs: Any):
+        self._kwargs = kwargs
+        self._console = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console(**self._kwargs)
+        return getattr(self._console, name)
@@ -0,0 +1,228 @@
+"""Scaling benchmarks for sak's bulk operations against the local API stand-in.
+
+Each (scenario, library size) runs in its own process against a SpotifyServer
+with injected latency, so peak RSS and the process-wide caches, governor and
+stats start fresh. Results are compared with tests/benchmark_baseline.json.
+
+    python -m tests.benchmark                          # run and check against the baseline
+    python -m tests.benchmark --sizes 1000,100000      # any library sizes
+    python -m tests.benchmark --save                   # rewrite the baseline from this run
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+BASELINE_PATH = Path(__file__).with_name("benchmark_baseline.json")
+SCENARIOS = ("list", "search", "search_in_playlist", "add", "move", "move_strict")
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+LATENCY = 0.02  # Seconds per API response
+
+# Allowed drift from the baseline before a run counts as a regression
+DEFAULT_TOLERANCE = {
+    "throughput": 0.30,  # May drop by up to 30%
+    "p99_ms": 0.50,  # May rise by up to 50%
+    "requests": 0.15,
+    "peak_rss_mb": 0.25,
+}
+# Absolute headroom on top of that: small scenarios make only a handful of requests, so a
+# percentage alone would flag a single extra call
+SLACK = {"requests": 5}
+
+SOURCE = "0000000000000000000001"
+DEST = "0000000000000000000002"
+
+
+def _track(i: int) -> dict:
+    return {
+        "id": f"{i:022d}",
+        "uri": f"spotify:track:{i:022d}",
+        "name": f"Song {i}",
+        "artists": [{"name": f"Band {i % 997}"}],
+        "album": {"release_date": "2020-01-01"},
+    }
+
+
+def _line(track: dict) -> str:
+    return f"{track['artists'][0]['name']} - {track['name']}"
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def run_scenario(scenario: str, size: int) -> Dict[str, float]:
+    """Run one scenario in this process and return its metrics."""
+    from src.commands import playlist
+    from src.stats import get_run_stats
+    from src.trace import start_tracing, stop_tracing
+    from tests.spotify_server import Faults, SpotifyServer
+
+    server = SpotifyServer(Faults(latency=LATENCY))
+    tracks = [_track(i) for i in range(size)]
+    queries = tracks[::10]  # Searches resolve a tenth of the library
+    uris = [t["uri"] for t in tracks]
+
+    if scenario in ("list", "search_in_playlist", "move", "move_strict"):
+        server.add_playlist(SOURCE, tracks=tracks)
+    if scenario == "search":
+        server.add_catalog(tracks)
+    server.add_playlist(DEST)
+
+    operations: Dict[str, Callable[[object], int]] = {
+        "list": lambda sp: sum(1 for _ in playlist.iter_source_tracks(sp, SOURCE, False)),
+        "search": lambda sp: sum(
+            1 for t in playlist.search_tracks(sp, map(_line, queries), use_cache=False) if t
+        ),
+        "search_in_playlist": lambda sp: sum(
+            1 for t in playlist.search_tracks(
+                sp, map(_line, queries), playlist_id=SOURCE, use_cache=False
+            ) if t
+        ),
+        "add": lambda sp: playlist.add_tracks(sp, uris, DEST) or size,
+        "move": lambda sp: playlist.move_tracks(sp, uris, SOURCE, DEST, use_cache=False) or size,
+        # Half the library, plus as many tracks that are not in the source
+        "move_strict": lambda sp: playlist.move_tracks(
+            sp, uris[::2] + [_track(size + i)["uri"] for i in range(size // 2)],
+            SOURCE, DEST, strict=True, use_cache=False,
+        ) or size // 2,
+    }
+
+    with server:
+        sp = server.client()
+        get_run_stats().reset()
+        tracer = start_tracing()
+        start = time.perf_counter()
+        items = operations[scenario](sp)
+        wall = time.perf_counter() - start
+        stop_tracing()
+
+    latencies = [e["dur"] / 1000 for e in tracer._events if e["cat"] == "http"]
+    return {
+        "items": items,
+        "wall_seconds": round(wall, 3),
+        "throughput": round(items / wall, 1),
+        "p50_ms": round(_percentile(latencies, 0.50), 1),
+        "p99_ms": round(_percentile(latencies, 0.99), 1),
+        "requests": sum(server.requests.values()),
+        # Includes the in-process stand-in server, which holds the whole library too
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def _run_isolated(scenario: str, size: int) -> Dict[str, float]:
+    """Run a scenario in a fresh interpreter with its own cache directory."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = {
+            **os.environ,
+            "SAK_CACHE_DIR": cache_dir,
+            "SAK_NO_DAEMON": "1",
+        }
+        out = subprocess.run(
+            [sys.executable, "-m", "tests.benchmark", "--one", scenario, str(size)],
+            env=env, capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parent.parent,
+        )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: Dict[str, float],
+) -> List[str]:
+    """Return a message per metric that regressed beyond tolerance; keys are "scenario/size"."""
+    failures = []
+    for key, metrics in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        floor = base["throughput"] * (1 - tolerance["throughput"])
+        if metrics["throughput"] < floor:
+            failures.append(
+                f"{key}: throughput {metrics['throughput']}/s < {floor:.1f}/s "
+                f"(baseline {base['throughput']}/s)"
+            )
+        for metric in ("p99_ms", "requests", "peak_rss_mb"):
+            ceiling = base[metric] * (1 + tolerance[metric]) + SLACK.get(metric, 0)
+            if metrics[metric] > ceiling:
+                failures.append(
+                    f"{key}: {metric} {metrics[metric]} > {ceiling:.1f} (baseline {base[metric]})"
+                )
+    return failures
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Optional[dict]:
+    return json.loads(path.read_text()) if path.exists() else None
+
+
+def run_suite(
+    scenarios: List[str], sizes: List[int], repeat: int = 3
+) -> Dict[str, Dict[str, float]]:
+    """Run every scenario at every size; each metric is the median over repeat runs."""
+    results = {}
+    for size in sizes:
+        for scenario in scenarios:
+            runs = [_run_isolated(scenario, size) for _ in range(repeat)]
+            metrics = {k: statistics.median(run[k] for run in runs) for k in runs[0]}
+            results[f"{scenario}/{size}"] = metrics
+            print(
+                f"{scenario:>18} {size:>7}: {metrics['throughput']:>9.1f} items/s  "
+                f"p50 {metrics['p50_ms']:>6.1f} ms  p99 {metrics['p99_ms']:>6.1f} ms  "
+                f"{metrics['requests']:>6} requests  {metrics['peak_rss_mb']:>6.1f} MiB",
+                file=sys.stderr,
+            )
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario (median).")
+    parser.add_argument("--save", action="store_true", help="Write results as the new baseline.")
+    parser.add_argument("--output", type=Path, help="Also write this run's results as JSON.")
+    parser.add_argument("--one", nargs=2, metavar=("SCENARIO", "SIZE"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.one:
+        print(json.dumps(run_scenario(args.one[0], int(args.one[1]))))
+        return 0
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    results = run_suite(args.scenarios.split(","), sizes, args.repeat)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+
+    baseline = load_baseline()
+    if args.save:
+        merged = {**(baseline or {}).get("results", {}), **results}
+        tolerance = (baseline or {}).get("tolerance", DEFAULT_TOLERANCE)
+        BASELINE_PATH.write_text(
+            json.dumps({"tolerance": tolerance, "results": merged}, indent=2, sort_keys=True) + "\n"
+        )
+        return 0
+    if baseline is None:
+        print("No baseline yet; rerun with --save to record one.", file=sys.stderr)
+        return 0
+
+    failures = compare(results, baseline["results"], baseline["tolerance"])
+    for failure in failures:
+        print(f"REGRESSION {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
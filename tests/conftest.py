@@ -8,6 +8,13 @@ from typer.testing import CliRunner
 from tests.fake_spotify import FakeSpotify
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep on-disk caches out of the real user cache directory."""
+    monkeypatch.setenv("SAK_CACHE_DIR", str(tmp_path / "sak-cache"))
+    return tmp_path / "sak-cache"
+
+
 @pytest.fixture
 def fake_sp() -> FakeSpotify:
     return FakeSpotify()
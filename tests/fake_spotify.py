@@ -5,8 +5,13 @@ instead of asserting on mock call args.
 """
 from __future__ import annotations
 
+import itertools
+import threading
+from datetime import datetime, timezone
 from typing import Optional
 
+from spotipy.exceptions import SpotifyException
+
 
 def _make_track(uri: str, name: str = "", artists: list | None = None) -> dict:
     track_id = uri.split(":")[-1] if ":" in uri else uri
@@ -19,14 +24,74 @@ def _make_track(uri: str, name: str = "", artists: list | None = None) -> dict:
     }
 
 
+# Stands in for the ~180 country codes of a real available_markets list
+_MARKETS = ["AD", "AE", "AR", "AT", "AU", "BE", "BG", "BR", "CA", "CH", "CL", "CO", "CZ", "DE"] * 13
+
+
+def _make_full_track(i: int) -> dict:
+    """Track i shaped like the API's full track object: album art, markets, external IDs."""
+    artist = {
+        "external_urls": {"spotify": f"https://open.spotify.com/artist/{i % 500:022d}"},
+        "href": f"https://api.spotify.com/v1/artists/{i % 500:022d}",
+        "id": f"{i % 500:022d}",
+        "name": f"Band {i % 500}",
+        "type": "artist",
+        "uri": f"spotify:artist:{i % 500:022d}",
+    }
+    return {
+        "album": {
+            "album_type": "album",
+            "artists": [artist],
+            "available_markets": _MARKETS,
+            "external_urls": {"spotify": f"https://open.spotify.com/album/{i // 10:022d}"},
+            "href": f"https://api.spotify.com/v1/albums/{i // 10:022d}",
+            "id": f"{i // 10:022d}",
+            "images": [
+                {"height": size, "width": size, "url": f"https://i.scdn.co/image/{i:040x}{size}"}
+                for size in (640, 300, 64)
+            ],
+            "name": f"Album {i // 10}",
+            "release_date": "2020-01-01",
+            "release_date_precision": "day",
+            "total_tracks": 10,
+            "type": "album",
+            "uri": f"spotify:album:{i // 10:022d}",
+        },
+        "artists": [artist],
+        "available_markets": _MARKETS,
+        "disc_number": 1,
+        "duration_ms": 200_000 + i,
+        "explicit": False,
+        "external_ids": {"isrc": f"USRC1{i:07d}"},
+        "external_urls": {"spotify": f"https://open.spotify.com/track/{i:022d}"},
+        "href": f"https://api.spotify.com/v1/tracks/{i:022d}",
+        "id": f"{i:022d}",
+        "is_local": False,
+        "name": f"Song {i}",
+        "popularity": i % 100,
+        "preview_url": None,
+        "track_number": i % 10 + 1,
+        "type": "track",
+        "uri": f"spotify:track:{i:022d}",
+    }
+
+
+def _added_at(seconds: int) -> str:
+    return datetime.fromtimestamp(seconds, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
 class FakeSpotify:
-    def __init__(self) -> None:
+    def __init__(self, user_id: str = "testuser") -> None:
+        self.prefix = "https://api.spotify.com/v1/"
         self._playlists: dict[str, dict] = {}
-        self._user: dict = {"id": "testuser", "display_name": "Test User"}
+        self._user: dict = {"id": user_id, "display_name": "Test User"}
         self._search_results: dict[str, dict] = {}
         self._default_search_result: Optional[dict] = None
         self._saved_tracks: list[dict] = []
         self.calls: list[tuple] = []
+        self._snapshots = itertools.count()
+        self._saved_clock = itertools.count(1_000_000, -1)  # Seeded tracks get older added_at
+        self._write_lock = threading.Lock()  # Writes may arrive from worker threads
 
     # ── Seed helpers ────────────────────────────────────────────────────────
 
@@ -43,13 +108,28 @@ class FakeSpotify:
                 normalised.append(_make_track(t))
             else:
                 normalised.append(t)
-        self._playlists[playlist_id] = {"id": playlist_id, "name": name, "tracks": normalised}
+        self._playlists[playlist_id] = {
+            "id": playlist_id, "name": name, "tracks": normalised,
+            "snapshot": next(self._snapshots),
+        }
         return self
 
     def add_saved_tracks(self, uris: list[str]) -> "FakeSpotify":
-        """Seed Liked Songs with the given track URIs."""
+        """Seed Liked Songs with the given track URIs, newest first, below any existing ones."""
         for uri in uris:
-            self._saved_tracks.append({"track": _make_track(uri)})
+            self._saved_tracks.append(
+                {"added_at": _added_at(next(self._saved_clock)), "track": _make_track(uri)}
+            )
+        return self
+
+    def like_tracks(self, uris: list[str]) -> "FakeSpotify":
+        """Save tracks as the user would: on top of Liked Songs, with newer added_at."""
+        newest = max((i["added_at"] for i in self._saved_tracks), default=_added_at(0))
+        seconds = int(datetime.fromisoformat(newest).timestamp())
+        self._saved_tracks[:0] = [
+            {"added_at": _added_at(seconds + len(uris) - i), "track": _make_track(uri)}
+            for i, uri in enumerate(uris)
+        ]
         return self
 
     def saved_uris(self) -> list[str]:
@@ -76,43 +156,94 @@ class FakeSpotify:
     def current_user(self) -> dict:
         return self._user
 
-    def current_user_playlists(self) -> dict:
+    def current_user_playlists(self, limit: int = 50, offset: int = 0) -> dict:
+        self.calls.append(("current_user_playlists", offset))
         items = [{"id": p["id"], "name": p["name"]} for p in self._playlists.values()]
-        return {"items": items, "next": None}
-
-    def playlist_tracks(self, playlist_id: str, **kwargs) -> dict:
+        return self._page("current_user_playlists", (), items, limit, offset)
+
+    def playlist(self, playlist_id: str, fields: Optional[str] = None) -> dict:
+        self.calls.append(("playlist", playlist_id))
+        p = self._playlists.get(playlist_id, {})
+        return {
+            "id": playlist_id,
+            "name": p.get("name"),
+            "snapshot_id": f"snap{p.get('snapshot', 0)}",
+            "tracks": {"total": len(p.get("tracks", []))},
+        }
+
+    def playlist_tracks(
+        self, playlist_id: str, limit: int = 100, offset: int = 0, **kwargs
+    ) -> dict:
+        self.calls.append(("playlist_tracks", playlist_id, offset))
         tracks = self._playlists.get(playlist_id, {}).get("tracks", [])
-        return {"items": [{"track": t} for t in tracks], "next": None}
+        items = [{"track": t} for t in tracks]
+        return self._page("playlist_tracks", (playlist_id,), items, limit, offset)
 
     def current_user_saved_tracks(self, limit: int = 20, offset: int = 0) -> dict:
-        return {"items": list(self._saved_tracks), "next": None}
+        self.calls.append(("current_user_saved_tracks", offset))
+        return self._page("current_user_saved_tracks", (), self._saved_tracks, limit, offset)
+
+    def current_user_saved_tracks_contains(self, tracks: list[str]) -> list[bool]:
+        self.calls.append(("current_user_saved_tracks_contains", list(tracks)))
+        saved = set(self.saved_uris())
+        return [t in saved for t in tracks]
 
     def current_user_saved_tracks_delete(self, tracks: list[str]) -> None:
         self.calls.append(("current_user_saved_tracks_delete", list(tracks)))
         uri_set = set(tracks)
-        self._saved_tracks = [i for i in self._saved_tracks if i["track"]["uri"] not in uri_set]
-
-    def next(self, result: dict) -> None:
-        return None
+        with self._write_lock:
+            self._saved_tracks = [
+                i for i in self._saved_tracks if i["track"]["uri"] not in uri_set
+            ]
 
-    def playlist_add_items(self, playlist_id: str, uris: list[str]) -> None:
+    def next(self, result: dict) -> Optional[dict]:
+        if not result.get("next"):
+            return None
+        method, args, limit, offset = result["_next"]
+        return getattr(self, method)(*args, limit=limit, offset=offset)
+
+    def _page(self, method: str, args: tuple, items: list, limit: int, offset: int) -> dict:
+        """Build a Spotify-style paging object over items."""
+        end = offset + limit
+        has_next = end < len(items)
+        return {
+            "items": list(items[offset:end]),
+            "total": len(items),
+            "limit": limit,
+            "offset": offset,
+            "next": f"fake://{method}?offset={end}&limit={limit}" if has_next else None,
+            "_next": (method, args, limit, end),
+        }
+
+    def playlist_add_items(
+        self, playlist_id: str, uris: list[str], position: Optional[int] = None
+    ) -> None:
         self.calls.append(("playlist_add_items", playlist_id, list(uris)))
-        if playlist_id not in self._playlists:
-            self._playlists[playlist_id] = {"id": playlist_id, "name": "Unknown", "tracks": []}
-        for uri in uris:
-            self._playlists[playlist_id]["tracks"].append(_make_track(uri))
+        with self._write_lock:
+            if playlist_id not in self._playlists:
+                self.add_playlist(playlist_id, name="Unknown")
+            tracks = self._playlists[playlist_id]["tracks"]
+            if position is None:
+                position = len(tracks)
+            elif position > len(tracks):
+                raise SpotifyException(400, -1, "Index out of bounds")
+            self._playlists[playlist_id]["snapshot"] = next(self._snapshots)
+            tracks[position:position] = [_make_track(uri) for uri in uris]
 
     def playlist_remove_all_occurrences_of_items(self, playlist_id: str, uris: list[str]) -> None:
         self.calls.append(("playlist_remove_all_occurrences_of_items", playlist_id, list(uris)))
         uri_set = set(uris)
-        if playlist_id in self._playlists:
+        with self._write_lock:
+            if playlist_id not in self._playlists:
+                return
+            self._playlists[playlist_id]["snapshot"] = next(self._snapshots)
             self._playlists[playlist_id]["tracks"] = [
                 t for t in self._playlists[playlist_id]["tracks"] if t["uri"] not in uri_set
             ]
 
     def user_playlist_create(self, user_id: str, name: str) -> dict:
         playlist_id = f"pl_{name.lower().replace(' ', '_')}"
-        self._playlists[playlist_id] = {"id": playlist_id, "name": name, "tracks": []}
+        self.add_playlist(playlist_id, name=name)
         return {"id": playlist_id, "uri": f"spotify:playlist:{playlist_id}"}
 
     def search(self, q: str, type: str = "track", limit: int = 1) -> dict:
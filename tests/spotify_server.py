@@ -0,0 +1,480 @@
+"""Local HTTP stand-in for the parts of the Spotify Web API that sak uses.
+
+Unlike FakeSpotify, requests go through the real spotipy client: its HTTP
+session, URL building, `next` links, urllib3 retries and the rate governor.
+Latency, page size caps, 429s and 5xx errors can be injected to exercise them.
+
+    server = SpotifyServer(Faults(latency=0.02, throttle_rate=0.05))
+    server.add_playlist("37i9dQZF1DXcBWIGoYBM5M", tracks=[...])
+    with server:
+        sp = server.client()  # or set SAK_API_URL=server.url for the CLI
+
+Run `python -m tests.spotify_server --help` to serve a seeded library by hand.
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+from tests.fake_spotify import _make_track
+
+_SEARCH_QUERY_RE = re.compile(r"artist:(?P<artist>.*?) track:(?P<title>.*)")
+
+
+@dataclass
+class Faults:
+    """What the server does to each API request, besides answering it."""
+
+    latency: float = 0.0  # Seconds added to every response
+    latency_jitter: float = 0.0  # Extra uniform 0..jitter seconds
+    max_page_size: Optional[int] = None  # Cap on `limit`, like the API's per-endpoint maximums
+    throttle_rate: float = 0.0  # Chance of a 429
+    retry_after: int = 0  # Retry-After sent with each 429; the header only takes whole seconds
+    max_in_flight: Optional[int] = None  # 429 whenever more requests than this are in flight
+    error_rate: float = 0.0  # Chance of a 503
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        # requests rejects "0.05" as an invalid header, and spotipy hands back None pages
+        if not isinstance(self.retry_after, int):
+            raise TypeError("retry_after must be whole seconds")
+
+
+class _ApiError(Exception):
+    def __init__(self, status: int, message: str, headers: Optional[dict] = None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+class SpotifyServer:
+    """Threaded HTTP server holding a user's playlists, Liked Songs and a search catalog.
+
+    Use as a context manager to serve on a free localhost port in a background
+    thread. State can be seeded before or while serving and inspected
+    afterwards; request counts per route are kept in `requests`.
+    """
+
+    def __init__(self, faults: Optional[Faults] = None, host: str = "127.0.0.1", port: int = 0):
+        self.faults = faults or Faults()
+        self.user = {"id": "testuser", "display_name": "Test User"}
+        self.playlists: dict[str, dict] = {}
+        self.saved: list[dict] = []
+        self.catalog: dict[str, dict] = {}
+        self._exact: dict[tuple[str, str], list[dict]] = {}  # (artist, title) -> tracks
+        self.requests: dict[str, int] = {}
+        self.faults_injected = {"429": 0, "503": 0}
+        self._lock = threading.Lock()
+        self._random = random.Random(self.faults.seed)
+        self._snapshots = itertools.count()
+        self._created = itertools.count(1)
+        self._saved_clock = itertools.count(1_000_000, -1)
+        self._in_flight = 0
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.api = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1/"
+
+    # ── Seeding and inspection ──────────────────────────────────────────────
+
+    def add_playlist(
+        self, playlist_id: str, name: str = "Test Playlist", tracks: list | None = None
+    ) -> "SpotifyServer":
+        """Seed a playlist; tracks may be full track dicts or bare URIs."""
+        tracks = [_make_track(t) if isinstance(t, str) else t for t in tracks or []]
+        with self._lock:
+            self.playlists[playlist_id] = {
+                "id": playlist_id, "name": name, "tracks": tracks,
+                "snapshot": next(self._snapshots),
+            }
+            self._index(tracks)
+        return self
+
+    def add_saved_tracks(self, tracks: list) -> "SpotifyServer":
+        """Seed Liked Songs, newest first, below any existing ones."""
+        with self._lock:
+            for t in tracks:
+                track = _make_track(t) if isinstance(t, str) else t
+                seconds = next(self._saved_clock)
+                added_at = datetime.fromtimestamp(seconds, timezone.utc).strftime(
+                    "%Y-%m-%dT%H:%M:%SZ"
+                )
+                self.saved.append({"added_at": added_at, "track": track})
+                self._index([track])
+        return self
+
+    def add_catalog(self, tracks: list[dict]) -> "SpotifyServer":
+        """Make tracks findable by search without putting them in the library."""
+        with self._lock:
+            self._index(tracks)
+        return self
+
+    def _index(self, tracks: list[dict]) -> None:
+        for t in tracks:
+            self.catalog[t["uri"]] = t
+            for artist in t["artists"]:
+                key = (artist["name"].casefold(), t["name"].casefold())
+                self._exact.setdefault(key, []).append(t)
+
+    def playlist_uris(self, playlist_id: str) -> list[str]:
+        return [t["uri"] for t in self.playlists[playlist_id]["tracks"]]
+
+    def saved_uris(self) -> list[str]:
+        return [item["track"]["uri"] for item in self.saved]
+
+    # ── Serving ─────────────────────────────────────────────────────────────
+
+    def start(self) -> "SpotifyServer":
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, args=(0.05,), name="spotify-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "SpotifyServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def client(self, governor=None, **kwargs):
+        """A spotipy client pointed at this server, governed and instrumented like the real one.
+
+        Pass a RateGovernor to override the process-wide one (paced for the real API).
+        """
+        import spotipy
+
+        from src.rate_limit import SPOTIPY_RETRY_CODES, get_governor, govern
+        from src.stats import get_run_stats, instrument
+
+        kwargs.setdefault("status_forcelist", SPOTIPY_RETRY_CODES)
+        sp = spotipy.Spotify(auth="local", **kwargs)
+        sp.prefix = self.url
+        return instrument(govern(sp, governor or get_governor()), get_run_stats())
+
+    # ── Request handling ────────────────────────────────────────────────────
+
+    def handle(self, method: str, path: str, query: dict, body) -> tuple[int, object]:
+        """Route one request; returns (status, JSON body) or raises _ApiError."""
+        with self._lock:
+            self._in_flight += 1
+            in_flight = self._in_flight
+        try:
+            self._inject(in_flight)
+            route, args = _route(method, path)
+            with self._lock:
+                self.requests[route] = self.requests.get(route, 0) + 1
+                payload = getattr(self, route)(*args, query=query, body=body)
+            if "fields" in query and route in _FIELDS_ROUTES:
+                payload = _project(payload, _parse_fields(query["fields"]))
+            return 200, payload
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _inject(self, in_flight: int) -> None:
+        f = self.faults
+        with self._lock:
+            delay = f.latency + self._random.uniform(0, f.latency_jitter)
+            throttled = (f.max_in_flight is not None and in_flight > f.max_in_flight) or (
+                self._random.random() < f.throttle_rate
+            )
+            failed = not throttled and self._random.random() < f.error_rate
+            if throttled:
+                self.faults_injected["429"] += 1
+            elif failed:
+                self.faults_injected["503"] += 1
+        time.sleep(delay)
+        if throttled:
+            headers = {"Retry-After": str(int(f.retry_after))}
+            raise _ApiError(429, "API rate limit exceeded", headers)
+        if failed:
+            raise _ApiError(503, "Service unavailable")
+
+    def _page(
+        self, path: str, items: list, query: dict, default_limit: int, max_limit: int,
+        wrap=lambda item: item,
+    ):
+        limit = int(query.get("limit", default_limit))
+        offset = int(query.get("offset", 0))
+        if not 1 <= limit <= max_limit:
+            raise _ApiError(400, f"Invalid limit: {limit}")
+        limit = min(limit, self.faults.max_page_size or limit)
+        end = offset + limit
+        link = f"{self.url}{path}?" if end < len(items) else None
+        return {
+            "href": f"{self.url}{path}?{urlencode({'offset': offset, 'limit': limit})}",
+            "items": [wrap(item) for item in items[offset:end]],
+            "limit": limit,
+            "offset": offset,
+            "total": len(items),
+            "next": link and link + urlencode({"offset": end, "limit": limit}),
+            "previous": None,
+        }
+
+    def _playlist(self, playlist_id: str) -> dict:
+        playlist = self.playlists.get(playlist_id)
+        if playlist is None:
+            raise _ApiError(404, "Resource not found")
+        return playlist
+
+    def _touch(self, playlist: dict) -> dict:
+        playlist["snapshot"] = next(self._snapshots)
+        return {"snapshot_id": f"snap{playlist['snapshot']}"}
+
+    def get_me(self, query, body):
+        return self.user
+
+    def get_my_playlists(self, query, body):
+        items = [{"id": p["id"], "name": p["name"]} for p in self.playlists.values()]
+        return self._page("me/playlists", items, query, 20, 50)
+
+    def create_playlist(self, user_id, query, body):
+        playlist_id = f"created{next(self._created):015d}"
+        self.playlists[playlist_id] = {
+            "id": playlist_id, "name": body["name"], "tracks": [],
+            "snapshot": next(self._snapshots),
+        }
+        return {"id": playlist_id, "name": body["name"], "uri": f"spotify:playlist:{playlist_id}"}
+
+    def get_playlist(self, playlist_id, query, body):
+        p = self._playlist(playlist_id)
+        return {
+            "id": playlist_id,
+            "name": p["name"],
+            "snapshot_id": f"snap{p['snapshot']}",
+            "tracks": {"total": len(p["tracks"])},
+        }
+
+    def get_playlist_items(self, playlist_id, query, body):
+        tracks = self._playlist(playlist_id)["tracks"]
+        return self._page(
+            f"playlists/{playlist_id}/items", tracks, query, 100, 100, wrap=lambda t: {"track": t}
+        )
+
+    def add_playlist_items(self, playlist_id, query, body):
+        playlist = self._playlist(playlist_id)
+        uris = body["uris"] if isinstance(body, dict) else body
+        if len(uris) > 100:
+            raise _ApiError(400, "Too many items: at most 100")
+        position = int(query.get("position", len(playlist["tracks"])))
+        if position > len(playlist["tracks"]):
+            raise _ApiError(400, "Index out of bounds")
+        tracks = [self.catalog.get(uri) or _make_track(uri) for uri in uris]
+        playlist["tracks"][position:position] = tracks
+        return self._touch(playlist)
+
+    def remove_playlist_items(self, playlist_id, query, body):
+        playlist = self._playlist(playlist_id)
+        items = body.get("items") or body.get("tracks") or []
+        if len(items) > 100:
+            raise _ApiError(400, "Too many items: at most 100")
+        uris = {item["uri"] for item in items}
+        playlist["tracks"] = [t for t in playlist["tracks"] if t["uri"] not in uris]
+        return self._touch(playlist)
+
+    def get_saved_tracks(self, query, body):
+        return self._page("me/tracks", self.saved, query, 20, 50)
+
+    def saved_contains(self, query, body):
+        uris = _library_uris(query)
+        saved = {item["track"]["uri"] for item in self.saved}
+        return [uri in saved for uri in uris]
+
+    def remove_saved(self, query, body):
+        uris = set(_library_uris(query))
+        self.saved = [item for item in self.saved if item["track"]["uri"] not in uris]
+        return None
+
+    def search(self, query, body):
+        match = _SEARCH_QUERY_RE.fullmatch(query.get("q", ""))
+        limit = int(query.get("limit", 10))
+        found = []
+        if match:
+            artist, title = match["artist"].casefold(), match["title"].casefold()
+            # Exact names are looked up directly, so large catalogs stay fast to search
+            found = self._exact.get((artist, title)) or [
+                t for t in self.catalog.values()
+                if title in t["name"].casefold()
+                and any(artist in a["name"].casefold() for a in t["artists"])
+            ]
+        return {"tracks": self._page("search", found, {"limit": limit}, 10, 50)}
+
+
+def _parse_fields(spec: str) -> dict:
+    """Parse a `fields` filter like "total,items(track(uri,album.name))" into a key tree.
+
+    An empty subtree keeps the whole value. Exclusions ("!") are not supported.
+    """
+    tree: dict = {}
+    node, parents, name, child = tree, [], "", tree
+    for char in spec + ",":
+        if char not in ",()":
+            name += char
+            continue
+        if name.strip():
+            child = node
+            for key in name.strip().split("."):
+                child = child.setdefault(key, {})
+        name = ""
+        if char == "(":
+            parents.append(node)
+            node = child
+        elif char == ")":
+            node = parents.pop()
+    return tree
+
+
+def _project(value, tree: dict):
+    """Keep only the keys in tree, applied to every element of lists, like the API."""
+    if not tree:
+        return value
+    if isinstance(value, list):
+        return [_project(v, tree) for v in value]
+    if isinstance(value, dict):
+        return {k: _project(value[k], sub) for k, sub in tree.items() if k in value}
+    return value
+
+
+def _library_uris(query: dict) -> list[str]:
+    if "uris" in query:
+        uris = query["uris"].split(",")
+    else:
+        uris = [f"spotify:track:{i}" for i in query.get("ids", "").split(",") if i]
+    if len(uris) > 50:
+        raise _ApiError(400, "Too many ids: at most 50")
+    return uris
+
+
+# Routes that honor the `fields` filter, as on the real API
+_FIELDS_ROUTES = ("get_playlist", "get_playlist_items")
+
+_ROUTES = [
+    ("GET", r"me", "get_me"),
+    ("GET", r"me/playlists", "get_my_playlists"),
+    ("POST", r"users/([^/]+)/playlists", "create_playlist"),
+    ("GET", r"playlists/([^/]+)", "get_playlist"),
+    ("GET", r"playlists/([^/]+)/(?:items|tracks)", "get_playlist_items"),
+    ("POST", r"playlists/([^/]+)/(?:items|tracks)", "add_playlist_items"),
+    ("DELETE", r"playlists/([^/]+)/(?:items|tracks)", "remove_playlist_items"),
+    ("GET", r"me/tracks", "get_saved_tracks"),
+    ("GET", r"me/(?:library|tracks)/contains", "saved_contains"),
+    ("DELETE", r"me/(?:library|tracks)", "remove_saved"),
+    ("GET", r"search", "search"),
+]
+
+
+def _route(method: str, path: str) -> tuple[str, tuple]:
+    path = path.removeprefix("/v1/").strip("/")
+    for route_method, pattern, name in _ROUTES:
+        match = re.fullmatch(pattern, path)
+        if match and route_method == method:
+            return name, match.groups()
+    raise _ApiError(404, f"No route for {method} /v1/{path}")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, so spotipy's connection pool is exercised
+    # Headers and body go out in separate sends; with Nagle on, the body waits for the
+    # client's delayed ACK and every response takes ~40 ms whatever the injected latency
+    disable_nagle_algorithm = True
+    server: ThreadingHTTPServer
+
+    def do_GET(self) -> None:
+        self._dispatch()
+
+    def do_POST(self) -> None:
+        self._dispatch()
+
+    def do_PUT(self) -> None:
+        self._dispatch()
+
+    def do_DELETE(self) -> None:
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        parts = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        headers = {}
+        try:
+            body = json.loads(raw) if raw else None
+            status, payload = self.server.api.handle(self.command, parts.path, query, body)
+        except _ApiError as e:
+            status, headers = e.status, e.headers
+            payload = {"error": {"status": e.status, "message": str(e)}}
+        data = b"" if payload is None else json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args) -> None:
+        pass  # Benchmarks send thousands of requests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--playlist-size", type=int, default=1000)
+    parser.add_argument("--liked-size", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--latency-jitter", type=float, default=0.02)
+    parser.add_argument("--max-page-size", type=int)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--max-in-flight", type=int)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    faults = Faults(
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        max_page_size=args.max_page_size,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        max_in_flight=args.max_in_flight,
+        error_rate=args.error_rate,
+    )
+    server = SpotifyServer(faults, port=args.port)
+    tracks = [
+        _make_track(f"spotify:track:{i:022d}", name=f"Song {i}", artists=[{"name": f"Band {i % 97}"}])
+        for i in range(args.playlist_size + args.liked_size)
+    ]
+    server.add_playlist("0" * 21 + "1", name="Benchmark", tracks=tracks[:args.playlist_size])
+    server.add_saved_tracks(tracks[args.playlist_size:])
+    print(f"Serving on {server.url}; run sak with SAK_API_URL={server.url}")
+    with server:
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+import os
+
+import pytest
+
+from tests.benchmark import DEFAULT_TOLERANCE, compare, load_baseline, run_suite
+
+BASE = {"throughput": 1000.0, "p99_ms": 50.0, "requests": 100, "peak_rss_mb": 60.0}
+
+
+def test_compare_passes_within_tolerance():
+    results = {"add/1000": {**BASE, "throughput": 800.0, "p99_ms": 70.0, "requests": 110}}
+
+    assert compare(results, {"add/1000": BASE}, DEFAULT_TOLERANCE) == []
+
+
+def test_compare_reports_each_regression():
+    results = {
+        "add/1000": {**BASE, "throughput": 500.0, "requests": 200},
+        "list/1000": BASE,  # Not in the baseline: nothing to compare against
+    }
+
+    failures = compare(results, {"add/1000": BASE}, DEFAULT_TOLERANCE)
+
+    assert len(failures) == 2
+    assert failures[0].startswith("add/1000: throughput 500.0/s")
+    assert failures[1].startswith("add/1000: requests 200")
+
+
+@pytest.mark.skipif(os.getenv("RUN_BENCHMARKS") != "true", reason="RUN_BENCHMARKS=true not set")
+def test_benchmarks_within_baseline():
+    """Run the 1k-track scenarios against the local API stand-in and check the baseline."""
+    baseline = load_baseline()
+    assert baseline is not None, "tests/benchmark_baseline.json is missing"
+    scenarios = sorted({key.split("/")[0] for key in baseline["results"]})
+
+    results = run_suite(scenarios, [1_000])
+
+    assert compare(results, baseline["results"], baseline["tolerance"]) == []
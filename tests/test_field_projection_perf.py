@@ -0,0 +1,77 @@
+import json
+import time
+
+import requests
+
+from src.commands.playlist import (
+    BATCH_SIZE,
+    PLAYLIST_TRACK_FIELDS,
+    PLAYLIST_URI_FIELDS,
+    get_playlist_track_uris,
+    iter_source_tracks,
+)
+from src.stats import get_run_stats
+from src.track import Track
+from tests.fake_spotify import _make_full_track
+from tests.spotify_server import SpotifyServer
+
+PLAYLIST_ID = "0000000000000000000001"
+N_TRACKS = 5_000
+
+
+def _read_pages(server: SpotifyServer, fields) -> tuple[int, float]:
+    """Fetch every page of the playlist; return (bytes received, seconds spent decoding)."""
+    bodies = []
+    with requests.Session() as session:
+        for offset in range(0, N_TRACKS, BATCH_SIZE):
+            params = {"limit": BATCH_SIZE, "offset": offset}
+            if fields:
+                params["fields"] = fields
+            response = session.get(f"{server.url}playlists/{PLAYLIST_ID}/items", params=params)
+            bodies.append(response.content)
+    start = time.perf_counter()
+    for body in bodies:
+        json.loads(body)
+    return sum(map(len, bodies)), time.perf_counter() - start
+
+
+def test_field_projection_payload_and_decode_time():
+    """
+    Read a 5,000-track playlist of full API track objects without a `fields`
+    filter, then with the projections used for listing and for URI lookups.
+    Album art, markets and external IDs make up most of each page, so the
+    projected reads should transfer and decode a small fraction of it.
+    """
+    tracks = [_make_full_track(i) for i in range(N_TRACKS)]
+    server = SpotifyServer().add_playlist(PLAYLIST_ID, tracks=tracks)
+    with server:
+        full = _read_pages(server, None)
+        listed = _read_pages(server, PLAYLIST_TRACK_FIELDS)
+        uris = _read_pages(server, PLAYLIST_URI_FIELDS)
+
+    print(f"\n{N_TRACKS} playlist tracks:")
+    for label, (nbytes, seconds) in (("full", full), ("tracks", listed), ("uris", uris)):
+        print(f"{label:>8}: {nbytes / 2**20:5.1f} MiB, decoded in {seconds * 1000:4.0f} ms")
+
+    assert listed[0] * 10 < full[0]
+    assert uris[0] * 20 < full[0]
+    assert listed[1] < full[1] and uris[1] < full[1]
+
+
+def test_playlist_reads_send_their_projection():
+    tracks = [_make_full_track(i) for i in range(250)]
+    server = SpotifyServer().add_playlist(PLAYLIST_ID, tracks=tracks)
+    with server:
+        sp = server.client()
+        stats = get_run_stats()
+        stats.reset()
+        listed = list(iter_source_tracks(sp, PLAYLIST_ID, use_cache=False))
+        track_bytes = stats.snapshot()["endpoints"]["GET playlists/{id}/items"]["bytes"]
+        stats.reset()
+        uris = get_playlist_track_uris(sp, PLAYLIST_ID, use_cache=False)
+        uri_bytes = stats.snapshot()["endpoints"]["GET playlists/{id}/items"]["bytes"]
+
+    assert listed == [Track.from_api(t) for t in tracks]
+    assert uris == {t["uri"] for t in tracks}
+    full_bytes = len(json.dumps(tracks))
+    assert uri_bytes < track_bytes < full_bytes // 10
@@ -0,0 +1,102 @@
+import os
+import random
+import string
+import time
+
+import pytest
+from rapidfuzz import fuzz, process
+
+from src.commands.playlist import (
+    FUZZY_BATCH_MIN_CPUS,
+    FUZZY_MATCH_THRESHOLD,
+    _best_fuzzy_matches,
+    _match_queries,
+)
+from src.track_index import TrackTokenIndex
+
+_WORDS = "love night dance fire heart baby rain blue sun moon star dream city gold wild".split()
+
+
+def _title(rng: random.Random) -> str:
+    return " ".join(rng.choices(_WORDS, k=rng.randint(1, 4))).title()
+
+
+def _per_line_matches(queries, choices):
+    """The pre-batching implementation: one extractOne call per line."""
+    matches = [process.extractOne(q, choices, scorer=fuzz.WRatio) for q in queries]
+    return [m[2] if m and m[1] > FUZZY_MATCH_THRESHOLD else None for m in matches]
+
+
+@pytest.mark.parametrize("n_queries, n_choices", [(100, 1_000), (500, 2_000), (1_000, 5_000)])
+def test_batch_fuzzy_match_speedup(n_queries, n_choices, mocker):
+    """
+    Compare the per-line extractOne loop with the batched cdist path.
+    Results must be identical; the batch path should win once there are
+    enough cores for cdist's workers=-1 to pay off.
+    """
+    rng = random.Random(n_queries)
+    choices = [f"{_title(rng)} - {_title(rng)}" for _ in range(n_choices)]
+    # Half near-misses of real tracks, half unrelated lines
+    queries = [rng.choice(choices)[:-2] for _ in range(n_queries // 2)]
+    queries += [f"{_title(rng)} - {_title(rng)}" for _ in range(n_queries - n_queries // 2)]
+
+    start = time.perf_counter()
+    expected = _per_line_matches(queries, choices)
+    loop_duration = time.perf_counter() - start
+
+    cpus = os.cpu_count() or 1
+    mocker.patch("src.commands.playlist.os.cpu_count", return_value=max(cpus, FUZZY_BATCH_MIN_CPUS))
+    start = time.perf_counter()
+    batched = _best_fuzzy_matches(queries, choices)
+    batch_duration = time.perf_counter() - start
+
+    print(
+        f"\n{n_queries} lines x {n_choices} tracks on {cpus} cpus: "
+        f"loop {loop_duration:.2f}s, batch {batch_duration:.2f}s "
+        f"({loop_duration / batch_duration:.1f}x)"
+    )
+
+    assert batched == expected
+    if cpus >= 2 * FUZZY_BATCH_MIN_CPUS:
+        assert batch_duration < loop_duration
+
+
+def test_token_index_matches_full_scan_quality():
+    """
+    Pruning with TrackTokenIndex must find matches as good as the full scan.
+    Near-miss queries must pick the same track; for unrelated queries the best
+    score must be the same (several junk tracks can tie at that score).
+    """
+    rng = random.Random(7)
+    vocab = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(5_000)]
+
+    def title() -> str:
+        return " ".join(rng.choices(vocab, k=rng.randint(1, 3))).title()
+
+    choices = [f"{title()} - {title()}" for _ in range(20_000)]
+    near_misses = []
+    for _ in range(75):
+        choice = rng.choice(choices)
+        i = rng.randrange(len(choice))
+        near_misses.append(choice[:i] + choice[i + 1:])
+    queries = near_misses + [f"{title()} - {title()}" for _ in range(25)]
+
+    start = time.perf_counter()
+    index = TrackTokenIndex(choices)
+    pruned = _match_queries(queries, choices, index)
+    pruned_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    full = _best_fuzzy_matches(queries, choices)
+    full_duration = time.perf_counter() - start
+
+    def score(query, match):
+        return None if match is None else fuzz.WRatio(query, choices[match])
+
+    print(
+        f"\n{len(queries)} lines x {len(choices)} tracks: "
+        f"full scan {full_duration:.2f}s, token index {pruned_duration:.2f}s (incl. build)"
+    )
+    assert pruned[:75] == full[:75]
+    assert [score(q, m) for q, m in zip(queries, pruned)] == [score(q, m) for q, m in zip(queries, full)]
+    assert pruned_duration < full_duration
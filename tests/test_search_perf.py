@@ -3,7 +3,9 @@ from unittest.mock import MagicMock
 
 from typer.testing import CliRunner
 
+from src.cache import get_search_cache, normalize_search_query
 from src.main import app
+from src.track import Track
 
 
 def test_search_parallel_performance(mocker):
@@ -63,3 +65,33 @@ def test_search_parallel_performance(mocker):
     # Assert performance: Should be significantly faster than sequential (2.5s)
     # We allow some overhead, but 1.0s is a very safe upper bound for 0.25s expected.
     assert duration < 1.0, f"Search took {duration}s, expected < 1.0s (Parallel execution failed?)"
+
+
+def test_search_warm_cache_performance(mocker):
+    """
+    A warm search cache answers every line without touching the API.
+    2,000 lines at 50ms each would take ~10s cold with 10 workers.
+    """
+    lines = [f"Artist{i} - Title{i}" for i in range(2000)]
+    cache = get_search_cache()
+    for i in range(2000):
+        cache.put(
+            normalize_search_query(f"Artist{i}", f"Title{i}"),
+            Track(f"spotify:track:{i}", f"Title{i}", (f"Artist{i}",)),
+        )
+    cache.close()
+
+    mock_sp = MagicMock()
+    mock_sp.search.side_effect = lambda **kwargs: time.sleep(0.05)
+    mocker.patch("src.main.get_spotify", return_value=mock_sp)
+
+    runner = CliRunner()
+    start_time = time.time()
+    result = runner.invoke(app, ["playlist", "search"], input="\n".join(lines))
+    duration = time.time() - start_time
+    print(f"\nWarm execution time for 2000 items: {duration:.2f} seconds")
+
+    assert result.exit_code == 0
+    assert len([ln for ln in result.stdout.split("\n") if ln.strip()]) == 2000
+    assert mock_sp.search.call_count == 0
+    assert duration < 3.0
@@ -0,0 +1,44 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+API_MODULES = ("spotipy", "requests", "numpy", "rapidfuzz")
+HEAVY_MODULES = API_MODULES + ("dotenv",)
+STARTUP_BUDGET_US = 250_000  # Cumulative import time of src.main (~50 ms when lazy)
+
+
+def _import_times(*args: str) -> dict:
+    """Run python -X importtime and return {module: cumulative microseconds}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_cli_import_skips_heavy_dependencies():
+    times = _import_times("-c", "import src.main")
+
+    loaded = sorted(m for m in times if m.split(".")[0] in HEAVY_MODULES + ("rich",))
+    assert loaded == []
+    print(f"\nsrc.main imported in {times['src.main'] / 1000:.1f} ms")
+    assert times["src.main"] < STARTUP_BUDGET_US
+
+
+def test_help_does_not_load_api_stack():
+    times = _import_times("-m", "src.main", "playlist", "--help")
+
+    assert "src.commands.playlist" in times
+    # .env is read to locate a `sak serve` socket, but nothing that talks to the API loads
+    assert not [m for m in times if m.split(".")[0] in API_MODULES]
@@ -0,0 +1,34 @@
+import json
+import tracemalloc
+
+from src.track import Track
+from tests.fake_spotify import _make_full_track
+
+
+def _traced_size(build) -> int:
+    tracemalloc.start()
+    try:
+        kept = build()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return size
+
+
+def test_track_records_are_a_fraction_of_api_dicts():
+    """
+    Hold 2,000 decoded playlist tracks as API dicts, then as Track records.
+    The records keep only uri, name, artists and release_date, with interned
+    artist names, and should need well under a tenth of the memory.
+    """
+    payloads = [json.dumps(_make_full_track(i)) for i in range(2_000)]
+
+    dict_bytes = _traced_size(lambda: [json.loads(p) for p in payloads])
+    track_bytes = _traced_size(lambda: [Track.from_api(json.loads(p)) for p in payloads])
+
+    print(
+        f"\n2k tracks: API dicts {dict_bytes / 2**20:.1f} MiB, "
+        f"Track records {track_bytes / 2**20:.1f} MiB ({dict_bytes / track_bytes:.0f}x smaller)"
+    )
+    assert track_bytes * 10 < dict_bytes
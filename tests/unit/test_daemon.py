@@ -0,0 +1,197 @@
+import io
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+import src
+import src.main
+from src.daemon import DaemonServer, account_key, forward, is_running
+from src.main import app
+from tests.fake_spotify import FakeSpotify
+from tests.spotify_server import SpotifyServer
+
+SOURCE = "0000000000000000000001"
+DEST = "0000000000000000000002"
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    """Serve the CLI from a thread with a warm FakeSpotify; yields (socket path, client)."""
+    fake_sp = FakeSpotify()
+    monkeypatch.setattr(src.main, "_warm_client", fake_sp)
+    path = tmp_path / "sak.sock"
+    server = DaemonServer(path, run=lambda argv: app(args=argv, prog_name="sak"))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield path, fake_sp
+    server.shutdown()
+    server.server_close()
+
+
+def _stdin(text: str, monkeypatch) -> None:
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(text.encode())))
+
+
+def test_forward_without_daemon_runs_locally(tmp_path):
+    assert forward(["status"], tmp_path / "missing.sock") is None
+    assert not is_running(tmp_path / "missing.sock")
+
+
+def test_forward_runs_command_on_daemon(daemon, capsys, monkeypatch):
+    path, fake_sp = daemon
+    fake_sp.add_playlist("pl", tracks=["spotify:track:1", "spotify:track:2"])
+    _stdin("", monkeypatch)
+
+    code = forward(["playlist", "list", "--id", "pl", "--output", "uri"], path)
+
+    assert code == 0
+    assert capsys.readouterr().out.split() == ["spotify:track:1", "spotify:track:2"]
+    assert is_running(path)
+
+
+def test_forward_replays_stdin_and_exit_code(daemon, capsys, monkeypatch):
+    path, fake_sp = daemon
+    fake_sp.add_playlist("dst")
+    _stdin("spotify:track:a\nspotify:track:b\n", monkeypatch)
+
+    assert forward(["playlist", "add", "--id", "dst"], path) == 0
+    assert fake_sp.playlist_uris("dst") == ["spotify:track:a", "spotify:track:b"]
+
+    _stdin("", monkeypatch)
+    assert forward(["playlist", "list"], path) == 1
+    assert "Provide --url or --id" in capsys.readouterr().err
+
+
+def test_serve_is_never_forwarded(daemon):
+    path, _ = daemon
+    assert forward(["serve"], path) is None
+
+
+def test_piped_stdin_runs_locally(daemon, monkeypatch):
+    """A command reading a pipe may be fed by a forwarded command queued behind it."""
+    path, _ = daemon
+    read_fd, write_fd = os.pipe()
+    os.close(write_fd)
+    with os.fdopen(read_fd) as pipe:
+        monkeypatch.setattr(sys, "stdin", pipe)
+        assert forward(["playlist", "add", "--id", "dst"], path) is None
+
+
+def test_stdin_is_only_read_when_the_command_asks(daemon, tmp_path, monkeypatch):
+    """A `while read` loop's input must not be swallowed by a command that ignores stdin."""
+    path, fake_sp = daemon
+    fake_sp.add_playlist("pl", tracks=["spotify:track:1"])
+    lines = tmp_path / "lines.txt"
+    lines.write_text("a\nb\nc\n")
+
+    with open(lines) as stdin:
+        monkeypatch.setattr(sys, "stdin", stdin)
+        assert forward(["playlist", "list", "--id", "pl"], path) == 0
+        assert stdin.read() == "a\nb\nc\n"
+
+
+def test_forwarded_command_piped_into_another(tmp_path, monkeypatch):
+    """`sak list | sak add` with a daemon: the first stage is forwarded, the second runs here."""
+    tracks = [f"spotify:track:{i:022d}" for i in range(3000)]
+    api = SpotifyServer().add_playlist(SOURCE, tracks=tracks).add_playlist(DEST)
+    monkeypatch.setenv("SAK_API_URL", api.url)
+    monkeypatch.setenv("SAK_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("SAK_NO_DAEMON", raising=False)
+    forwarded = []
+
+    def run(argv):
+        forwarded.append(argv)
+        app(args=argv, prog_name="sak")
+
+    with api:
+        monkeypatch.setattr(src.main, "_warm_client", api.client())
+        server = DaemonServer(tmp_path / "sak.sock", run=run)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        sak = f"{sys.executable} -m src.main"
+        try:
+            subprocess.run(
+                f"{sak} playlist list --id {SOURCE} --output uri"
+                f" | {sak} playlist add --id {DEST}",
+                shell=True, check=True, timeout=60, stdin=subprocess.DEVNULL,
+                capture_output=True, cwd=tmp_path,
+                env={**os.environ, "PYTHONPATH": str(Path(src.__file__).parent.parent)},
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+        added = api.playlist_uris(DEST)
+
+    assert forwarded == [["playlist", "list", "--id", SOURCE, "--output", "uri"]]
+    assert added == tracks
+
+
+def test_other_account_runs_locally(daemon, tmp_path, monkeypatch):
+    """A directory with its own .cache token is another account; the daemon refuses it."""
+    path, fake_sp = daemon
+    fake_sp.add_playlist("pl")
+    (tmp_path / "other").mkdir()
+    monkeypatch.chdir(tmp_path / "other")
+    _stdin("", monkeypatch)
+
+    assert forward(["playlist", "add", "--id", "pl"], path) is None
+    assert fake_sp.calls == []
+
+
+def test_forward_sends_sak_environment(tmp_path, monkeypatch):
+    path = tmp_path / "sak.sock"
+    headers = []
+
+    def accept_one():
+        conn, _ = listener.accept()
+        with conn, conn.makefile("rb") as requests:
+            headers.append(json.loads(requests.readline()))
+            conn.sendall(b'{"exit": 0}\n')
+
+    monkeypatch.setenv("SAK_STATS", "1")
+    monkeypatch.setenv("SAK_NO_DAEMON", "")
+    monkeypatch.setenv("UNRELATED", "x")
+    _stdin("", monkeypatch)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        listener.bind(str(path))
+        listener.listen()
+        server = threading.Thread(target=accept_one)
+        server.start()
+        assert forward(["status"], path) == 0
+        server.join(timeout=5)
+
+    env = headers[0]["env"]
+    assert env["SAK_STATS"] == "1"
+    assert "UNRELATED" not in env and "SAK_NO_DAEMON" not in env
+
+
+def test_command_runs_with_client_environment(daemon, tmp_path, monkeypatch):
+    """SAK_* variables from the header apply for the command only, replacing the daemon's."""
+    path, fake_sp = daemon
+    fake_sp.add_playlist("pl", tracks=["spotify:track:1"])
+    monkeypatch.setenv("SAK_TRACE", str(tmp_path / "daemon-trace.json"))
+    stats_file = tmp_path / "stats.json"
+    header = {
+        "argv": ["playlist", "list", "--id", "pl"],
+        "cwd": str(tmp_path),
+        "stdin_tty": True,
+        "env": {"SAK_STATS_JSON": stats_file.name},
+        "account": account_key(),
+    }
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(path))
+        sock.sendall(json.dumps(header).encode() + b"\n")
+        sock.shutdown(socket.SHUT_WR)
+        frames = [json.loads(line) for line in sock.makefile("rb")]
+
+    assert frames[-1] == {"exit": 0}
+    assert "endpoints" in json.loads(stats_file.read_text())
+    assert not (tmp_path / "daemon-trace.json").exists()
+    assert "SAK_STATS_JSON" not in os.environ
+    assert os.environ["SAK_TRACE"] == str(tmp_path / "daemon-trace.json")
@@ -1,9 +1,12 @@
 from src.commands.playlist import (
     LIKED_SENTINEL,
     get_liked_track_uris,
+    iter_source_tracks,
+    move_liked_tracks,
     move_tracks,
     remove_liked_tracks,
 )
+from src.stats import get_run_stats
 from tests.fake_spotify import FakeSpotify
 
 
@@ -61,8 +64,9 @@ def test_move_from_liked_batches():
 
     move_tracks(fake_sp, uris, LIKED_SENTINEL, "dest")
 
-    # 110 tracks → 2 batches of 100/10 (BATCH_SIZE=100)
-    assert fake_sp.call_count("current_user_saved_tracks_delete") == 2
+    # 110 tracks → 2 add batches of 100/10, deleted 50 at a time (LIKED_BATCH_SIZE=50)
+    assert fake_sp.call_count("playlist_add_items") == 2
+    assert fake_sp.call_count("current_user_saved_tracks_delete") == 3
     assert fake_sp.call_count("playlist_remove_all_occurrences_of_items") == 0
     assert len(fake_sp.playlist_uris("dest")) == 110
 
@@ -79,3 +83,146 @@ def test_move_from_liked_strict_filters_to_saved():
     # Only the 3 saved tracks should move; the extra one is skipped
     assert set(fake_sp.playlist_uris("dest")) == set(saved)
     assert fake_sp.saved_uris() == []
+
+
+def test_strict_move_from_liked_looks_up_few_tracks():
+    """A handful of tracks against a large library is checked with contains calls."""
+    fake_sp = FakeSpotify()
+    saved = [f"spotify:track:{i}" for i in range(500)]
+    fake_sp.add_saved_tracks(saved)
+    fake_sp.add_playlist("dest")
+
+    tracks = ["spotify:track:7", "8", "spotify:track:nope"]
+    move_tracks(fake_sp, tracks, LIKED_SENTINEL, "dest", strict=True)
+
+    assert fake_sp.playlist_uris("dest") == ["spotify:track:7", "spotify:track:8"]
+    assert fake_sp.call_count("current_user_saved_tracks_contains") == 1
+    # Only the top page used to read the library size
+    assert fake_sp.call_count("current_user_saved_tracks") == 1
+
+
+def test_strict_move_from_liked_scans_small_library():
+    fake_sp = FakeSpotify()
+    saved = [f"spotify:track:{i}" for i in range(40)]
+    fake_sp.add_saved_tracks(saved)
+    fake_sp.add_playlist("dest")
+
+    move_tracks(fake_sp, saved[:30], LIKED_SENTINEL, "dest", strict=True)
+
+    assert fake_sp.playlist_uris("dest") == saved[:30]
+    assert fake_sp.call_count("current_user_saved_tracks_contains") == 0
+
+
+def test_strict_move_from_cached_liked_scans_the_cache():
+    """With a warm cache the scan costs the top page, so it beats contains lookups."""
+    fake_sp = FakeSpotify()
+    saved = [f"spotify:track:{i}" for i in range(2000)]
+    fake_sp.add_saved_tracks(saved)
+    fake_sp.add_playlist("dest")
+    get_liked_track_uris(fake_sp)  # Warm the cache
+    fake_sp.like_tracks(["spotify:track:new"])
+    fake_sp.calls.clear()
+
+    move_tracks(fake_sp, ["spotify:track:new"] + saved[:99], LIKED_SENTINEL, "dest", strict=True)
+
+    assert fake_sp.playlist_uris("dest") == ["spotify:track:new"] + saved[:99]
+    assert fake_sp.call_count("current_user_saved_tracks_contains") == 0
+    assert fake_sp.call_count("current_user_saved_tracks") == 1
+
+
+def test_move_liked_tracks_keeps_added_at_order():
+    """Pages are moved oldest first, yet dest ends up newest first after its existing tracks."""
+    fake_sp = FakeSpotify()
+    saved = [f"spotify:track:{i}" for i in range(1234)]
+    fake_sp.add_saved_tracks(saved)
+    fake_sp.add_playlist("dest", tracks=["spotify:track:existing"])
+
+    assert move_liked_tracks(fake_sp, "dest") == 1234
+
+    assert fake_sp.playlist_uris("dest") == ["spotify:track:existing"] + saved
+    assert fake_sp.saved_uris() == []
+    added = set()
+    for call in fake_sp.calls:
+        if call[0] == "playlist_add_items":
+            added.update(call[2])
+        elif call[0] == "current_user_saved_tracks_delete":
+            assert added.issuperset(call[1])
+
+
+def test_move_liked_tracks_empty():
+    fake_sp = FakeSpotify().add_playlist("dest")
+
+    assert move_liked_tracks(fake_sp, "dest") == 0
+    assert fake_sp.call_count("playlist_add_items") == 0
+
+
+def test_liked_sync_stops_at_watermark():
+    fake_sp = FakeSpotify()
+    fake_sp.add_saved_tracks([f"spotify:track:{i}" for i in range(500)])
+    assert len(get_liked_track_uris(fake_sp)) == 500
+    fake_sp.calls.clear()
+
+    fake_sp.like_tracks(["spotify:track:new1", "spotify:track:new2"])
+    tracks = [t.uri for t in iter_source_tracks(fake_sp, LIKED_SENTINEL)]
+
+    assert tracks[:3] == ["spotify:track:new1", "spotify:track:new2", "spotify:track:0"]
+    assert len(tracks) == 502
+    # Only the first page was read: it already contains the watermark
+    assert fake_sp.call_count("current_user_saved_tracks") == 1
+
+
+def test_liked_sync_resyncs_after_removal():
+    fake_sp = FakeSpotify()
+    fake_sp.add_saved_tracks([f"spotify:track:{i}" for i in range(120)])
+    get_liked_track_uris(fake_sp)
+
+    fake_sp.current_user_saved_tracks_delete(["spotify:track:60"])
+    fake_sp.like_tracks(["spotify:track:new"])
+    fake_sp.calls.clear()
+    uris = get_liked_track_uris(fake_sp)
+
+    assert "spotify:track:60" not in uris
+    assert "spotify:track:new" in uris
+    assert len(uris) == 120
+    # The watermark page, then a full concurrent refetch (3 pages)
+    assert fake_sp.call_count("current_user_saved_tracks") == 4
+
+
+def test_liked_sync_resyncs_concurrently_when_watermark_is_unsaved():
+    fake_sp = FakeSpotify()
+    fake_sp.add_saved_tracks([f"spotify:track:{i}" for i in range(500)])
+    get_liked_track_uris(fake_sp)
+
+    fake_sp.current_user_saved_tracks_delete(["spotify:track:0"])  # The newest song
+    fake_sp.calls.clear()
+    uris = get_liked_track_uris(fake_sp)
+
+    assert uris == {f"spotify:track:{i}" for i in range(1, 500)}
+    # One page to find the watermark gone, then the concurrent full fetch (10 pages)
+    assert fake_sp.call_count("current_user_saved_tracks") == 11
+
+
+def test_strict_move_from_liked_no_cache_refetches():
+    fake_sp = FakeSpotify()
+    saved = [f"spotify:track:{i}" for i in range(200)]
+    fake_sp.add_saved_tracks(saved)
+    fake_sp.add_playlist("dest")
+    get_liked_track_uris(fake_sp)  # Warm the cache
+    fake_sp.calls.clear()
+
+    move_tracks(fake_sp, saved, LIKED_SENTINEL, "dest", strict=True, use_cache=False)
+
+    assert fake_sp.playlist_uris("dest") == saved
+    # The top page doubles as the total probe, then the other 3 pages (no incremental sync)
+    assert fake_sp.call_count("current_user_saved_tracks") == 4
+
+
+def test_liked_cache_is_kept_per_account():
+    mine = FakeSpotify().add_saved_tracks(["spotify:track:mine"])
+    get_liked_track_uris(mine)
+    theirs = FakeSpotify(user_id="someone-else").add_saved_tracks(["spotify:track:theirs"])
+    stats = get_run_stats()
+    stats.reset()
+
+    assert get_liked_track_uris(theirs) == {"spotify:track:theirs"}
+    assert stats.counters["liked_cache.misses"] == 1
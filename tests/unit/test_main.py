@@ -198,10 +198,30 @@ def test_move_command_strict(mock_get_spotify, mocker):
 
     assert result.exit_code == 0
     mock_move.assert_called_once_with(
-        mock_get_spotify, ["spotify:track:123"], "src_id", "dst_id", strict=True
+        mock_get_spotify,
+        ["spotify:track:123"],
+        "src_id",
+        "dst_id",
+        strict=True,
+        use_cache=True,
+        resume=False,
     )
 
 
+def test_move_command_resume(mock_get_spotify, mocker):
+    mock_move = mocker.patch("src.main.do_move_tracks")
+    mocker.patch("src.main.is_interactive", return_value=False)
+
+    result = runner.invoke(
+        app,
+        ["playlist", "move", "--from", "src_id", "--to", "dst_id", "--resume"],
+        input="spotify:track:123",
+    )
+
+    assert result.exit_code == 0
+    assert mock_move.call_args.kwargs["resume"] is True
+
+
 def test_move_create_creates_playlist_when_missing(mock_get_spotify, mocker):
     mock_move = mocker.patch("src.main.do_move_tracks")
     mocker.patch("src.main.is_interactive", return_value=False)
@@ -235,7 +255,6 @@ def test_move_create_reuses_existing_playlist(mock_get_spotify, mocker):
 
 
 def test_move_liked_auto_fetches_when_no_input(mock_get_spotify, mocker):
-    mock_move = mocker.patch("src.main.do_move_tracks")
     mocker.patch("src.main.is_interactive", return_value=True)
     mock_get_spotify.add_saved_tracks(["spotify:track:1", "spotify:track:2"])
     mock_get_spotify.add_playlist("dest_id")
@@ -243,8 +262,8 @@ def test_move_liked_auto_fetches_when_no_input(mock_get_spotify, mocker):
     result = runner.invoke(app, ["playlist", "move", "--from", "liked", "--to", "dest_id"])
 
     assert result.exit_code == 0
-    args, _ = mock_move.call_args
-    assert set(args[1]) == {"spotify:track:1", "spotify:track:2"}
+    assert mock_get_spotify.playlist_uris("dest_id") == ["spotify:track:1", "spotify:track:2"]
+    assert mock_get_spotify.saved_uris() == []
 
 
 def test_move_liked_still_accepts_explicit_stdin(mock_get_spotify, mocker):
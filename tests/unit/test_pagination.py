@@ -0,0 +1,75 @@
+from unittest.mock import MagicMock
+
+from src.commands.playlist import (
+    find_playlist,
+    get_liked_track_uris,
+    get_playlist_track_uris,
+    iter_paged_items,
+    iter_source_tracks,
+)
+from tests.fake_spotify import FakeSpotify
+
+
+def test_iter_paged_items_preserves_order_across_pages():
+    fake_sp = FakeSpotify()
+    uris = [f"spotify:track:{i}" for i in range(1050)]
+    fake_sp.add_playlist("big", tracks=uris)
+
+    items = list(iter_paged_items(fake_sp, fake_sp.playlist_tracks, "big", limit=100))
+
+    assert [item["track"]["uri"] for item in items] == uris
+    # 1050 tracks → 11 pages, fetched by offset rather than by following `next`
+    assert fake_sp.call_count("playlist_tracks") == 11
+
+
+def test_iter_paged_items_reverse_yields_last_to_first():
+    fake_sp = FakeSpotify()
+    uris = [f"spotify:track:{i}" for i in range(1050)]
+    fake_sp.add_playlist("big", tracks=uris)
+
+    items = list(iter_paged_items(fake_sp, fake_sp.playlist_tracks, "big", limit=100, reverse=True))
+
+    assert [item["track"]["uri"] for item in items] == uris[::-1]
+    # Highest offsets are requested first (after the page that reports the total)
+    offsets = [c[2] for c in fake_sp.calls if c[0] == "playlist_tracks"]
+    assert offsets[:2] == [0, 1000]
+
+
+def test_iter_paged_items_falls_back_to_next_without_total():
+    sp = MagicMock()
+    page1 = {"items": [1, 2], "next": "url_to_page2"}
+    page2 = {"items": [3], "next": None}
+    sp.playlist_tracks.return_value = page1
+    sp.next.return_value = page2
+
+    assert list(iter_paged_items(sp, sp.playlist_tracks, "pl", limit=2)) == [1, 2, 3]
+    sp.next.assert_called_once_with(page1)
+
+
+def test_iter_source_tracks_liked_skips_missing():
+    fake_sp = FakeSpotify()
+    uris = [f"spotify:track:{i}" for i in range(120)]
+    fake_sp.add_saved_tracks(uris)
+    fake_sp._saved_tracks.insert(3, {"track": None})
+
+    tracks = list(iter_source_tracks(fake_sp, "liked"))
+
+    assert [t.uri for t in tracks] == uris
+    assert get_liked_track_uris(fake_sp) == set(uris)
+
+
+def test_get_playlist_track_uris_large_playlist():
+    fake_sp = FakeSpotify()
+    uris = [f"spotify:track:{i}" for i in range(830)]
+    fake_sp.add_playlist("pl", tracks=uris)
+
+    assert get_playlist_track_uris(fake_sp, "pl") == set(uris)
+
+
+def test_find_playlist_across_pages():
+    fake_sp = FakeSpotify()
+    for i in range(120):
+        fake_sp.add_playlist(f"id{i}", name=f"Playlist {i}")
+
+    assert find_playlist(fake_sp, "Playlist 117") == "id117"
+    assert find_playlist(fake_sp, "Missing") is None
@@ -0,0 +1,73 @@
+import pytest
+from typer.testing import CliRunner
+
+from src.commands.pipe import parse_stages, run_pipeline
+from src.main import app
+from tests.fake_spotify import FakeSpotify, _make_track
+
+runner = CliRunner()
+
+
+def _tracks(*names: str) -> list:
+    return [_make_track(f"spotify:track:{n}", name=n, artists=[{"name": f"Artist {n}"}]) for n in names]
+
+
+def test_parse_stages_appends_print_sink():
+    specs = parse_stages(["list Inbox", "filter --unique"])
+
+    assert [s.name for s in specs] == ["list", "filter", "print"]
+    assert specs[0].args.playlist == "Inbox"
+    assert specs[1].args.unique is True
+
+
+@pytest.mark.parametrize(
+    "stages",
+    [["filter --unique"], ["list a", "add b", "print"], ["list a", "list b"], ["list"], ["nope"]],
+)
+def test_parse_stages_rejects_invalid_chains(stages):
+    with pytest.raises(ValueError):
+        parse_stages(stages)
+
+
+def test_list_filter_add_passes_track_objects():
+    fake_sp = FakeSpotify()
+    fake_sp.add_playlist("src", tracks=_tracks("a", "b", "a", "c"))
+    fake_sp.add_playlist("done", tracks=_tracks("c"))
+    fake_sp.add_playlist("dst")
+
+    count = run_pipeline(
+        fake_sp, parse_stages(["list src", "search", "filter --unique --not-in done", "add dst"]), []
+    )
+
+    assert count == 2
+    assert fake_sp.playlist_uris("dst") == ["spotify:track:a", "spotify:track:b"]
+    # Tracks from list already have URIs, so nothing was searched
+    assert fake_sp.call_count("search") == 0
+
+
+def test_move_defaults_to_listed_playlist():
+    fake_sp = FakeSpotify()
+    fake_sp.add_playlist("src", tracks=_tracks("keep", "go1", "go2"))
+    fake_sp.add_playlist("dst")
+
+    run_pipeline(fake_sp, parse_stages(["list src", "filter --title go", "move dst"]), [])
+
+    assert fake_sp.playlist_uris("dst") == ["spotify:track:go1", "spotify:track:go2"]
+    assert fake_sp.playlist_uris("src") == ["spotify:track:keep"]
+
+
+def test_pipe_command_searches_stdin(mock_get_spotify, mocker):
+    mocker.patch("src.main.is_interactive", return_value=False)
+    mock_get_spotify.set_default_search_result(_tracks("x")[0])
+
+    result = runner.invoke(app, ["pipe", "search", "print --output id"], input="A - x\nB - x\n")
+
+    assert result.exit_code == 0
+    assert result.stdout.split() == ["x", "x"]
+
+
+def test_pipe_command_reports_bad_stage(mock_get_spotify):
+    result = runner.invoke(app, ["pipe", "frobnicate"])
+
+    assert result.exit_code == 1
+    assert "Unknown stage" in result.stderr
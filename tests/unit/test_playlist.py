@@ -1,4 +1,6 @@
+import time
 
+import pytest
 
 from src.commands.playlist import create_playlist, move_tracks
 from tests.fake_spotify import FakeSpotify
@@ -18,6 +20,48 @@ def test_move_tracks_batching():
     assert len(fake_sp.playlist_uris("dst")) == 150
 
 
+def test_move_tracks_removes_only_after_add():
+    fake_sp = FakeSpotify()
+    tracks = [f"spotify:track:{i}" for i in range(1000)]
+    fake_sp.add_playlist("src", tracks=tracks).add_playlist("dst")
+    remove = fake_sp.playlist_remove_all_occurrences_of_items
+
+    def slow_remove(playlist_id, uris):
+        time.sleep(0.01)
+        remove(playlist_id, uris)
+
+    fake_sp.playlist_remove_all_occurrences_of_items = slow_remove
+    move_tracks(fake_sp, tracks, "src", "dst")
+
+    assert fake_sp.playlist_uris("dst") == tracks
+    assert fake_sp.playlist_uris("src") == []
+    added = set()
+    for call in fake_sp.calls:
+        if call[0] == "playlist_add_items":
+            added.update(call[2])
+        elif call[0] == "playlist_remove_all_occurrences_of_items":
+            assert added.issuperset(call[2])
+
+
+def test_move_tracks_failed_add_keeps_batch_in_source():
+    fake_sp = FakeSpotify()
+    tracks = [f"spotify:track:{i}" for i in range(300)]
+    fake_sp.add_playlist("src", tracks=tracks).add_playlist("dst")
+    add = fake_sp.playlist_add_items
+
+    def flaky_add(playlist_id, uris, **kwargs):
+        if uris[0] == "spotify:track:100":
+            raise RuntimeError("boom")
+        add(playlist_id, uris, **kwargs)
+
+    fake_sp.playlist_add_items = flaky_add
+    with pytest.raises(RuntimeError):
+        move_tracks(fake_sp, tracks, "src", "dst")
+
+    assert fake_sp.playlist_uris("dst") == tracks[:100]
+    assert fake_sp.playlist_uris("src") == tracks[100:]
+
+
 def test_move_tracks_empty():
     fake_sp = FakeSpotify()
     move_tracks(fake_sp, [], "src", "dst")
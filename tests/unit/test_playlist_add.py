@@ -1,3 +1,4 @@
+import time
 from unittest.mock import patch
 
 from typer.testing import CliRunner
@@ -21,6 +22,28 @@ def test_add_tracks_logic_batching():
     assert len(fake_sp.playlist_uris("test_playlist")) == 250
 
 
+def test_add_tracks_sends_one_batch_at_a_time_in_order():
+    """Each batch is appended only after the one before it lands; no positions, no retries."""
+    fake_sp = FakeSpotify()
+    fake_sp.add_playlist("test_playlist", tracks=["spotify:track:existing"])
+    tracks = [f"spotify:track:{i}" for i in range(1000)]
+    add = fake_sp.playlist_add_items
+    in_flight = []
+
+    def slow_add(playlist_id, uris, position=None):
+        assert position is None and not in_flight
+        in_flight.append(uris)
+        time.sleep(0.002)
+        add(playlist_id, uris)
+        in_flight.remove(uris)
+
+    fake_sp.playlist_add_items = slow_add
+    add_tracks(fake_sp, tracks, "test_playlist")
+
+    assert fake_sp.playlist_uris("test_playlist") == ["spotify:track:existing"] + tracks
+    assert fake_sp.call_count("playlist") == 0
+
+
 def test_add_command_with_url(mock_get_spotify):
     mock_get_spotify.add_playlist("abcdef123")
     result = runner.invoke(
@@ -0,0 +1,75 @@
+import sqlite3
+
+from typer.testing import CliRunner
+
+from src.cache import PlaylistCache
+from src.commands.playlist import get_playlist_track_uris, move_tracks
+from src.main import app
+from src.track import Track
+from tests.fake_spotify import FakeSpotify
+
+runner = CliRunner()
+
+
+def test_cache_hit_skips_refetch():
+    fake_sp = FakeSpotify()
+    uris = [f"spotify:track:{i}" for i in range(250)]
+    fake_sp.add_playlist("pl", tracks=uris)
+
+    assert get_playlist_track_uris(fake_sp, "pl") == set(uris)
+    assert fake_sp.call_count("playlist_tracks") == 3
+
+    assert get_playlist_track_uris(fake_sp, "pl") == set(uris)
+    # Second read only paid for the snapshot_id check
+    assert fake_sp.call_count("playlist_tracks") == 3
+    assert fake_sp.call_count("playlist") == 2
+
+
+def test_cache_invalidated_by_new_snapshot():
+    fake_sp = FakeSpotify()
+    fake_sp.add_playlist("src", tracks=["spotify:track:1", "spotify:track:2"])
+    fake_sp.add_playlist("dst")
+    get_playlist_track_uris(fake_sp, "src")
+
+    move_tracks(fake_sp, ["spotify:track:1"], "src", "dst")
+
+    assert get_playlist_track_uris(fake_sp, "src") == {"spotify:track:2"}
+
+
+def test_use_cache_false_always_refetches():
+    fake_sp = FakeSpotify()
+    fake_sp.add_playlist("pl", tracks=["spotify:track:1"])
+
+    get_playlist_track_uris(fake_sp, "pl", use_cache=False)
+    get_playlist_track_uris(fake_sp, "pl", use_cache=False)
+
+    assert fake_sp.call_count("playlist_tracks") == 2
+    assert fake_sp.call_count("playlist") == 0
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    tracks = [Track(f"spotify:track:{i}", f"Track number {i}", ("Band",)) for i in range(500)]
+    cache = PlaylistCache(tmp_path / "cache.sqlite3", max_bytes=10**9)
+    cache.put("a", "s1", tracks)
+    with sqlite3.connect(cache.path) as conn:
+        (entry_size,) = conn.execute("SELECT size FROM playlist_tracks").fetchone()
+    # Room for one entry and a half: every put beyond the first evicts
+    cache.max_bytes = entry_size + entry_size // 2
+
+    cache.put("b", "s1", tracks)
+    cache.get("b", "s1")
+    cache.put("c", "s1", tracks)
+
+    assert cache.get("a", "s1") is None
+    assert cache.get("c", "s1") == tracks
+
+
+def test_list_no_cache_flag(mock_get_spotify):
+    mock_get_spotify.add_playlist("pl", tracks=["spotify:track:abc"])
+
+    for _ in range(2):
+        result = runner.invoke(app, ["playlist", "list", "--id", "pl", "--no-cache", "-o", "uri"])
+        assert result.exit_code == 0
+        assert "spotify:track:abc" in result.stdout
+
+    assert mock_get_spotify.call_count("playlist_tracks") == 2
@@ -0,0 +1,103 @@
+from typer.testing import CliRunner
+
+from src.commands.playlist import (
+    create_playlist,
+    find_playlist,
+    find_playlist_fuzzy,
+    resolve_or_create_playlist_id,
+    resolve_playlist_ids,
+)
+from src.main import app
+from tests.fake_spotify import FakeSpotify
+
+runner = CliRunner()
+
+
+def _seed(fake_sp: FakeSpotify, count: int = 120) -> FakeSpotify:
+    for i in range(count):
+        fake_sp.add_playlist(f"id{i}", name=f"Playlist {i}")
+    return fake_sp
+
+
+def test_index_reused_across_lookups():
+    fake_sp = _seed(FakeSpotify())
+
+    assert find_playlist(fake_sp, "Playlist 5") == "id5"
+    pages = fake_sp.call_count("current_user_playlists")
+    assert find_playlist(fake_sp, "Playlist 110") == "id110"
+
+    assert fake_sp.call_count("current_user_playlists") == pages
+
+
+def test_index_persisted_between_clients():
+    find_playlist(_seed(FakeSpotify(), count=3), "Playlist 0")
+    other_sp = FakeSpotify()  # Empty account: only the persisted index knows the names
+
+    assert find_playlist(other_sp, "Playlist 2") == "id2"
+    assert other_sp.call_count("current_user_playlists") == 0
+
+
+def test_index_is_kept_per_account():
+    find_playlist(_seed(FakeSpotify(), count=3), "Playlist 0")
+    other_account = FakeSpotify(user_id="someone-else").add_playlist("theirs", name="Playlist 2")
+
+    assert find_playlist(other_account, "Playlist 2") == "theirs"
+    assert other_account.call_count("current_user_playlists") == 1
+
+
+def test_index_expires_after_ttl(monkeypatch):
+    fake_sp = _seed(FakeSpotify(), count=3)
+    find_playlist(fake_sp, "Playlist 1")
+    monkeypatch.setenv("SAK_PLAYLIST_INDEX_TTL", "0")
+
+    find_playlist(fake_sp, "Playlist 1")
+
+    assert fake_sp.call_count("current_user_playlists") == 2
+
+
+def test_index_miss_refetches_once():
+    fake_sp = _seed(FakeSpotify(), count=3)
+    find_playlist(fake_sp, "Playlist 1")
+    fake_sp.add_playlist("late_id", name="Added Later")
+
+    assert find_playlist(fake_sp, "Added Later") == "late_id"
+    assert find_playlist(FakeSpotify(), "Nowhere") is None
+
+
+def test_resolve_several_names_single_pass():
+    fake_sp = _seed(FakeSpotify())
+
+    result = resolve_playlist_ids(fake_sp, ["Playlist 1", "liked", "A" * 22, "Playlist 119"])
+
+    assert result == ["id1", "liked", "A" * 22, "id119"]
+    # 120 playlists → 3 pages of 50, fetched once
+    assert fake_sp.call_count("current_user_playlists") == 3
+
+
+def test_create_updates_index():
+    fake_sp = _seed(FakeSpotify(), count=3)
+    find_playlist(fake_sp, "Playlist 1")
+    pages = fake_sp.call_count("current_user_playlists")
+
+    create_playlist(fake_sp, "Fresh")
+
+    assert resolve_or_create_playlist_id(fake_sp, "Fresh") == ("pl_fresh", False)
+    assert fake_sp.call_count("current_user_playlists") == pages
+
+
+def test_find_playlist_fuzzy():
+    fake_sp = FakeSpotify()
+    fake_sp.add_playlist("chill_id", name="Chill Evening Vibes")
+    fake_sp.add_playlist("gym_id", name="Gym Bangers")
+
+    assert find_playlist_fuzzy(fake_sp, "chill evening") == "chill_id"
+    assert find_playlist_fuzzy(fake_sp, "Gym Bangers") == "gym_id"
+
+
+def test_find_command_fuzzy(mock_get_spotify):
+    mock_get_spotify.add_playlist("gym_id", name="Gym Bangers")
+
+    result = runner.invoke(app, ["playlist", "find", "gym bangerz", "--fuzzy"])
+
+    assert result.exit_code == 0
+    assert "gym_id" in result.stdout
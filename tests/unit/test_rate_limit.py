@@ -0,0 +1,122 @@
+import threading
+import time
+
+import pytest
+import spotipy
+from spotipy.exceptions import SpotifyException
+
+from src.rate_limit import SPOTIPY_RETRY_CODES, RateGovernor, govern
+
+
+def _governor(**kwargs) -> RateGovernor:
+    defaults = dict(rate=1000, burst=1000, max_concurrency=8, max_retries=3, jitter=0)
+    return RateGovernor(**{**defaults, **kwargs})
+
+
+def _throttled_then(result, failures: int = 1, retry_after: str = "0.2"):
+    calls = []
+
+    def fn():
+        calls.append(time.monotonic())
+        if len(calls) <= failures:
+            raise SpotifyException(429, -1, "rate limited", headers={"Retry-After": retry_after})
+        return result
+
+    return fn, calls
+
+
+def test_retries_after_retry_after_header():
+    governor = _governor()
+    fn, calls = _throttled_then("ok")
+
+    assert governor.call(fn) == "ok"
+    assert calls[1] - calls[0] >= 0.2
+    assert governor.throttled == 1
+    # Halved from 8, then widened by 1/limit for the successful retry
+    assert governor.limit == 4.25
+
+
+def test_gives_up_after_max_retries():
+    governor = _governor(max_retries=2)
+    fn, calls = _throttled_then("ok", failures=5, retry_after="0")
+
+    with pytest.raises(SpotifyException):
+        governor.call(fn)
+    assert len(calls) == 3
+
+
+def test_other_errors_are_not_retried():
+    governor = _governor()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        raise SpotifyException(404, -1, "not found")
+
+    with pytest.raises(SpotifyException):
+        governor.call(fn)
+    assert len(calls) == 1
+    assert governor.in_flight == 0
+
+
+def test_limit_recovers_additively():
+    governor = _governor(max_concurrency=8)
+    governor.limit = 2.0
+    for _ in range(10):
+        governor.call(lambda: None)
+    assert 4 < governor.limit < 8
+
+
+def test_concurrency_capped_by_limit():
+    governor = _governor(max_concurrency=2)
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def fn():
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+
+    threads = [threading.Thread(target=governor.call, args=(fn,)) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert peak[0] == 2
+
+
+def test_token_bucket_caps_rate():
+    governor = _governor(rate=50, burst=1)
+    start = time.monotonic()
+    for _ in range(11):
+        governor.call(lambda: None)
+    # First call uses the burst token; the next 10 wait ~20ms each
+    assert time.monotonic() - start >= 0.18
+
+
+def test_rate_zero_leaves_pacing_to_throttling():
+    governor = _governor(rate=0, burst=1)
+    start = time.monotonic()
+    for _ in range(200):
+        governor.call(lambda: None)
+    assert time.monotonic() - start < 0.1
+
+
+def test_govern_routes_internal_calls():
+    sp = spotipy.Spotify(auth="token", status_forcelist=SPOTIPY_RETRY_CODES)
+    sp._internal_call = lambda method, url, payload, params: (method, url)
+
+    governor = _governor()
+    sp = govern(sp, governor)
+
+    assert sp._internal_call("GET", "me", None, {}) == ("GET", "me")
+    assert governor.in_flight == 0
+    # urllib3 must not replay 429s behind the governor's back
+    retry = sp._session.get_adapter("https://api.spotify.com").max_retries
+    assert not retry.respect_retry_after_header
+    assert not retry.is_retry("GET", 429, has_retry_after=True)
+    assert retry.is_retry("GET", 503)
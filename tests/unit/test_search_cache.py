@@ -0,0 +1,73 @@
+from src.cache import SearchCache, get_search_cache, normalize_search_query
+from src.commands.playlist import search_tracks
+from src.track import Track
+from tests.fake_spotify import FakeSpotify
+
+_TRACK = {"uri": "spotify:track:123", "id": "123", "name": "Title", "artists": [{"name": "Artist"}]}
+_RESULT = Track("spotify:track:123", "Title", ("Artist",))
+
+
+def test_normalize_search_query():
+    assert normalize_search_query("  Daft   PUNK ", "Get Lucky ") == "artist:daft punk track:get lucky"
+
+
+def test_warm_search_skips_api():
+    fake_sp = FakeSpotify().set_default_search_result(_TRACK)
+
+    first = list(search_tracks(fake_sp, ["Artist - Title"]))
+    second = list(search_tracks(fake_sp, ["artist  -  title", "ARTIST - Title"]))
+
+    assert first == [_RESULT]
+    assert second == [_RESULT, _RESULT]
+    assert fake_sp.call_count("search") == 1
+
+
+def test_not_found_is_cached():
+    fake_sp = FakeSpotify()
+
+    assert list(search_tracks(fake_sp, ["Artist - Missing"])) == [None]
+    assert list(search_tracks(fake_sp, ["Artist - Missing"])) == [None]
+    assert fake_sp.call_count("search") == 1
+
+
+def test_expired_not_found_is_searched_again(monkeypatch):
+    monkeypatch.setenv("SAK_SEARCH_CACHE_NEGATIVE_TTL", "0")
+    fake_sp = FakeSpotify()
+    list(search_tracks(fake_sp, ["Artist - Missing"]))
+
+    fake_sp.set_default_search_result(_TRACK)
+    assert list(search_tracks(fake_sp, ["Artist - Missing"])) == [_RESULT]
+    assert list(search_tracks(fake_sp, ["Artist - Missing"])) == [_RESULT]
+    assert fake_sp.call_count("search") == 2
+
+
+def test_use_cache_false_bypasses_cache():
+    fake_sp = FakeSpotify().set_default_search_result(_TRACK)
+
+    list(search_tracks(fake_sp, ["Artist - Title"], use_cache=False))
+    list(search_tracks(fake_sp, ["Artist - Title"], use_cache=False))
+
+    assert fake_sp.call_count("search") == 2
+
+
+def test_hit_miss_counters():
+    cache = get_search_cache()
+    cache.put("artist:a track:b", _RESULT)
+
+    assert cache.get("artist:a track:b") == (True, _RESULT)
+    assert cache.get("artist:a track:c") == (False, None)
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.close()
+
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    cache = SearchCache(tmp_path / "s.sqlite3", ttl=60, negative_ttl=60, max_bytes=250)
+    cache.EVICT_EVERY = 1
+    for i in range(5):
+        cache.put(f"artist:a track:{i}", _RESULT)
+        cache.get("artist:a track:0")  # keep the first entry hot
+
+    assert cache.get("artist:a track:0")[0] is True
+    assert cache.get("artist:a track:1")[0] is False
+    assert cache.get("artist:a track:4")[0] is True
+    cache.close()
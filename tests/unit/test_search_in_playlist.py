@@ -1,7 +1,10 @@
 
 from typer.testing import CliRunner
 
+from src.commands.playlist import search_tracks
 from src.main import app
+from src.track_index import TrackTokenIndex
+from tests.fake_spotify import FakeSpotify
 
 runner = CliRunner()
 
@@ -23,3 +26,44 @@ def test_search_command_in_playlist(mock_get_spotify, mocker):
     assert "spotify:track:track1_uri" in result.stdout
     # Global search was not called
     assert mock_get_spotify.call_count("search") == 0
+
+
+def test_search_in_playlist_batch_matches_per_line_results(mocker):
+    """The cdist batch path and the extractOne loop pick the same tracks, in input order."""
+    fake_sp = FakeSpotify()
+    fake_sp.add_playlist("pl", tracks=[
+        {"id": f"t{i}", "uri": f"spotify:track:t{i}", "name": name, "artists": [{"name": artist}], "album": {}}
+        for i, (artist, name) in enumerate([
+            ("Daft Punk", "Get Lucky"),
+            ("Daft Punk", "Get Lucky"),  # duplicate string → first track wins
+            ("Daft Punk", "Lose Yourself to Dance"),
+            ("Massive Attack", "Teardrop"),
+            ("Portishead", "Glory Box"),
+        ])
+    ])
+    lines = ["Daft Punk - Get Luck", "", "Portishead - Glory", "Nobody - Nothing At All", "massive attack - teardrop"]
+
+    mocker.patch("src.commands.playlist.os.cpu_count", return_value=1)
+    looped = [t and t.uri for t in search_tracks(fake_sp, lines, playlist_id="pl")]
+    mocker.patch("src.commands.playlist.os.cpu_count", return_value=8)
+    batched = [t and t.uri for t in search_tracks(fake_sp, lines, playlist_id="pl")]
+
+    assert batched == looped == [
+        "spotify:track:t0", None, "spotify:track:t4", None, "spotify:track:t3",
+    ]
+
+
+def test_search_in_playlist_token_index_built_once_per_snapshot(mocker):
+    fake_sp = FakeSpotify()
+    fake_sp.add_playlist("pl", tracks=[
+        {"id": f"t{i}", "uri": f"spotify:track:t{i}", "name": f"Song {word}", "artists": [{"name": f"Band {word}"}], "album": {}}
+        for i, word in enumerate(["alpha", "bravo", "charlie", "delta", "echo"])
+    ])
+    mocker.patch("src.commands.playlist.TOKEN_INDEX_MIN_TRACKS", 1)
+    build = mocker.spy(TrackTokenIndex, "__init__")
+
+    first = list(search_tracks(fake_sp, ["Band Charlie - Song Charly"], playlist_id="pl"))
+    second = list(search_tracks(fake_sp, ["Band Ech - Song Echo"], playlist_id="pl"))
+
+    assert [t and t.uri for t in first + second] == ["spotify:track:t2", "spotify:track:t4"]
+    assert build.call_count == 1
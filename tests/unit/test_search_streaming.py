@@ -0,0 +1,104 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+from typer.testing import CliRunner
+
+from src.commands.playlist import search_tracks
+from src.main import app
+
+runner = CliRunner()
+
+
+def _track(title: str) -> dict:
+    return {"uri": f"spotify:track:{title}", "id": title, "name": title, "artists": [{"name": "A"}]}
+
+
+def _echo_search(q, type, limit):
+    title = q.split("track:")[1]
+    if title.startswith("slow"):
+        time.sleep(0.2)
+    return {"tracks": {"items": [_track(title)]}}
+
+
+def test_global_search_reads_input_lazily(monkeypatch):
+    monkeypatch.setenv("SAK_MAX_CONCURRENCY", "4")
+    window = 8  # Two lines per worker
+    sp = MagicMock()
+    sp.search.side_effect = _echo_search
+    consumed = []
+
+    def lines():
+        for i in range(10 * window):
+            consumed.append(i)
+            yield f"A - t{i}"
+
+    results = search_tracks(sp, lines())
+    first = next(results)
+
+    assert first.uri == "spotify:track:t0"
+    # Only a bounded window of lines has been pulled from the input
+    assert len(consumed) <= window + 1
+    assert [t.id for t in results] == [f"t{i}" for i in range(1, 10 * window)]
+
+
+def test_search_pool_follows_max_concurrency(monkeypatch):
+    monkeypatch.setenv("SAK_MAX_CONCURRENCY", "12")
+    lock = threading.Lock()
+    running, peak = [0], [0]
+
+    def search(q, type, limit):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        return _echo_search(q, type, limit)
+
+    sp = MagicMock()
+    sp.search.side_effect = search
+    list(search_tracks(sp, [f"A - t{i}" for i in range(24)], use_cache=False))
+
+    assert peak[0] == 12
+
+
+def test_global_search_unordered_yields_fast_results_first():
+    sp = MagicMock()
+    sp.search.side_effect = _echo_search
+
+    results = [t.id for t in search_tracks(sp, ["A - slow", "A - fast1", "A - fast2"], unordered=True)]
+
+    assert sorted(results) == ["fast1", "fast2", "slow"]
+    assert results[-1] == "slow"
+
+
+def test_search_command_unordered(mock_get_spotify, mocker):
+    mocker.patch("src.main.is_interactive", return_value=False)
+    mock_get_spotify.set_default_search_result(_track("x"))
+
+    result = runner.invoke(app, ["playlist", "search", "--unordered"], input="A - x\nB - x\n")
+
+    assert result.exit_code == 0
+    assert result.stdout.count("spotify:track:x") == 2
+
+
+def test_global_search_folds_duplicate_lines_into_one_search():
+    sp = MagicMock()
+    sp.search.side_effect = _echo_search
+    lines = ["A - x", "a  -  X ", "", "A - y", "A - x", "bad line", "A - x"]
+
+    results = list(search_tracks(sp, lines, use_cache=False))
+
+    assert [t and t.id for t in results] == ["x", "x", None, "y", "x", None, "x"]
+    assert sp.search.call_count == 2
+
+
+def test_global_search_unordered_fans_out_duplicates():
+    sp = MagicMock()
+    sp.search.side_effect = _echo_search
+
+    results = list(search_tracks(sp, ["A - slow", "A - x", "A - slow"], use_cache=False, unordered=True))
+
+    assert sorted(t.id for t in results) == ["slow", "slow", "x"]
+    assert sp.search.call_count == 2
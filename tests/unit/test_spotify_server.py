@@ -0,0 +1,152 @@
+import time
+
+import pytest
+import requests
+from spotipy.exceptions import SpotifyException
+from typer.testing import CliRunner
+
+from src.commands.playlist import (
+    get_playlist_track_uris,
+    move_liked_tracks,
+    move_tracks,
+    search_tracks,
+)
+from src.main import app
+from src.rate_limit import RateGovernor
+from tests.fake_spotify import _make_track
+from tests.spotify_server import Faults, SpotifyServer
+
+SOURCE = "0000000000000000000001"
+DEST = "0000000000000000000002"
+
+
+def _uris(n: int, start: int = 0) -> list:
+    return [f"spotify:track:{i:022d}" for i in range(start, start + n)]
+
+
+def _governor() -> RateGovernor:
+    return RateGovernor(rate=1000, burst=1000, max_concurrency=16, max_retries=5, jitter=0)
+
+
+@pytest.fixture
+def server():
+    with SpotifyServer() as server:
+        yield server
+
+
+def test_reads_follow_pages_through_http(server):
+    server.add_playlist(SOURCE, tracks=_uris(250))
+    server.faults.max_page_size = 40
+
+    uris = get_playlist_track_uris(server.client(_governor()), SOURCE, use_cache=False)
+
+    assert uris == set(_uris(250))
+    assert server.requests["get_playlist_items"] == 7  # ceil(250 / 40)
+
+
+def test_strict_move_round_trips(server):
+    server.add_playlist(SOURCE, tracks=_uris(300))
+    server.add_playlist(DEST)
+    wanted = _uris(150, start=100) + ["spotify:track:" + "9" * 22]
+
+    move_tracks(server.client(_governor()), wanted, SOURCE, DEST, strict=True)
+
+    assert server.playlist_uris(DEST) == _uris(150, start=100)
+    assert server.playlist_uris(SOURCE) == _uris(100) + _uris(50, start=250)
+
+
+def test_move_liked_songs(server):
+    server.add_saved_tracks(_uris(120))
+    server.add_playlist(DEST)
+
+    assert move_liked_tracks(server.client(_governor()), DEST) == 120
+    assert server.playlist_uris(DEST) == _uris(120)
+    assert server.saved_uris() == []
+
+
+def test_search_matches_catalog(server):
+    server.add_catalog([_make_track("spotify:track:a", name="Get Lucky",
+                                    artists=[{"name": "Daft Punk"}])])
+
+    found = list(search_tracks(server.client(_governor()), ["Daft Punk - Get Lucky", "X - Y"],
+                               use_cache=False))
+
+    assert [t and t.uri for t in found] == ["spotify:track:a", None]
+
+
+def test_injected_faults_are_retried(server):
+    server.add_playlist(SOURCE, tracks=_uris(500))
+    server.faults.max_page_size = 20
+    server.faults.throttle_rate = 0.2
+    server.faults.error_rate = 0.1
+
+    uris = get_playlist_track_uris(server.client(_governor()), SOURCE, use_cache=False)
+
+    assert uris == set(_uris(500))
+    assert server.faults_injected["429"] > 0
+    assert server.faults_injected["503"] > 0
+
+
+def test_round_trips_add_no_latency_of_their_own():
+    # Injected latency is only meaningful if the stand-in itself answers in a few ms
+    server = SpotifyServer(Faults(latency=0)).add_playlist(SOURCE, tracks=_uris(10))
+    with server, requests.Session() as session:
+        url = f"{server.url}playlists/{SOURCE}/items"
+        session.get(url)
+        start = time.perf_counter()
+        for _ in range(20):
+            session.get(url)
+        per_request = (time.perf_counter() - start) / 20
+
+    assert per_request < 0.02
+
+
+def test_concurrent_reads_survive_throttling(server):
+    # Every throttled page must come back intact, not as a None swallowed by spotipy
+    server.add_playlist(SOURCE, tracks=_uris(600))
+    server.faults.max_page_size = 10
+    server.faults.throttle_rate = 0.3
+
+    uris = get_playlist_track_uris(server.client(_governor()), SOURCE, use_cache=False)
+
+    assert uris == set(_uris(600))
+    assert server.faults_injected["429"] > 0
+    with pytest.raises(TypeError):
+        Faults(retry_after=0.05)
+
+
+def test_throttling_reaches_the_governor(server, capfd):
+    server.add_playlist(SOURCE, tracks=_uris(300))
+    server.faults.max_page_size = 20
+    server.faults.throttle_rate = 0.3
+    governor = _governor()
+
+    uris = get_playlist_track_uris(server.client(governor), SOURCE, use_cache=False)
+
+    assert uris == set(_uris(300))
+    # Every 429 is seen and retried by the governor rather than replayed by urllib3
+    assert governor.throttled == server.faults_injected["429"] > 0
+    assert governor.limit < governor.max_concurrency
+    assert "429" not in capfd.readouterr().err
+
+
+def test_out_of_bounds_position_is_rejected(server):
+    server.add_playlist(DEST)
+    sp = server.client(_governor())
+
+    with pytest.raises(SpotifyException) as e:
+        sp.playlist_add_items(DEST, _uris(1), position=5)
+
+    assert e.value.http_status == 400
+
+
+def test_cli_points_at_server(monkeypatch):
+    with SpotifyServer(Faults(latency=0.001)) as server:
+        server.add_playlist(SOURCE, tracks=_uris(3))
+        monkeypatch.setenv("SAK_API_URL", server.url)
+        monkeypatch.delenv("SPOTIPY_CLIENT_ID", raising=False)
+
+        result = CliRunner().invoke(app, ["playlist", "list", "--id", SOURCE, "-o", "uri"])
+
+    assert result.exit_code == 0
+    assert result.stdout.split() == _uris(3)
@@ -0,0 +1,86 @@
+import json
+
+import pytest
+import requests
+import spotipy
+from typer.testing import CliRunner
+
+from src.main import app
+from src.rate_limit import RateGovernor, govern
+from src.stats import RunStats, endpoint_name, get_run_stats, instrument
+from tests.fake_spotify import _make_track
+
+PLAYLIST_ID = "37i9dQZF1DXcBWIGoYBM5M"
+
+
+def _response(status: int, body: dict, headers=None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(body).encode()
+    response.headers.update(headers or {})
+    response.url = "https://api.spotify.com/v1/"
+    return response
+
+
+@pytest.fixture
+def client():
+    """A real spotipy client whose HTTP session replays queued responses."""
+    sp = spotipy.Spotify(auth="token", retries=0)
+    queue = []
+    sp._session.request = lambda method, url, **kwargs: queue.pop(0)
+    governor = RateGovernor(rate=1000, burst=1000, max_concurrency=4, max_retries=3, jitter=0)
+    stats = RunStats()
+    return instrument(govern(sp, governor), stats), stats, queue
+
+
+@pytest.mark.parametrize(
+    "method, url, expected",
+    [
+        ("GET", f"https://api.spotify.com/v1/playlists/{PLAYLIST_ID}/tracks?offset=100",
+         "GET playlists/{id}/tracks"),
+        ("POST", "https://api.spotify.com/v1/users/some.user/playlists", "POST users/{id}/playlists"),
+        ("GET", "https://api.spotify.com/v1/me/tracks/contains?ids=a", "GET me/tracks/contains"),
+    ],
+)
+def test_endpoint_name_groups_ids(method, url, expected):
+    assert endpoint_name(method, url) == expected
+
+
+def test_records_calls_requests_pages_and_bytes(client):
+    sp, stats, queue = client
+    queue += [_response(200, {"items": [], "next": None}), _response(200, {"id": "x"})]
+
+    sp.playlist_items(PLAYLIST_ID)
+    sp.playlist(PLAYLIST_ID)
+
+    endpoints = stats.snapshot()["endpoints"]
+    tracks = endpoints["GET playlists/{id}/items"]
+    assert (tracks["calls"], tracks["requests"], tracks["pages"]) == (1, 1, 1)
+    assert tracks["bytes"] == len(b'{"items": [], "next": null}')
+    assert sum(tracks["histogram"]) == 1
+    assert endpoints["GET playlists/{id}"]["pages"] == 0
+
+
+def test_counts_429_retries(client):
+    sp, stats, queue = client
+    throttled = _response(429, {"error": {"status": 429}}, {"Retry-After": "0"})
+    queue += [throttled, _response(200, {"id": "x"})]
+
+    sp.playlist(PLAYLIST_ID)
+
+    playlist = stats.snapshot()["endpoints"]["GET playlists/{id}"]
+    assert (playlist["calls"], playlist["requests"]) == (1, 2)
+    assert (playlist["retries"], playlist["throttled"], playlist["errors"]) == (1, 1, 0)
+
+
+def test_stats_json_flag_writes_report(mock_get_spotify, tmp_path):
+    mock_get_spotify.add_playlist("src", tracks=[_make_track("spotify:track:a")])
+    report = tmp_path / "stats.json"
+    get_run_stats().count("stale.counter")
+
+    result = CliRunner().invoke(app, ["--stats-json", str(report), "playlist", "list", "--id", "src"])
+
+    assert result.exit_code == 0
+    data = json.loads(report.read_text())
+    assert data["counters"] == {"playlist_cache.misses": 1}
+    assert data["wall_seconds"] >= 0
@@ -0,0 +1,121 @@
+import json
+import subprocess
+import sys
+import threading
+import time
+
+from src.auth import LockedCacheFileHandler, TokenManager
+
+
+class FakeOAuth:
+    """Stands in for SpotifyOAuth: refreshing hands out numbered tokens."""
+
+    def __init__(self, handler, now, lifetime=3600, delay=0.0):
+        self.cache_handler = handler
+        self.now = now
+        self.lifetime = lifetime
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def refresh_access_token(self, refresh_token):
+        time.sleep(self.delay)
+        with self._lock:
+            self.calls += 1
+            n = self.calls
+        info = {
+            "access_token": f"token-{n}",
+            "refresh_token": refresh_token,
+            "expires_at": self.now() + self.lifetime,
+        }
+        self.cache_handler.save_token_to_cache(info)
+        return info
+
+
+def _seed(handler, access_token, expires_at):
+    handler.save_token_to_cache(
+        {"access_token": access_token, "refresh_token": "r", "expires_at": expires_at}
+    )
+
+
+def test_valid_token_is_served_from_memory(tmp_path, mocker):
+    handler = LockedCacheFileHandler(tmp_path / ".cache")
+    _seed(handler, "cached", time.time() + 3600)
+    manager = TokenManager(FakeOAuth(handler, time.time), refresh_ahead=300)
+    read = mocker.spy(handler, "get_cached_token")
+
+    tokens = {manager.get_access_token() for _ in range(10)}
+
+    assert tokens == {"cached"}
+    assert read.call_count == 1
+    assert manager.refreshes == 0
+
+
+def test_concurrent_refreshes_collapse_into_one(tmp_path):
+    handler = LockedCacheFileHandler(tmp_path / ".cache")
+    _seed(handler, "expired", time.time() - 10)
+    oauth = FakeOAuth(handler, time.time, delay=0.05)
+    manager = TokenManager(oauth, refresh_ahead=300)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(manager.get_access_token()))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == ["token-1"] * 8
+    assert oauth.calls == 1
+    assert json.loads((tmp_path / ".cache").read_text())["access_token"] == "token-1"
+
+
+def test_refreshes_in_background_ahead_of_expiry(tmp_path):
+    clock = [1000.0]
+    handler = LockedCacheFileHandler(tmp_path / ".cache")
+    _seed(handler, "old", 1000.0 + 200)  # Inside the 300 s window but still usable
+    oauth = FakeOAuth(handler, lambda: clock[0])
+    manager = TokenManager(oauth, refresh_ahead=300, clock=lambda: clock[0])
+
+    assert manager.get_access_token() == "old"  # Loaded from disk, valid long enough to use
+    assert manager.get_access_token() == "old"  # Starts a refresh without waiting for it
+    manager._background.join(timeout=5)
+
+    assert manager.get_access_token() == "token-1"
+    assert oauth.calls == 1
+
+
+def test_reuses_token_refreshed_by_another_process(tmp_path):
+    handler = LockedCacheFileHandler(tmp_path / ".cache")
+    _seed(handler, "expired", time.time() - 10)
+    oauth = FakeOAuth(handler, time.time)
+    manager = TokenManager(oauth, refresh_ahead=300)
+    assert manager.get_access_token() == "token-1"
+
+    # Another process refreshes and writes the shared cache file
+    _seed(LockedCacheFileHandler(tmp_path / ".cache"), "from-elsewhere", time.time() + 3600)
+    manager._token_info["expires_at"] = time.time()
+
+    assert manager.get_access_token() == "from-elsewhere"
+    assert oauth.calls == 1
+
+
+def test_cache_lock_excludes_other_processes(tmp_path):
+    handler = LockedCacheFileHandler(tmp_path / ".cache")
+    probe = (
+        "import fcntl, os, sys\n"
+        "fd = os.open(sys.argv[1], os.O_RDWR)\n"
+        "try:\n"
+        "    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)\n"
+        "except BlockingIOError:\n"
+        "    sys.exit(3)\n"
+    )
+
+    with handler.lock(), handler.lock():  # Re-entrant within a thread
+        held = subprocess.run([sys.executable, "-c", probe, str(handler.lock_path)])
+    free = subprocess.run([sys.executable, "-c", probe, str(handler.lock_path)])
+
+    assert held.returncode == 3
+    assert free.returncode == 0
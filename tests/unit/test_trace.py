@@ -0,0 +1,71 @@
+import json
+import threading
+
+from typer.testing import CliRunner
+
+from src.main import app
+from src.trace import Tracer, span, start_tracing, stop_tracing
+from tests.fake_spotify import _make_track
+
+runner = CliRunner()
+
+
+def test_spans_are_complete_events_per_thread(tmp_path):
+    tracer = Tracer()
+
+    def work(n):
+        with tracer.span("add batch", "write", batch=n) as args:
+            args["retried"] = False
+
+    threads = [threading.Thread(target=work, args=(n,), name=f"writer-{n}") for n in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    tracer.write(tmp_path / "trace.json")
+
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    spans = [e for e in events if e["ph"] == "X"]
+    names = {e["args"]["name"] for e in events if e["ph"] == "M"}
+    assert sorted(e["args"]["batch"] for e in spans) == [0, 1, 2]
+    assert all(e["dur"] >= 0 and e["args"]["retried"] is False for e in spans)
+    assert len({e["tid"] for e in spans}) == 3
+    assert names == {"writer-0", "writer-1", "writer-2"}
+
+
+def test_span_is_a_no_op_without_tracer():
+    assert stop_tracing() is None
+    with span("page", "pagination", offset=0) as args:
+        assert args == {"offset": 0}
+
+
+def test_trace_option_writes_pages_and_batches(mock_get_spotify, tmp_path):
+    tracks = [_make_track(f"spotify:track:{i}") for i in range(250)]
+    mock_get_spotify.add_playlist("src", tracks=tracks)
+    mock_get_spotify.add_playlist("dst")
+    uris = "\n".join(t["uri"] for t in tracks)
+    path = tmp_path / "trace.json"
+
+    result = runner.invoke(
+        app, ["--trace", str(path), "playlist", "add", "--id", "dst"], input=uris
+    )
+
+    assert result.exit_code == 0
+    spans = [e for e in json.loads(path.read_text())["traceEvents"] if e["ph"] == "X"]
+    batches = sorted(e["args"]["batch"] for e in spans if e["name"] == "add batch")
+    assert batches == [0, 1, 2]
+    assert stop_tracing() is None  # Tracing ends with the command
+
+
+def test_pagination_pages_are_traced(fake_sp):
+    from src.commands.playlist import get_playlist_track_uris
+
+    fake_sp.add_playlist("src", tracks=[_make_track(f"spotify:track:{i}") for i in range(250)])
+    tracer = start_tracing()
+    try:
+        get_playlist_track_uris(fake_sp, "src", use_cache=False)
+    finally:
+        stop_tracing()
+
+    pages = [e for e in tracer._events if e["name"] == "page"]
+    assert sorted(e["args"]["offset"] for e in pages) == [0, 100, 200]
@@ -0,0 +1,62 @@
+import json
+
+from src.track import Track, saved_track
+from src.utils import format_track
+from tests.fake_spotify import _make_track
+
+
+def test_from_api_keeps_only_used_fields():
+    artists = [{"name": "Daft Punk"}, {"name": "Pharrell"}]
+    api = _make_track("spotify:track:abc", "Get Lucky", artists)
+    api["available_markets"] = ["DE", "US"]
+
+    track = Track.from_api(api)
+
+    assert track == Track("spotify:track:abc", "Get Lucky", ("Daft Punk", "Pharrell"), "2020-01-01")
+    assert track.id == "abc"
+    assert track.line == "Daft Punk, Pharrell - Get Lucky"
+    assert not hasattr(track, "__dict__")
+
+
+def test_local_files_have_no_id():
+    track = Track.from_api({"uri": "spotify:local:Band:Album:Song:180", "name": "Song"})
+    assert track.id is None
+    assert track.artists == ()
+
+
+def test_rows_round_trip():
+    track = Track.from_api(_make_track("spotify:track:abc", "Song"))
+    row = json.loads(json.dumps(track.to_row()))
+
+    assert Track.from_row(row) == track
+
+
+def test_artist_names_are_interned():
+    rows = json.loads(json.dumps([["spotify:track:a", "A", ["Same Band"], None]] * 2))
+    first, second = (Track.from_row(r) for r in rows)
+    assert first.artists[0] is second.artists[0]
+
+
+def test_saved_track_from_item_or_row():
+    item = {"added_at": "2024-01-01T00:00:00Z", "track": _make_track("spotify:track:abc")}
+    track, added_at = saved_track(item)
+
+    assert saved_track([track.to_row(), added_at]) == (track, "2024-01-01T00:00:00Z")
+    assert saved_track({"added_at": "2024-01-01T00:00:00Z", "track": None}) == (
+        None, "2024-01-01T00:00:00Z"
+    )
+
+
+def test_format_track_accepts_tracks_and_api_dicts():
+    api = _make_track("spotify:track:abc", "Song", [{"name": "Band"}])
+    track = Track.from_api(api)
+
+    for output in ("uri", "id", "text", "json"):
+        assert format_track(track, output) == format_track(api, output)
+    assert json.loads(format_track(track, "json")) == {
+        "uri": "spotify:track:abc",
+        "id": "abc",
+        "name": "Song",
+        "artists": "Band",
+        "release_date": "2020-01-01",
+    }
@@ -0,0 +1,24 @@
+from src.track_index import TrackTokenIndex
+
+
+def _choices(n: int = 200) -> list[str]:
+    return [f"Artist{i} - Song{i}" for i in range(n)] + ["Daft Punk - Get Lucky"]
+
+
+def test_candidates_match_token_prefixes():
+    index = TrackTokenIndex(_choices())
+    # "luck" shares its prefix with "lucky"; case is ignored
+    assert index.candidates("daft punk - get luck") == [200]
+
+
+def test_candidates_none_without_shared_tokens():
+    index = TrackTokenIndex(_choices())
+    assert index.candidates("Nothing - Related") is None
+
+
+def test_common_tokens_do_not_prune():
+    choices = [f"The Band - Song {i}" for i in range(2000)] + ["The Cure - Lovesong"]
+    index = TrackTokenIndex(choices)
+    # "the", "band" and "song" appear everywhere, so only "cure" narrows the search
+    assert index.candidates("The Cure - Love Song") == [2000]
+    assert index.candidates("The Band - Song") is None
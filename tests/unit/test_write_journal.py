@@ -0,0 +1,88 @@
+import pytest
+
+from src.commands.playlist import add_tracks, move_tracks
+from src.journal import WriteJournal, write_job_id
+from tests.fake_spotify import FakeSpotify
+
+
+def _fail_adds_from(fake_sp: FakeSpotify, first_failing_uri: str) -> None:
+    add = fake_sp.playlist_add_items
+
+    def flaky_add(playlist_id, uris, **kwargs):
+        if first_failing_uri in uris:
+            raise RuntimeError("network dropped")
+        add(playlist_id, uris, **kwargs)
+
+    fake_sp.playlist_add_items = flaky_add
+
+
+def test_journal_records_and_finishes(tmp_path):
+    journal = WriteJournal(tmp_path / "journal.sqlite3", max_age=3600)
+    job_id = write_job_id("add", "pl", tracks=["a", "b"])
+
+    assert journal.load(job_id) is None
+    journal.begin(job_id, ["a", "b"])
+    journal.record(job_id, "add", 0)
+    journal.record(job_id, "add", 0)
+    assert journal.load(job_id) == (["a", "b"], {"add": {0}})
+
+    journal.finish(job_id)
+    assert journal.load(job_id) is None
+
+
+def test_journal_prunes_stale_jobs(tmp_path):
+    path = tmp_path / "journal.sqlite3"
+    journal = WriteJournal(path, max_age=3600)
+    journal.begin("old", ["a"])
+    journal.close()
+
+    assert WriteJournal(path, max_age=-1).load("old") is None
+
+
+def test_add_resume_skips_applied_batches():
+    fake_sp = FakeSpotify().add_playlist("dst")
+    tracks = [f"spotify:track:{i}" for i in range(450)]
+    add = fake_sp.playlist_add_items
+    _fail_adds_from(fake_sp, "spotify:track:250")
+    with pytest.raises(RuntimeError):
+        add_tracks(fake_sp, tracks, "dst")
+    fake_sp.playlist_add_items = add
+    fake_sp.calls.clear()
+
+    add_tracks(fake_sp, tracks, "dst", resume=True)
+
+    assert fake_sp.playlist_uris("dst") == tracks
+    assert fake_sp.call_count("playlist_add_items") == 3
+
+
+def test_add_without_resume_starts_over():
+    fake_sp = FakeSpotify().add_playlist("dst")
+    tracks = [f"spotify:track:{i}" for i in range(150)]
+    add = fake_sp.playlist_add_items
+    _fail_adds_from(fake_sp, "spotify:track:100")
+    with pytest.raises(RuntimeError):
+        add_tracks(fake_sp, tracks, "dst")
+    fake_sp.playlist_add_items = add
+
+    add_tracks(fake_sp, tracks, "dst")
+
+    assert fake_sp.playlist_uris("dst") == tracks[:100] + tracks
+
+
+def test_strict_move_resume_skips_refetch_and_finishes_removals():
+    fake_sp = FakeSpotify()
+    tracks = [f"spotify:track:{i}" for i in range(300)]
+    fake_sp.add_playlist("src", tracks=tracks).add_playlist("dst")
+    add = fake_sp.playlist_add_items
+    _fail_adds_from(fake_sp, "spotify:track:200")
+    with pytest.raises(RuntimeError):
+        move_tracks(fake_sp, tracks + ["spotify:track:gone"], "src", "dst", strict=True)
+    fake_sp.playlist_add_items = add
+    fake_sp.calls.clear()
+
+    move_tracks(fake_sp, tracks + ["spotify:track:gone"], "src", "dst", strict=True, resume=True)
+
+    assert fake_sp.playlist_uris("dst") == tracks
+    assert fake_sp.playlist_uris("src") == []
+    assert fake_sp.call_count("playlist_tracks") == 0
+    assert fake_sp.call_count("playlist_add_items") == 1